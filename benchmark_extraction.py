@@ -0,0 +1,114 @@
+"""
+Benchmark vectorized reference and brand extraction against the old iterrows loops on a synthetic frame
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dashboard.app_pandas import clean_brand_data
+from utils.data_processor import WatchDataProcessor
+
+TITLES = [
+    'Rolex Submariner Date 126610LN Black Dial', 'Omega Speedmaster Moonwatch 310.30.42.50.01.001',
+    'Patek Philippe Nautilus Ref. 5711/1A', 'Tudor Black Bay 79230N Full Set', 'Cartier Santos Large',
+    'Audemars Piguet Royal Oak Reference 15500ST', 'Pre-owned Daytona 116500LN 2019', 'Breitling Navitimer B01',
+    'Gold Pendant Necklace', 'TAG Heuer Carrera Chronograph'
+]
+
+DESCRIPTIONS = ['', 'Box and papers. Serviced 2022.', 'Excellent condition, reference 124060 on caseback.',
+                'Stainless steel bracelet, automatic movement.']
+
+
+def legacy_extract_references(df):
+    """The row-by-row loop extract_references used before vectorization"""
+    patterns = [
+        r'\b(\d{5,6}[A-Z]*)\b', r'\bRef[:\.\s]*(\w+)', r'\bReference[:\.\s]*(\w+)',
+        r'\b(116\d{3})\b', r'\b(126\d{3})\b', r'\b(\d{3}\.\d{2}\.\d{2})\b'
+    ]
+    for idx, row in df.iterrows():
+        if pd.isna(row['reference']) or row['reference'] == '':
+            text = f"{row['title']} {row['description']}".lower()
+            for pattern in patterns:
+                match = re.search(pattern, text)
+                if match:
+                    df.at[idx, 'reference'] = match.group(1).upper()
+                    break
+    return df
+
+
+def legacy_clean_brand_data(df):
+    """The row-by-row loop clean_brand_data used before vectorization"""
+    brands = [
+        'ROLEX', 'OMEGA', 'PATEK PHILIPPE', 'AUDEMARS PIGUET', 'CARTIER', 'BREITLING', 'TAG HEUER', 'TUDOR',
+        'SEIKO', 'TISSOT', 'HAMILTON', 'A. LANGE', 'LANGE', 'VACHERON CONSTANTIN', 'JAEGER-LECOULTRE',
+        'IWC', 'PANERAI', 'HUBLOT', 'ZENITH', 'LONGINES'
+    ]
+    for idx, row in df.iterrows():
+        if pd.isna(row.get('brand')) or row.get('brand') == '':
+            text = [str(row.get(field, '')).upper() for field in ('title', 'description', 'url')]
+            extracted_brand = None
+            for brand in brands:
+                if any(brand in value for value in text):
+                    extracted_brand = 'A. Lange & Söhne' if brand in ('A. LANGE', 'LANGE') else brand.title()
+                    break
+            df.at[idx, 'brand'] = extracted_brand or 'Other'
+    return df
+
+
+def synthetic_frame(rows: int, seed: int = 3) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'url': [f"https://example.com/products/item-{i}" for i in range(rows)],
+        'title': [rng.choice(TITLES) for _ in range(rows)],
+        'description': [rng.choice(DESCRIPTIONS) for _ in range(rows)],
+        'brand': [rng.choice([None, None, 'Rolex']) for _ in range(rows)],
+        'reference': [rng.choice([None, None, None, '126334']) for _ in range(rows)]
+    })
+
+
+def timed(function, df):
+    start = time.perf_counter()
+    result = function(df)
+    return time.perf_counter() - start, result
+
+
+def vectorized_references(df):
+    processor = WatchDataProcessor()
+    processor.df = df
+    processor.extract_references()
+    return processor.df
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Reference/brand extraction benchmark')
+    arg_parser.add_argument('--rows', type=int, default=100_000, help='Rows in the synthetic frame')
+    args = arg_parser.parse_args()
+
+    frame = synthetic_frame(args.rows)
+    print(f"{args.rows:,} synthetic rows\n")
+    print(f"{'step':<20} {'loop s':>9} {'vector s':>9} {'speedup':>9} {'filled':>14}")
+    print("-" * 66)
+
+    for name, legacy, vectorized, column in (
+        ('extract_references', legacy_extract_references, vectorized_references, 'reference'),
+        ('clean_brand_data', legacy_clean_brand_data, clean_brand_data, 'brand')
+    ):
+        loop_time, loop_df = timed(legacy, frame.copy())
+        vector_time, vector_df = timed(vectorized, frame.copy())
+        filled = f"{loop_df[column].notna().sum():,}/{vector_df[column].notna().sum():,}"
+        print(f"{name:<20} {loop_time:>9.2f} {vector_time:>9.3f} {loop_time / vector_time:>8.0f}x {filled:>14}")
+
+    print("\nfilled = rows with a value after the loop / after the vectorized pass")
+
+
+if __name__ == "__main__":
+    main()
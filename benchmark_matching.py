@@ -0,0 +1,115 @@
+"""
+Benchmark blocked and reference-joined WatchMatcher.match_watches against the exhaustive matcher: time, pairs scored and recall
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.candidate_index import CandidateIndex
+from utils.data_processor import WatchMatcher
+
+CATALOG = {
+    'Rolex': [('Submariner', '126610LN'), ('Submariner', '124060'), ('Daytona', '126500LN'),
+              ('Daytona', '116500LN'), ('GMT-Master II', '126710BLRO'), ('Datejust', '126334'),
+              ('Explorer', '224270'), ('Sea-Dweller', '126600'), ('Yacht-Master', '226659')],
+    'Omega': [('Speedmaster', '310.30.42.50.01.001'), ('Seamaster', '210.30.42.20.03.001'),
+              ('Constellation', '131.10.39.20.02.001'), ('Aqua Terra', '220.10.41.21.03.001')],
+    'Patek Philippe': [('Nautilus', '5711/1A'), ('Aquanaut', '5167A'), ('Calatrava', '5227G')],
+    'Audemars Piguet': [('Royal Oak', '15500ST'), ('Royal Oak Offshore', '26470ST')],
+    'Tudor': [('Black Bay', '79230N'), ('Pelagos', '25600TN'), ('Black Bay 58', '79030N')],
+    'Cartier': [('Santos', 'WSSA0018'), ('Tank', 'WSTA0041')],
+    'Breitling': [('Navitimer', 'AB0138211B1A1'), ('Superocean', 'A17376211B1A1')]
+}
+
+EXTRAS = ['Box and Papers', 'Full Set', '2021', '2019', 'Unworn', 'Excellent Condition', 'Black Dial', 'Blue Dial']
+
+
+def make_watch(brand, model, reference, rng, serial):
+    return {
+        'brand': brand,
+        'model': model,
+        'reference': f"{reference}-{serial}",
+        'title': f"{brand} {model} {reference}-{serial} {rng.choice(EXTRAS)}",
+        'price': rng.randint(3000, 90000)
+    }
+
+
+def perturb(watch, rng):
+    """The same watch as a competitor would list it"""
+    copy = dict(watch)
+    copy['brand'] = rng.choice([watch['brand'], watch['brand'].upper(), watch['brand'].lower(), ''])
+    if rng.random() < 0.3:
+        copy['model'] = ''
+    if rng.random() < 0.3:
+        copy['reference'] = watch['reference'].lower().replace('-', ' ')
+    copy['title'] = f"{copy['brand']} {watch['model']} Ref. {watch['reference']} {rng.choice(EXTRAS)}".strip()
+    return copy
+
+
+def make_datasets(sources: int, targets: int, overlap: float, seed: int = 7):
+    rng = random.Random(seed)
+    models = [(brand, model, reference) for brand, items in CATALOG.items() for model, reference in items]
+
+    source_watches = [make_watch(*rng.choice(models), rng, serial) for serial in range(sources)]
+    target_watches = [perturb(watch, rng) for watch in source_watches if rng.random() < overlap]
+    while len(target_watches) < targets:
+        target_watches.append(make_watch(*rng.choice(models), rng, sources + len(target_watches)))
+    rng.shuffle(target_watches)
+    return source_watches, target_watches[:targets]
+
+
+def run(matcher, sources, targets, blocking, by_reference=False):
+    start = time.perf_counter()
+    result = matcher.match_watches(sources, targets, blocking=blocking, by_reference=by_reference)
+    elapsed = time.perf_counter() - start
+    pairs = {(id(match['source_watch']), id(match['matched_watch'])) for match in result['matches']}
+    return elapsed, pairs, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Watch matching benchmark')
+    arg_parser.add_argument('--sources', type=int, default=200, help='Store products to match')
+    arg_parser.add_argument('--targets', type=int, default=800, help='Competitor listings to match against')
+    arg_parser.add_argument('--overlap', type=float, default=0.6,
+                            help='Share of store products also listed by the competitor')
+    arg_parser.add_argument('--exhaustive-max-pairs', type=int, default=None,
+                            help='Override Config.MATCHING exhaustive_max_pairs (0 always blocks)')
+    args = arg_parser.parse_args()
+
+    sources, targets = make_datasets(args.sources, args.targets, args.overlap)
+    matcher = WatchMatcher()
+    if args.exhaustive_max_pairs is not None:
+        matcher.exhaustive_max_pairs = args.exhaustive_max_pairs
+
+    index = CandidateIndex(targets)
+    scored = sum(len(index.candidates(watch)) for watch in sources)
+    print(f"{len(sources)} sources x {len(targets)} targets; index: {index.stats()}")
+    print(f"Pairs scored: exhaustive {len(sources) * len(targets):,}, blocked {scored:,} "
+          f"({scored / len(sources):.0f} candidates per source)")
+    if len(sources) * len(targets) <= matcher.exhaustive_max_pairs:
+        print(f"Blocked run falls back to exhaustive: at most {matcher.exhaustive_max_pairs:,} pairs")
+    print()
+
+    exhaustive_time, exhaustive_pairs, _ = run(matcher, sources, targets, blocking=False)
+    blocked_time, blocked_pairs, _ = run(matcher, sources, targets, blocking=True)
+    joined_time, joined_pairs, joined = run(matcher, sources, targets, blocking=True, by_reference=True)
+    by_reference = sum(match['match_type'] == 'reference' for match in joined['matches'])
+
+    recall = len(exhaustive_pairs & blocked_pairs) / len(exhaustive_pairs) if exhaustive_pairs else 1.0
+    print(f"{'matcher':<12} {'seconds':>9} {'matches':>9}")
+    print("-" * 32)
+    print(f"{'exhaustive':<12} {exhaustive_time:>9.2f} {len(exhaustive_pairs):>9}")
+    print(f"{'blocked':<12} {blocked_time:>9.2f} {len(blocked_pairs):>9}  ({exhaustive_time / blocked_time:.1f}x)")
+    print(f"{'+reference':<12} {joined_time:>9.2f} {len(joined_pairs):>9}  ({exhaustive_time / joined_time:.1f}x, "
+          f"{by_reference} joined on catalog references)")
+    print(f"\nRecall of exhaustive matches: {recall:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark HTML parse time and memory per page for each parser and SoupStrainer profile
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.html_parser import DEFAULT_PARSER, parse_html
+
+FIXTURE_GLOB = os.path.join('data', 'html_fixtures', '*.html')
+
+
+def synthetic_page(products: int = 48) -> str:
+    """A category-sized page with theme chrome, product cards and JSON-LD"""
+    nav = ''.join(f'<li><a href="/pages/{i}">Menu {i}</a></li>' for i in range(120))
+    cards = ''.join(
+        f'<div class="product-item"><a class="grid-product__link" href="/products/rolex-{i}">'
+        f'<img src="/img/{i}.jpg"><h3>Rolex Submariner {i}</h3></a>'
+        f'<span class="price"><span class="money">£{9000 + i}.00</span></span></div>'
+        for i in range(products)
+    )
+    scripts = ''.join(f'<script>window.theme{i} = {{"a": [{",".join(str(n) for n in range(50))}]}};</script>' for i in range(20))
+    footer = ''.join(f'<p>Footer block {i} with some boilerplate copy about delivery and returns.</p>' for i in range(60))
+    return (
+        '<html><head><title>Watches</title>'
+        '<script type="application/ld+json">{"@type": "Product", "name": "Rolex Submariner", '
+        '"offers": {"price": "9000", "priceCurrency": "GBP"}}</script>'
+        f'{scripts}</head><body><header><nav><ul>{nav}</ul></nav></header>'
+        f'<main><h1 class="product__title">Rolex Submariner</h1><div class="collection">{cards}</div>'
+        '<div class="pagination"><a href="?page=2">2</a></div></main>'
+        f'<footer>{footer}</footer></body></html>'
+    )
+
+
+def load_pages(paths):
+    pages = {}
+    for pattern in paths:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def measure(markup, parser: str, profile: str, repeat: int):
+    """Return (ms per parse, peak KiB while building the tree)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_html(markup, profile, parser)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    soup = parse_html(markup, profile, parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del soup
+
+    return elapsed_ms, peak / 1024
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='HTML parsing benchmark')
+    arg_parser.add_argument('paths', nargs='*', default=[FIXTURE_GLOB],
+                            help=f'HTML files or globs (default: {FIXTURE_GLOB})')
+    arg_parser.add_argument('--repeat', type=int, default=20, help='Parses per measurement')
+    args = arg_parser.parse_args()
+
+    pages = load_pages(args.paths)
+    if not pages:
+        print("No HTML fixtures found, using a synthetic category page")
+        pages = {'synthetic.html': synthetic_page().encode()}
+
+    parsers = ['html.parser'] + (['lxml'] if DEFAULT_PARSER == 'lxml' else [])
+    profiles = [None, 'links', 'product']
+
+    print(f"{'page':<30} {'parser':<12} {'profile':<8} {'ms/page':>9} {'peak KiB':>9}")
+    print("-" * 72)
+
+    for name, markup in pages.items():
+        baseline = None
+        for parser in parsers:
+            for profile in profiles:
+                elapsed_ms, peak_kib = measure(markup, parser, profile, args.repeat)
+                if baseline is None:
+                    baseline = elapsed_ms
+                print(f"{name[:30]:<30} {parser:<12} {profile or 'full':<8} "
+                      f"{elapsed_ms:>9.2f} {peak_kib:>9.0f}  ({baseline / elapsed_ms:.1f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,10 +26,110 @@ class Config:
     USE_PROXY = os.getenv('USE_PROXY', 'false').lower() == 'true'
     PROXY_URL = os.getenv('PROXY_URL', '')
     
+    # Read Shopify/WooCommerce product APIs directly when a site exposes them
+    PLATFORM_APIS_ENABLED = os.getenv('PLATFORM_APIS_ENABLED', 'true').lower() == 'true'
+    
+    # Concurrent Fetch Settings
+    FETCH_SETTINGS = {
+        'max_in_flight_per_host': int(os.getenv('MAX_IN_FLIGHT_PER_HOST', '4')),
+        'batch_size': 20   # Product pages prefetched per batch
+    }
+    
+    # AIMD per-host concurrency; bounds come from each TARGET_SITES 'concurrency' entry
+    ADAPTIVE_CONCURRENCY = {
+        'enabled': os.getenv('ADAPTIVE_CONCURRENCY', 'true').lower() == 'true',
+        'initial': 2,
+        'target_p95_seconds': float(os.getenv('TARGET_P95_SECONDS', '3.0')),
+        'window': 20,            # Recent responses used for the p95
+        'decrease_factor': 0.5   # Multiplicative backoff on 429/503/timeouts
+    }
+    
+    # Retries for idempotent GETs (jittered exponential backoff, Retry-After honoured)
+    RETRY_POLICY = {
+        'max_attempts': int(os.getenv('RETRY_MAX_ATTEMPTS', '3')),
+        'base_delay': 1.0,
+        'max_delay': 30.0,
+        'max_retry_after': 60.0,   # Give up rather than wait longer than this for a Retry-After
+        'retry_statuses': [429, 500, 502, 503, 504]
+    }
+    
+    # Consecutive failed fetches after which a host is skipped for the rest of the run
+    CIRCUIT_BREAKER = {
+        'failure_threshold': int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '5'))
+    }
+    
+    # Shared headless browser pool for Selenium sites
+    SELENIUM_POOL = {
+        'size': int(os.getenv('SELENIUM_POOL_SIZE', '2')),
+        'max_pages_per_driver': int(os.getenv('SELENIUM_MAX_PAGES_PER_DRIVER', '50')),
+        'headless': os.getenv('SELENIUM_HEADLESS', 'true').lower() == 'true',
+        'page_load_timeout': 30,
+        'ready_timeout': 10,
+        # Seconds to wait for a driver when every pooled one is checked out
+        'checkout_timeout': int(os.getenv('SELENIUM_CHECKOUT_TIMEOUT', '60'))
+    }
+    
+    # Resources Selenium sessions never load (see utils.driver_pool.RESOURCE_TYPE_PATTERNS)
+    SELENIUM_BLOCKING = {
+        'enabled': os.getenv('SELENIUM_BLOCKING_ENABLED', 'true').lower() == 'true',
+        'resource_types': ['image', 'font', 'media'],
+        'domains': [
+            'google-analytics.com',
+            'googletagmanager.com',
+            'doubleclick.net',
+            'connect.facebook.net',
+            'facebook.com/tr',
+            'platform.twitter.com',
+            'assets.pinterest.com',
+            'hotjar.com',
+            'clarity.ms',
+            'klaviyo.com',
+            'addthis.com',
+            'sharethis.com',
+            'static.zdassets.com',
+            'tiktok.com'
+        ]
+    }
+    
+    # Rate limit for hosts without a 'rate_limit' entry in TARGET_SITES
+    DEFAULT_RATE_LIMIT = {
+        'requests_per_second': 1 / DELAY_BETWEEN_REQUESTS if DELAY_BETWEEN_REQUESTS > 0 else 1.0,
+        'burst': 1
+    }
+    
     # File Paths
     DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
     LOG_FILE = os.path.join(DATA_DIR, 'watch_scraping.log')
     
+    # Conditional-GET HTTP cache
+    HTTP_CACHE = {
+        'enabled': os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true',
+        'directory': os.path.join(DATA_DIR, 'http_cache'),
+        'max_bytes': int(os.getenv('HTTP_CACHE_MAX_MB', '200')) * 1024 * 1024
+    }
+    
+    # Persistent crawl frontier used by main.py --resume
+    CRAWL_FRONTIER = {
+        'path': os.path.join(DATA_DIR, 'crawl_frontier.db'),
+        'max_attempts': int(os.getenv('FRONTIER_MAX_ATTEMPTS', '3'))
+    }
+    
+    # Incremental crawl: only re-fetch listings that are new or changed on the category pages
+    INCREMENTAL_CRAWL = {
+        'enabled': os.getenv('INCREMENTAL_CRAWL', 'false').lower() == 'true',
+        'snapshot_path': os.path.join(DATA_DIR, 'listing_snapshots.db')
+    }
+    
+    # Consolidated Parquet snapshots, partitioned as scrape_date=YYYY-MM-DD/site=<name>/
+    SNAPSHOTS = {
+        'path': os.path.join(DATA_DIR, 'snapshots')
+    }
+    
+    # Append-only price history; a row is written only when a listing's price changes
+    PRICE_HISTORY = {
+        'path': os.path.join(DATA_DIR, 'price_history.db')
+    }
+    
     # Target Sites Configuration
     TARGET_SITES = {
         'chronofinder': {
@@ -37,77 +137,99 @@ class Config:
             'enabled': True,
             'priority': 1,
             'use_selenium': True,
-            'max_products': 100
+            'max_products': 100,
+            'rate_limit': {'requests_per_second': 0.5, 'burst': 2},
+            'concurrency': {'min': 1, 'max': 2}
         },
         'prestigiousjewellers': {
             'base_url': 'https://www.prestigiousjewellers.com',
             'enabled': True,
             'priority': 2,
             'use_selenium': False,
-            'max_products': 100
+            'max_products': 100,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'bqwatches': {
             'base_url': 'https://www.bqwatches.com',
             'enabled': True,
             'priority': 3,
             'use_selenium': False,
-            'max_products': 100
+            'max_products': 100,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'trilogyjewellers': {
             'base_url': 'https://trilogyjewellers.com',
             'enabled': True,
             'priority': 4,
             'use_selenium': True,
-            'max_products': 100
+            'max_products': 100,
+            'rate_limit': {'requests_per_second': 0.5, 'burst': 2},
+            'concurrency': {'min': 1, 'max': 2}
         },
         'watchtrader': {
             'base_url': 'https://www.watchtrader.co.uk',
             'enabled': True,
             'priority': 5,
             'use_selenium': False,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'watchcollectors': {
             'base_url': 'https://watchcollectors.co.uk',
             'enabled': True,
             'priority': 6,
             'use_selenium': True,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 0.5, 'burst': 2},
+            'concurrency': {'min': 1, 'max': 2}
         },
         'luxurywatchcompany': {
             'base_url': 'https://theluxurywatchcompany.com',
             'enabled': True,
             'priority': 7,
             'use_selenium': False,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'watches_couk': {
             'base_url': 'https://www.watches.co.uk',
             'enabled': True,
             'priority': 8,
             'use_selenium': False,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'ukspecialistwatches': {
             'base_url': 'https://www.ukspecialistwatches.co.uk',
             'enabled': True,
             'priority': 9,
             'use_selenium': False,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'watchbuyers': {
             'base_url': 'https://www.watchbuyers.co.uk',
             'enabled': True,
             'priority': 10,
             'use_selenium': False,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 1.0, 'burst': 3},
+            'concurrency': {'min': 1, 'max': 6}
         },
         'watchthetime': {
             'base_url': 'https://watchthetime.co.uk',
             'enabled': True,
             'priority': 11,
             'use_selenium': True,
-            'max_products': 50
+            'max_products': 50,
+            'rate_limit': {'requests_per_second': 0.5, 'burst': 2},
+            'concurrency': {'min': 1, 'max': 2}
         }
     }
     
@@ -125,7 +247,17 @@ class Config:
         'brand_weight': 0.4,
         'reference_weight': 0.3,
         'model_weight': 0.2,
-        'title_weight': 0.1
+        'title_weight': 0.1,
+        # Below this many source x target pairs one exhaustive cdist beats building blocks
+        'exhaustive_max_pairs': int(os.getenv('MATCHING_EXHAUSTIVE_MAX_PAIRS', '4000000'))
+    }
+    
+    # MinHash LSH near-duplicate detection; 32 bands of 4 rows catch pairs from roughly 0.4 Jaccard up
+    NEAR_DUPLICATES = {
+        'num_perm': 128,
+        'bands': 32,
+        'shingle_size': 4,
+        'threshold': 0.6
     }
     
     # Watch Brands to Focus On
@@ -48,37 +48,39 @@ def load_watch_data():
         print(f"Error loading data: {e}")
         return pd.DataFrame(columns=['url', 'site', 'title', 'price', 'currency', 'brand', 'model', 'reference'])
 
+# Common watch brands and how they are displayed
+BRAND_NAMES = {
+    'ROLEX': 'Rolex', 'OMEGA': 'Omega', 'PATEK PHILIPPE': 'Patek Philippe',
+    'AUDEMARS PIGUET': 'Audemars Piguet', 'CARTIER': 'Cartier', 'BREITLING': 'Breitling',
+    'TAG HEUER': 'Tag Heuer', 'TUDOR': 'Tudor', 'SEIKO': 'Seiko', 'TISSOT': 'Tissot',
+    'HAMILTON': 'Hamilton', 'A. LANGE': 'A. Lange & Söhne', 'LANGE': 'A. Lange & Söhne',
+    'VACHERON CONSTANTIN': 'Vacheron Constantin', 'JAEGER-LECOULTRE': 'Jaeger-Lecoultre',
+    'IWC': 'Iwc', 'PANERAI': 'Panerai', 'HUBLOT': 'Hublot', 'ZENITH': 'Zenith', 'LONGINES': 'Longines'
+}
+
 def clean_brand_data(df):
     """Clean and extract brand information"""
-    # Fill missing brands from title and description
-    for idx, row in df.iterrows():
-        if pd.isna(row.get('brand')) or row.get('brand') == '':
-            # Try to extract brand from title
-            title = str(row.get('title', '')).upper()
-            description = str(row.get('description', '')).upper()
-            url = str(row.get('url', '')).upper()
-            
-            # Common watch brands
-            brands = [
-                'ROLEX', 'OMEGA', 'PATEK PHILIPPE', 'AUDEMARS PIGUET', 'CARTIER',
-                'BREITLING', 'TAG HEUER', 'TUDOR', 'SEIKO', 'TISSOT', 'HAMILTON',
-                'A. LANGE', 'LANGE', 'VACHERON CONSTANTIN', 'JAEGER-LECOULTRE',
-                'IWC', 'PANERAI', 'HUBLOT', 'ZENITH', 'LONGINES'
-            ]
-            
-            extracted_brand = None
-            for brand in brands:
-                if brand in title or brand in description or brand in url:
-                    extracted_brand = brand.title()
-                    if brand == 'A. LANGE' or brand == 'LANGE':
-                        extracted_brand = 'A. Lange & Söhne'
-                    break
-            
-            if extracted_brand:
-                df.at[idx, 'brand'] = extracted_brand
-            else:
-                df.at[idx, 'brand'] = 'Other'
+    # Fill missing brands brand by brand in BRAND_NAMES order; the first brand found in the title,
+    # description or URL wins, with one vectorized pass per brand over the rows still missing
+    if 'brand' not in df.columns:
+        df['brand'] = None
+    missing = df['brand'].isna() | (df['brand'] == '')
+    
+    if missing.any():
+        text = pd.Series('', index=df.index[missing])
+        for field in ['title', 'description', 'url']:
+            if field in df.columns:
+                text = text + '\n' + df.loc[missing, field].fillna('').astype(str).str.upper()
+        
+        for brand, name in BRAND_NAMES.items():
+            found = text.index[text.str.contains(brand, regex=False)]
+            df.loc[found, 'brand'] = name
+            missing[found] = False
+            text = text.drop(found)
+            if text.empty:
+                break
     
+    df.loc[missing, 'brand'] = 'Other'
     return df
 
 def filter_watch_products(df):
@@ -20,6 +20,19 @@ from scrapers.prestigiousjewellers_scraper import PrestigiousJewellersScraper
 from scrapers.bqwatches_scraper import BQWatchesScraper
 from scrapers.trilogyjewellers_scraper import TrilogyJewellersScraper
 from scrapers.additional_scrapers import GenericWatchScraper, SITE_CONFIGS
+from utils.rate_limiter import get_rate_limiter
+from utils.http_cache import get_http_cache
+from utils.driver_pool import shutdown_driver_pool
+from utils.crawl_frontier import get_crawl_frontier
+from utils.concurrency import get_concurrency_controller
+from utils.retry import get_circuit_breaker
+from utils.parse_pool import create_parse_pool
+from utils.product_sink import open_site_sink, read_ndjson
+from utils.snapshot_store import SnapshotWriter, read_snapshot, export_snapshot
+from utils.price_history import get_price_history
+from utils.url_canonical import listing_id
+from utils.text_normalization import normalization_stats
+from config.settings import Config
 
 # Setup logging
 logging.basicConfig(
@@ -48,8 +61,13 @@ class WatchScrapingManager:
         for site_name, config in SITE_CONFIGS.items():
             self.scrapers[site_name] = lambda config=config: GenericWatchScraper(config)
         
-        self.all_data = []
         self.results = {}
+        self.stream_dir = None
+        self.snapshot_run = None
+        self.price_changes = {'new': 0, 'changed': 0, 'unchanged': 0}
+        self.resume = False
+        self.incremental = False
+        self.parse_pool = None
     
     def run_single_scraper(self, scraper_name: str, scraper_class) -> dict:
         """Run a single scraper and return results"""
@@ -59,21 +77,29 @@ class WatchScrapingManager:
             'success': False,
             'data_count': 0,
             'execution_time': 0,
+            'parse_paths': {},
             'error': None
         }
         
         try:
             logger.info(f"Starting scraper: {scraper_name}")
             
-            with scraper_class() as scraper:
-                data = scraper.scrape()
-                scraper.save_data(f"{scraper_name}_watches_{int(time.time())}")
+            # Products are appended to this site's stream as they are scraped instead of held until the end
+            with scraper_class() as scraper, open_site_sink(self.stream_dir, scraper_name) as sink:
+                scraper.resume = self.resume
+                scraper.incremental = self.incremental or scraper.incremental
+                scraper.parse_pool = self.parse_pool
+                scraper.sink = sink
+                scraper.keep_in_memory = False
+                scraper.scrape()
                 
                 result['success'] = True
-                result['data_count'] = len(data)
-                result['data'] = data
+                result['data_count'] = scraper.products_emitted
+                result['streams'] = sink.paths
+                result['parse_paths'] = dict(scraper.parse_paths)
+                result['incremental'] = dict(scraper.incremental_stats)
                 
-                logger.info(f"Completed {scraper_name}: {len(data)} products")
+                logger.info(f"Completed {scraper_name}: {scraper.products_emitted} products")
                 
         except Exception as e:
             error_msg = f"Error in {scraper_name}: {str(e)}"
@@ -83,18 +109,32 @@ class WatchScrapingManager:
         result['execution_time'] = time.time() - start_time
         return result
     
-    def run_all_scrapers(self, parallel: bool = False, selected_scrapers: list = None):
+    def run_all_scrapers(self, parallel: bool = False, selected_scrapers: list = None, resume: bool = False,
+                         incremental: bool = False, parse_workers: int = 0, export_formats: list = None):
         """Run all scrapers either in parallel or sequentially"""
         scrapers_to_run = selected_scrapers or list(self.scrapers.keys())
+        self.resume = resume
+        self.incremental = incremental
+        self.parse_pool = create_parse_pool(parse_workers)
+        self.stream_dir = os.path.join('data', 'streams', datetime.now().strftime("%Y%m%d_%H%M%S"))
         
         logger.info(f"Starting to scrape {len(scrapers_to_run)} websites...")
         
-        if parallel:
-            self.run_parallel(scrapers_to_run)
-        else:
-            self.run_sequential(scrapers_to_run)
+        try:
+            if parallel:
+                self.run_parallel(scrapers_to_run)
+            else:
+                self.run_sequential(scrapers_to_run)
+        finally:
+            # Browsers are shared by every Selenium scraper in the run
+            shutdown_driver_pool()
+            if self.parse_pool:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
         
         self.consolidate_data()
+        if export_formats:
+            self.export_data(export_formats)
         self.generate_report()
     
     def run_sequential(self, scrapers_to_run: list):
@@ -104,16 +144,11 @@ class WatchScrapingManager:
                 scraper_class = self.scrapers[scraper_name]
                 result = self.run_single_scraper(scraper_name, scraper_class)
                 self.results[scraper_name] = result
-                
-                if result['success']:
-                    self.all_data.extend(result['data'])
-                
-                # Add delay between scrapers to be respectful
-                time.sleep(5)
     
     def run_parallel(self, scrapers_to_run: list):
-        """Run scrapers in parallel (use with caution)"""
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        """Run every site in its own worker; per-host load is governed by the adaptive concurrency controller"""
+        site_count = len([name for name in scrapers_to_run if name in self.scrapers])
+        with ThreadPoolExecutor(max_workers=max(1, site_count)) as executor:
             future_to_scraper = {}
             
             for scraper_name in scrapers_to_run:
@@ -127,63 +162,73 @@ class WatchScrapingManager:
                 try:
                     result = future.result()
                     self.results[scraper_name] = result
-                    
-                    if result['success']:
-                        self.all_data.extend(result['data'])
                         
                 except Exception as e:
                     logger.error(f"Parallel execution error for {scraper_name}: {str(e)}")
     
+    def site_streams(self) -> list:
+        """NDJSON streams written by the successful scrapers of this run"""
+        return [
+            path for result in self.results.values() if result['success']
+            for path in result.get('streams', []) if path.endswith('.ndjson')
+        ]
+    
+    def read_streams(self, chunk_size: int = 5000):
+        """Merge the per-site streams as DataFrame chunks of at most chunk_size products"""
+        for path in self.site_streams():
+            chunk = []
+            for product in read_ndjson(path):
+                chunk.append(product)
+                if len(chunk) >= chunk_size:
+                    yield pd.DataFrame(chunk)
+                    chunk = []
+            if chunk:
+                yield pd.DataFrame(chunk)
+    
     def consolidate_data(self):
-        """Consolidate all scraped data into unified format"""
-        if not self.all_data:
-            logger.warning("No data to consolidate")
-            return
-        
-        logger.info(f"Consolidating {len(self.all_data)} products...")
-        
-        # Create DataFrame
-        df = pd.DataFrame(self.all_data)
+        """Merge the per-site streams into a Parquet snapshot one chunk at a time"""
+        writer = SnapshotWriter(Config.SNAPSHOTS['path'])
+        price_history = get_price_history()
+        seen_listings = set()
         
-        # Clean and standardize data
-        df = self.clean_dataframe(df)
-        
-        # Save consolidated data
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        for chunk in self.read_streams():
+            # Clean and standardize data
+            chunk = self.clean_dataframe(chunk)
+            listings = chunk['url'].map(listing_id)
+            chunk = chunk[~listings.isin(seen_listings)]
+            seen_listings.update(listings[chunk.index])
+            writer.write(chunk)
+            
+            # Only listings whose price moved since their last row add to the history
+            counts = price_history.record(chunk.to_dict('records'), scraped_at=writer.scraped_at.timestamp())
+            for key, count in counts.items():
+                self.price_changes[key] += count
         
-        # Save as CSV
-        csv_file = f"data/consolidated_watches_{timestamp}.csv"
-        df.to_csv(csv_file, index=False)
+        if not writer.rows:
+            logger.warning("No data to consolidate")
+            return
         
-        # Save as JSON
-        json_file = f"data/consolidated_watches_{timestamp}.json"
-        df.to_json(json_file, orient='records', indent=2)
+        self.snapshot_run = writer.run_id
+        logger.info(f"Consolidated {writer.rows} products from {len(self.site_streams())} site streams "
+                    f"into {Config.SNAPSHOTS['path']} (run {writer.run_id})")
+    
+    def export_data(self, formats: list, run_id: str = None) -> list:
+        """Generate CSV, JSON or Excel files from a snapshot run on demand"""
+        run_id = run_id or self.snapshot_run or 'latest'
+        df = read_snapshot(Config.SNAPSHOTS['path'], run_id=run_id)
+        if df.empty:
+            logger.warning("No snapshot to export")
+            return []
         
-        # Save as Excel with multiple sheets
-        excel_file = f"data/consolidated_watches_{timestamp}.xlsx"
-        with pd.ExcelWriter(excel_file) as writer:
-            df.to_excel(writer, sheet_name='All_Watches', index=False)
-            
-            # Create separate sheets by brand
-            for brand in df['brand'].dropna().unique():
-                brand_df = df[df['brand'] == brand]
-                if len(brand_df) > 0:
-                    sheet_name = brand.replace(' ', '_')[:31]  # Excel sheet name limit
-                    brand_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Create separate sheets by site
-            for site in df['site'].unique():
-                site_df = df[df['site'] == site]
-                if len(site_df) > 0:
-                    sheet_name = site[:31]
-                    site_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        logger.info(f"Consolidated data saved to {csv_file}, {json_file}, and {excel_file}")
+        name = df['run_id'].iloc[0]
+        files = [export_snapshot(df, f"data/consolidated_watches_{name}.{fmt}") for fmt in formats]
+        logger.info(f"Exported snapshot {name} to {', '.join(files)}")
+        return files
     
     def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize the dataframe"""
-        # Remove duplicates based on URL
-        df = df.drop_duplicates(subset=['url'], keep='first')
+        # Remove duplicates: the same listing under another collection path or with tracking params
+        df = df[~df['url'].map(listing_id).duplicated()]
         
         # Clean text fields
         text_fields = ['title', 'brand', 'model', 'description']
@@ -218,7 +263,7 @@ class WatchScrapingManager:
                 'timestamp': timestamp,
                 'total_sites_attempted': len(self.results),
                 'successful_sites': len([r for r in self.results.values() if r['success']]),
-                'total_products_scraped': len(self.all_data),
+                'total_products_scraped': sum(r['data_count'] for r in self.results.values() if r['success']),
                 'execution_details': self.results
             }
         }
@@ -230,14 +275,38 @@ class WatchScrapingManager:
                 'success': result['success'],
                 'products_count': result['data_count'],
                 'execution_time_seconds': round(result['execution_time'], 2),
+                'parse_paths': result.get('parse_paths', {}),
+                'incremental': result.get('incremental', {}),
                 'error': result.get('error')
             }
         
         report['site_summary'] = site_summary
         
+        # Time each worker spent waiting on per-host rate limits
+        report['rate_limiting'] = get_rate_limiter().stats()
+        
+        http_cache = get_http_cache()
+        if http_cache:
+            report['http_cache'] = http_cache.stats()
+        
+        # Retries, circuit breaker trips and the time skipped hosts did not cost us
+        report['retries'] = get_circuit_breaker().stats()
+        
+        # Per-host AIMD concurrency limits and how they moved during the run
+        report['concurrency'] = get_concurrency_controller().stats()
+        
+        # URL states left in the crawl frontier, for judging whether --resume is needed
+        report['crawl_frontier'] = get_crawl_frontier().stats()
+        
+        report['price_history'] = {**self.price_changes, **get_price_history().stats()}
+        
+        # Memo hit rates and per-call latency for price/detail extraction, parse workers included;
+        # entries counts only this process's cache
+        report['text_normalization'] = normalization_stats()
+        
         # Product analysis
-        if self.all_data:
-            df = pd.DataFrame(self.all_data)
+        if self.snapshot_run:
+            df = read_snapshot(Config.SNAPSHOTS['path'], columns=['brand', 'price', 'site'], run_id=self.snapshot_run)
             
             # Brand distribution
             brand_counts = df['brand'].value_counts().to_dict()
@@ -269,9 +338,49 @@ class WatchScrapingManager:
         for site, details in site_summary.items():
             status = "✓" if details['success'] else "✗"
             print(f"  {status} {site}: {details['products_count']} products ({details['execution_time_seconds']}s)")
+            parse_paths = {path: count for path, count in details['parse_paths'].items() if count}
+            if parse_paths:
+                print(f"    Parse paths: {', '.join(f'{path}={count}' for path, count in parse_paths.items())}")
+            if details['incremental']:
+                delta = details['incremental']
+                print(f"    Incremental: {delta['new']} new, {delta['changed']} changed, "
+                      f"{delta['unchanged']} unchanged, {delta['removed']} sold/removed")
             if details['error']:
                 print(f"    Error: {details['error']}")
         
+        if report['rate_limiting']['hosts']:
+            print("\nRate Limit Waits:")
+            for host, stats in report['rate_limiting']['hosts'].items():
+                print(f"  {host}: {stats['waits']}/{stats['requests']} requests waited, {stats['total_wait_seconds']}s total")
+        
+        if report['retries']:
+            print("\nRetries / Circuit Breakers:")
+            for host, stats in report['retries'].items():
+                print(f"  {host}: {stats['retries']} retries ({stats['retry_wait_seconds']}s backoff), "
+                      f"breaker {stats['state']} ({stats['trips']} trips), "
+                      f"{stats['short_circuited']} requests skipped, ~{stats['time_saved_seconds']}s saved")
+        
+        if report['concurrency']:
+            print("\nAdaptive Concurrency:")
+            for host, stats in report['concurrency'].items():
+                limits = [limit for _, limit in stats['history']]
+                print(f"  {host}: limit {stats['limit']} (ranged {min(limits)}-{max(limits)}, bounds {stats['min']}-{stats['max']}), "
+                      f"p95 {stats['p95_latency_seconds']}s, {stats['throttled']} throttled, {stats['timeouts']} timeouts")
+        
+        if 'http_cache' in report:
+            cache_stats = report['http_cache']
+            print(f"\nHTTP Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.0%} hit rate), {cache_stats['products_reused']} products reused without parsing")
+        
+        price_history = report['price_history']
+        print(f"\nPrice History: {price_history['new']} new listings, {price_history['changed']} price changes, "
+              f"{price_history['unchanged']} unchanged ({price_history['rows']} rows for {price_history['listings']} listings)")
+        
+        print("\nText Normalization Memo:")
+        for name, stats in report['text_normalization'].items():
+            print(f"  {name}: {stats['hits']}/{stats['calls']} hits ({stats['hit_rate']:.0%}), "
+                  f"{stats['avg_hit_us']}us per hit vs {stats['avg_miss_us']}us per miss")
+        
         if 'brand_distribution' in report:
             print(f"\nTop Brands:")
             for brand, count in list(report['brand_distribution'].items())[:5]:
@@ -287,6 +396,22 @@ def main():
     parser.add_argument('--sites', nargs='+', help='Specific sites to scrape')
     parser.add_argument('--parallel', action='store_true', help='Run scrapers in parallel')
     parser.add_argument('--list-sites', action='store_true', help='List available sites')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the last run from the crawl frontier instead of starting over')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch product pages that are new or changed since the last snapshot')
+    parser.add_argument('--parse-workers', type=int, default=0, metavar='N',
+                        help='Parse product pages in N worker processes (-1 for every core, 0 to parse in-process)')
+    
+    parser.add_argument('--export', nargs='+', choices=['csv', 'json', 'xlsx'], metavar='FORMAT',
+                        help='Also write the consolidated snapshot as csv, json and/or xlsx')
+    parser.add_argument('--export-only', action='store_true',
+                        help='Export the latest snapshot in the --export formats without scraping')
+    
+    parser.add_argument('--price-changes', metavar='REFERENCE',
+                        help='Print recorded price changes for a reference across all sites and exit')
+    parser.add_argument('--days', type=float, default=30,
+                        help='How far back --price-changes looks (default: 30)')
     
     args = parser.parse_args()
     
@@ -298,10 +423,25 @@ def main():
             print(f"  - {site}")
         return
     
+    if args.price_changes:
+        for row in get_price_history().changes(reference=args.price_changes, days=args.days):
+            previous = f"£{row['previous_price']:,.0f}" if row['previous_price'] is not None else 'new'
+            print(f"{datetime.fromtimestamp(row['scraped_at']):%Y-%m-%d %H:%M}  {row['site']:<22} "
+                  f"{previous:>10} -> £{row['price']:,.0f}  {row['url']}")
+        return
+    
+    if args.export_only:
+        manager.export_data(args.export or ['csv', 'json', 'xlsx'])
+        return
+    
     try:
         manager.run_all_scrapers(
             parallel=args.parallel,
-            selected_scrapers=args.sites
+            selected_scrapers=args.sites,
+            resume=args.resume,
+            incremental=args.incremental,
+            parse_workers=args.parse_workers,
+            export_formats=args.export
         )
     except KeyboardInterrupt:
         logger.info("Scraping interrupted by user")
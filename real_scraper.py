@@ -5,18 +5,20 @@ Scrapes all competitor websites for watch listings
 """
 
 import requests
-from bs4 import BeautifulSoup
 import csv
 import json
-import time
-import random
 from urllib.parse import urljoin, urlparse
 import os
 from datetime import datetime
 
+from utils.html_parser import parse_html
+from utils.rate_limiter import get_rate_limiter
+from utils.vocabulary import find_brand
+
 class WatchScraper:
     def __init__(self):
         self.session = requests.Session()
+        self.rate_limiter = get_rate_limiter()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -56,9 +58,10 @@ class WatchScraper:
             ]
             
             for url in urls:
+                self.rate_limiter.acquire(url)
                 response = self.session.get(url, timeout=30)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = parse_html(response.content)
                     
                     # Find product cards
                     products = soup.find_all('div', class_='product-card') or soup.find_all('a', href=True)
@@ -83,8 +86,6 @@ class WatchScraper:
                         except Exception as e:
                             continue
                 
-                time.sleep(random.uniform(1, 3))  # Random delay
-                
         except Exception as e:
             print(f"❌ Error scraping ChronoFinder: {e}")
     
@@ -100,9 +101,10 @@ class WatchScraper:
             ]
             
             for url in urls:
+                self.rate_limiter.acquire(url)
                 response = self.session.get(url, timeout=30)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = parse_html(response.content, 'product')
                     
                     products = soup.find_all('li', class_='product') or soup.find_all('div', class_='product')
                     
@@ -125,8 +127,6 @@ class WatchScraper:
                                 self.scraped_products.append(product_data)
                         except Exception as e:
                             continue
-                            
-                time.sleep(random.uniform(1, 3))
                 
         except Exception as e:
             print(f"❌ Error scraping BQ Watches: {e}")
@@ -137,10 +137,11 @@ class WatchScraper:
             print("🔍 Scraping Prestigious Jewellers...")
             
             url = 'https://www.prestigiousjewellers.com/product-category/watches/'
+            self.rate_limiter.acquire(url)
             response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response.content, 'product')
                 products = soup.find_all('div', class_='product') or soup.find_all('li', class_='product')
                 
                 for product in products[:20]:
@@ -172,10 +173,11 @@ class WatchScraper:
             print("🔍 Scraping Watch Trader...")
             
             url = 'https://www.watchtrader.co.uk/shop/'
+            self.rate_limiter.acquire(url)
             response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response.content)
                 products = soup.find_all('div', class_='product') or soup.find_all('article')
                 
                 for product in products[:20]:
@@ -215,7 +217,6 @@ class WatchScraper:
         for scraper in scrapers:
             try:
                 scraper()
-                time.sleep(random.uniform(2, 5))  # Delay between sites
             except Exception as e:
                 print(f"❌ Scraper failed: {e}")
                 continue
@@ -242,15 +243,7 @@ class WatchScraper:
     
     def extract_brand(self, title):
         """Extract brand name from title"""
-        brands = ['Rolex', 'Omega', 'Patek Philippe', 'Audemars Piguet', 'Cartier', 
-                 'Breitling', 'TAG Heuer', 'Hublot', 'Panerai', 'IWC', 'Jaeger-LeCoultre',
-                 'Vacheron Constantin', 'Chopard', 'Tudor', 'Longines', 'Tissot']
-        
-        title_upper = title.upper()
-        for brand in brands:
-            if brand.upper() in title_upper:
-                return brand
-        return 'Unknown'
+        return find_brand(title) or 'Unknown'
     
     def save_to_csv(self, filename='data/consolidated_watches_live.csv'):
         """Save scraped data to CSV"""
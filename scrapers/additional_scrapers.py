@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.base_scraper import BaseScraper
+from utils.url_canonical import CanonicalLinks
 import re
 
 class WatchTraderScraper(BaseScraper):
@@ -131,9 +132,14 @@ class GenericWatchScraper(BaseScraper):
             use_selenium=site_config.get('use_selenium', False)
         )
         
+        self.site_config = site_config
         self.category_urls = site_config['category_urls']
         self.selectors = site_config.get('selectors', self.get_default_selectors())
     
+    def parse_spec(self) -> tuple:
+        """Parse workers rebuild generic scrapers from their site config"""
+        return type(self), (self.site_config,)
+    
     def get_default_selectors(self):
         """Default selectors for common e-commerce platforms"""
         return {
@@ -172,11 +178,11 @@ class GenericWatchScraper(BaseScraper):
         """Generic product link extraction"""
         self.logger.info(f"Scraping product links from: {category_url}")
         
-        soup = self.get_page(category_url)
+        soup = self.get_page(category_url, profile='links')
         if not soup:
             return []
         
-        product_links = []
+        product_links = CanonicalLinks()
         
         for selector in self.selectors['product_links']:
             links = soup.select(selector)
@@ -185,18 +191,17 @@ class GenericWatchScraper(BaseScraper):
                     href = link.get('href')
                     if href and ('/product' in href):
                         full_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                        if full_url not in product_links:
-                            product_links.append(full_url)
+                        product_links.add(full_url)
                 break
         
         self.logger.info(f"Found {len(product_links)} product links")
-        return product_links
+        return product_links.urls
     
     def scrape_product_details(self, product_url: str) -> dict:
         """Generic product detail extraction"""
         self.logger.info(f"Scraping product: {product_url}")
         
-        soup = self.get_page(product_url)
+        soup = self.get_page(product_url, profile='product')
         if not soup:
             return {}
         
@@ -217,47 +222,57 @@ class GenericWatchScraper(BaseScraper):
         }
         
         try:
+            # Structured data first; the selector cascades below only fill what it missed
+            structured_fields = self.apply_structured_data(soup, product_data)
+            
             # Extract title
-            for selector in self.selectors['title']:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    product_data['title'] = self.clean_text(title_elem.get_text())
-                    break
+            if not product_data['title']:
+                for selector in self.selectors['title']:
+                    title_elem = soup.select_one(selector)
+                    if title_elem:
+                        product_data['title'] = self.clean_text(title_elem.get_text())
+                        break
             
             # Extract price
-            for selector in self.selectors['price']:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.get_text()
-                    product_data['price'] = self.extract_price(price_text)
-                    if product_data['price']:
-                        break
+            if not product_data['price']:
+                for selector in self.selectors['price']:
+                    price_elem = soup.select_one(selector)
+                    if price_elem:
+                        price_text = price_elem.get_text()
+                        product_data['price'] = self.extract_price(price_text)
+                        if product_data['price']:
+                            break
             
             # Extract description
-            for selector in self.selectors['description']:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    product_data['description'] = self.clean_text(desc_elem.get_text())
-                    break
+            if not product_data['description']:
+                for selector in self.selectors['description']:
+                    desc_elem = soup.select_one(selector)
+                    if desc_elem:
+                        product_data['description'] = self.clean_text(desc_elem.get_text())
+                        break
             
             # Extract images
-            for selector in self.selectors['images']:
-                images = soup.select(selector)
-                if images:
-                    for img in images:
-                        src = img.get('src') or img.get('data-src')
-                        if src:
-                            img_url = src if src.startswith('http') else f"{self.base_url}{src}"
-                            if img_url not in product_data['images']:
-                                product_data['images'].append(img_url)
-                    break
+            if not product_data['images']:
+                for selector in self.selectors['images']:
+                    images = soup.select(selector)
+                    if images:
+                        for img in images:
+                            src = img.get('src') or img.get('data-src')
+                            if src:
+                                img_url = src if src.startswith('http') else f"{self.base_url}{src}"
+                                if img_url not in product_data['images']:
+                                    product_data['images'].append(img_url)
+                        break
             
             # Extract watch details
             watch_details = self.extract_watch_details(
                 product_data['title'], 
                 product_data['description']
             )
-            product_data.update(watch_details)
+            self.merge_details(product_data, watch_details)
+            
+            # Tally which parse path produced this product
+            self.record_parse_path(structured_fields)
             
         except Exception as e:
             self.logger.error(f"Error scraping product {product_url}: {str(e)}")
@@ -268,36 +283,7 @@ class GenericWatchScraper(BaseScraper):
         """Main scraping method"""
         self.logger.info(f"Starting {self.site_name} scraping...")
         
-        all_product_links = []
-        
-        for category_url in self.category_urls:
-            try:
-                links = self.scrape_product_links(category_url)
-                all_product_links.extend(links)
-                self.random_delay(1, 2)
-            except Exception as e:
-                self.logger.error(f"Error scraping category {category_url}: {str(e)}")
-        
-        # Remove duplicates
-        all_product_links = list(set(all_product_links))
-        self.logger.info(f"Found total {len(all_product_links)} unique products")
-        
-        # Scrape products (limit for efficiency)
-        max_products = 50  # Reduced for each site
-        for i, product_url in enumerate(all_product_links[:max_products]):
-            try:
-                product_data = self.scrape_product_details(product_url)
-                if product_data and product_data.get('title'):
-                    self.scraped_data.append(product_data)
-                    self.logger.info(f"Scraped product {i+1}/{min(len(all_product_links), max_products)}: {product_data['title']}")
-                
-                self.random_delay()
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping product {product_url}: {str(e)}")
-        
-        self.logger.info(f"Completed scraping. Total products: {len(self.scraped_data)}")
-        return self.scraped_data
+        return self.crawl(self.category_urls, max_products=50)
 
 
 # Site configurations
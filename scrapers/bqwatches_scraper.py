@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.base_scraper import BaseScraper
+from utils.url_canonical import CanonicalLinks
 import re
 
 class BQWatchesScraper(BaseScraper):
@@ -30,11 +31,11 @@ class BQWatchesScraper(BaseScraper):
         """Extract product links from category page"""
         self.logger.info(f"Scraping product links from: {category_url}")
         
-        soup = self.get_page(category_url)
+        soup = self.get_page(category_url, profile='links')
         if not soup:
             return []
         
-        product_links = []
+        product_links = CanonicalLinks()
         
         # WooCommerce selectors
         link_selectors = [
@@ -51,8 +52,7 @@ class BQWatchesScraper(BaseScraper):
                     href = link.get('href')
                     if href and '/product/' in href:
                         full_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                        if full_url not in product_links:
-                            product_links.append(full_url)
+                        product_links.add(full_url)
                 break
         
         # Handle pagination
@@ -60,18 +60,17 @@ class BQWatchesScraper(BaseScraper):
         if next_page:
             next_url = next_page.get('href')
             if next_url:
-                self.random_delay()
                 additional_links = self.scrape_product_links(next_url)
-                product_links.extend(additional_links)
+                product_links.update(additional_links)
         
         self.logger.info(f"Found {len(product_links)} product links")
-        return product_links
+        return product_links.urls
     
     def scrape_product_details(self, product_url: str) -> dict:
         """Scrape Rolex product details"""
         self.logger.info(f"Scraping product: {product_url}")
         
-        soup = self.get_page(product_url)
+        soup = self.get_page(product_url, profile='product')
         if not soup:
             return {}
         
@@ -92,59 +91,66 @@ class BQWatchesScraper(BaseScraper):
         }
         
         try:
+            # Structured data first; the selector cascades below only fill what it missed
+            structured_fields = self.apply_structured_data(soup, product_data)
+            
             # Extract title
-            title_elem = soup.select_one('h1.py-2, .product_title, h1.entry-title')
-            if title_elem:
-                product_data['title'] = self.clean_text(title_elem.get_text())
+            if not product_data['title']:
+                title_elem = soup.select_one('h1.py-2, .product_title, h1.entry-title')
+                if title_elem:
+                    product_data['title'] = self.clean_text(title_elem.get_text())
             
             # Extract price  
-            price_selectors = [
-                'p.highlight.fs-4.fw-bold',  # Updated selector for BQ Watches
-                '.price .woocommerce-Price-amount',
-                '.price ins .amount',
-                '.summary .price .amount'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.get_text()
-                    product_data['price'] = self.extract_price(price_text)
-                    if product_data['price']:
-                        break
+            if not product_data['price']:
+                price_selectors = [
+                    'p.highlight.fs-4.fw-bold',  # Updated selector for BQ Watches
+                    '.price .woocommerce-Price-amount',
+                    '.price ins .amount',
+                    '.summary .price .amount'
+                ]
+                
+                for selector in price_selectors:
+                    price_elem = soup.select_one(selector)
+                    if price_elem:
+                        price_text = price_elem.get_text()
+                        product_data['price'] = self.extract_price(price_text)
+                        if product_data['price']:
+                            break
             
             # Extract description
-            desc_selectors = [
-                '.woocommerce-product-details__short-description',
-                '.product-description',
-                '#tab-description'
-            ]
-            
-            description_parts = []
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    desc_text = self.clean_text(desc_elem.get_text())
-                    if desc_text:
-                        description_parts.append(desc_text)
-            
-            product_data['description'] = ' '.join(description_parts)
+            if not product_data['description']:
+                desc_selectors = [
+                    '.woocommerce-product-details__short-description',
+                    '.product-description',
+                    '#tab-description'
+                ]
+                
+                description_parts = []
+                for selector in desc_selectors:
+                    desc_elem = soup.select_one(selector)
+                    if desc_elem:
+                        desc_text = self.clean_text(desc_elem.get_text())
+                        if desc_text:
+                            description_parts.append(desc_text)
+                
+                product_data['description'] = ' '.join(description_parts)
             
             # Extract images
-            images = soup.select('.woocommerce-product-gallery__image img, .product-images img')
-            for img in images:
-                src = img.get('src') or img.get('data-src')
-                if src:
-                    img_url = src if src.startswith('http') else f"{self.base_url}{src}"
-                    if img_url not in product_data['images']:
-                        product_data['images'].append(img_url)
+            if not product_data['images']:
+                images = soup.select('.woocommerce-product-gallery__image img, .product-images img')
+                for img in images:
+                    src = img.get('src') or img.get('data-src')
+                    if src:
+                        img_url = src if src.startswith('http') else f"{self.base_url}{src}"
+                        if img_url not in product_data['images']:
+                            product_data['images'].append(img_url)
             
             # Extract Rolex-specific details
             watch_details = self.extract_rolex_details(
                 product_data['title'], 
                 product_data['description']
             )
-            product_data.update(watch_details)
+            self.merge_details(product_data, watch_details)
             
             # Extract specifications from product attributes
             attributes = soup.select('.woocommerce-product-attributes tr')
@@ -164,11 +170,15 @@ class BQWatchesScraper(BaseScraper):
                         product_data['condition'] = value
             
             # Check availability
-            stock_elem = soup.select_one('.stock')
-            if stock_elem:
-                product_data['availability'] = self.clean_text(stock_elem.get_text())
-            else:
-                product_data['availability'] = 'Contact for Availability'
+            if not product_data['availability']:
+                stock_elem = soup.select_one('.stock')
+                if stock_elem:
+                    product_data['availability'] = self.clean_text(stock_elem.get_text())
+                else:
+                    product_data['availability'] = 'Contact for Availability'
+            
+            # Tally which parse path produced this product
+            self.record_parse_path(structured_fields)
             
         except Exception as e:
             self.logger.error(f"Error scraping product {product_url}: {str(e)}")
@@ -246,36 +256,7 @@ class BQWatchesScraper(BaseScraper):
         """Main scraping method"""
         self.logger.info("Starting BQ Watches scraping...")
         
-        all_product_links = []
-        
-        for category_url in self.category_urls:
-            try:
-                links = self.scrape_product_links(category_url)
-                all_product_links.extend(links)
-                self.random_delay(1, 2)
-            except Exception as e:
-                self.logger.error(f"Error scraping category {category_url}: {str(e)}")
-        
-        # Remove duplicates
-        all_product_links = list(set(all_product_links))
-        self.logger.info(f"Found total {len(all_product_links)} unique products")
-        
-        # Scrape products
-        max_products = 100
-        for i, product_url in enumerate(all_product_links[:max_products]):
-            try:
-                product_data = self.scrape_product_details(product_url)
-                if product_data and product_data.get('title'):
-                    self.scraped_data.append(product_data)
-                    self.logger.info(f"Scraped product {i+1}/{min(len(all_product_links), max_products)}: {product_data['title']}")
-                
-                self.random_delay()
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping product {product_url}: {str(e)}")
-        
-        self.logger.info(f"Completed scraping. Total products: {len(self.scraped_data)}")
-        return self.scraped_data
+        return self.crawl(self.category_urls, max_products=100)
 
 if __name__ == "__main__":
     with BQWatchesScraper() as scraper:
@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.base_scraper import BaseScraper
+from utils.url_canonical import CanonicalLinks
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -33,11 +34,11 @@ class ChronoFinderScraper(BaseScraper):
         """Extract all product links from a category page"""
         self.logger.info(f"Scraping product links from: {category_url}")
         
-        soup = self.get_page(category_url)
+        soup = self.get_page(category_url, profile='links')
         if not soup:
             return []
         
-        product_links = []
+        product_links = CanonicalLinks()
         
         # Look for product links (updated selectors for ChronoFinder)
         link_selectors = [
@@ -56,8 +57,7 @@ class ChronoFinderScraper(BaseScraper):
                     href = link.get('href')
                     if href and '/products/' in href:
                         full_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                        if full_url not in product_links:
-                            product_links.append(full_url)
+                        product_links.add(full_url)
                 break
         
         # Handle pagination
@@ -66,8 +66,7 @@ class ChronoFinderScraper(BaseScraper):
             href = page_link.get('href')
             if href and 'page=' in href:
                 page_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                self.random_delay()
-                page_soup = self.get_page(page_url)
+                page_soup = self.get_page(page_url, profile='links')
                 if page_soup:
                     for selector in link_selectors:
                         page_links = page_soup.select(selector)
@@ -76,18 +75,17 @@ class ChronoFinderScraper(BaseScraper):
                                 href = link.get('href')
                                 if href and '/products/' in href:
                                     full_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                                    if full_url not in product_links:
-                                        product_links.append(full_url)
+                                    product_links.add(full_url)
                             break
         
         self.logger.info(f"Found {len(product_links)} product links")
-        return product_links
+        return product_links.urls
     
     def scrape_product_details(self, product_url: str) -> dict:
         """Scrape detailed information from a product page"""
         self.logger.info(f"Scraping product: {product_url}")
         
-        soup = self.get_page(product_url)
+        soup = self.get_page(product_url, profile='product')
         if not soup:
             return {}
         
@@ -108,75 +106,82 @@ class ChronoFinderScraper(BaseScraper):
         }
         
         try:
-            # Extract title
-            title_selectors = [
-                '.product-single__title',
-                '.product__title',
-                'h1.product-title',
-                'h1'
-            ]
+            # Structured data first; the selector cascades below only fill what it missed
+            structured_fields = self.apply_structured_data(soup, product_data)
             
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    product_data['title'] = self.clean_text(title_elem.get_text())
-                    break
+            # Extract title
+            if not product_data['title']:
+                title_selectors = [
+                    '.product-single__title',
+                    '.product__title',
+                    'h1.product-title',
+                    'h1'
+                ]
+                
+                for selector in title_selectors:
+                    title_elem = soup.select_one(selector)
+                    if title_elem:
+                        product_data['title'] = self.clean_text(title_elem.get_text())
+                        break
             
             # Extract price
-            price_selectors = [
-                '.price',
-                '.product-single__price',
-                '.product__price',
-                '.money',
-                '[data-price]'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.get_text()
-                    product_data['price'] = self.extract_price(price_text)
-                    if product_data['price']:
-                        break
+            if not product_data['price']:
+                price_selectors = [
+                    '.price',
+                    '.product-single__price',
+                    '.product__price',
+                    '.money',
+                    '[data-price]'
+                ]
+                
+                for selector in price_selectors:
+                    price_elem = soup.select_one(selector)
+                    if price_elem:
+                        price_text = price_elem.get_text()
+                        product_data['price'] = self.extract_price(price_text)
+                        if product_data['price']:
+                            break
             
             # Extract description
-            desc_selectors = [
-                '.product-single__description',
-                '.product__description',
-                '.product-description',
-                '.rte'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    product_data['description'] = self.clean_text(desc_elem.get_text())
-                    break
+            if not product_data['description']:
+                desc_selectors = [
+                    '.product-single__description',
+                    '.product__description',
+                    '.product-description',
+                    '.rte'
+                ]
+                
+                for selector in desc_selectors:
+                    desc_elem = soup.select_one(selector)
+                    if desc_elem:
+                        product_data['description'] = self.clean_text(desc_elem.get_text())
+                        break
             
             # Extract images
-            img_selectors = [
-                '.product-single__photo img',
-                '.product__photo img',
-                '.product-images img'
-            ]
-            
-            for selector in img_selectors:
-                images = soup.select(selector)
-                if images:
-                    for img in images:
-                        src = img.get('src') or img.get('data-src')
-                        if src:
-                            img_url = src if src.startswith('http') else f"{self.base_url}{src}"
-                            if img_url not in product_data['images']:
-                                product_data['images'].append(img_url)
-                    break
+            if not product_data['images']:
+                img_selectors = [
+                    '.product-single__photo img',
+                    '.product__photo img',
+                    '.product-images img'
+                ]
+                
+                for selector in img_selectors:
+                    images = soup.select(selector)
+                    if images:
+                        for img in images:
+                            src = img.get('src') or img.get('data-src')
+                            if src:
+                                img_url = src if src.startswith('http') else f"{self.base_url}{src}"
+                                if img_url not in product_data['images']:
+                                    product_data['images'].append(img_url)
+                        break
             
             # Extract watch details
             watch_details = self.extract_watch_details(
                 product_data['title'], 
                 product_data['description']
             )
-            product_data.update(watch_details)
+            self.merge_details(product_data, watch_details)
             
             # Extract specifications from structured data
             specs_selectors = [
@@ -197,22 +202,26 @@ class ChronoFinderScraper(BaseScraper):
                     break
             
             # Check availability
-            availability_indicators = [
-                '.product-form__availability',
-                '.stock-status',
-                '.availability'
-            ]
-            
-            for selector in availability_indicators:
-                avail_elem = soup.select_one(selector)
-                if avail_elem:
-                    product_data['availability'] = self.clean_text(avail_elem.get_text())
-                    break
+            if not product_data['availability']:
+                availability_indicators = [
+                    '.product-form__availability',
+                    '.stock-status',
+                    '.availability'
+                ]
+                
+                for selector in availability_indicators:
+                    avail_elem = soup.select_one(selector)
+                    if avail_elem:
+                        product_data['availability'] = self.clean_text(avail_elem.get_text())
+                        break
             
             # Default availability based on price presence
             if not product_data['availability']:
                 product_data['availability'] = 'In Stock' if product_data['price'] else 'Contact for Price'
             
+            # Tally which parse path produced this product
+            self.record_parse_path(structured_fields)
+            
         except Exception as e:
             self.logger.error(f"Error scraping product {product_url}: {str(e)}")
         
@@ -222,37 +231,7 @@ class ChronoFinderScraper(BaseScraper):
         """Main scraping method"""
         self.logger.info("Starting ChronoFinder scraping...")
         
-        all_product_links = []
-        
-        # Collect all product links from category pages
-        for category_url in self.category_urls:
-            try:
-                links = self.scrape_product_links(category_url)
-                all_product_links.extend(links)
-                self.random_delay(2, 4)  # Longer delay between categories
-            except Exception as e:
-                self.logger.error(f"Error scraping category {category_url}: {str(e)}")
-        
-        # Remove duplicates
-        all_product_links = list(set(all_product_links))
-        self.logger.info(f"Found total {len(all_product_links)} unique products")
-        
-        # Scrape each product (limit for testing)
-        max_products = 100  # Adjust as needed
-        for i, product_url in enumerate(all_product_links[:max_products]):
-            try:
-                product_data = self.scrape_product_details(product_url)
-                if product_data and product_data.get('title'):
-                    self.scraped_data.append(product_data)
-                    self.logger.info(f"Scraped product {i+1}/{min(len(all_product_links), max_products)}: {product_data['title']}")
-                
-                self.random_delay()
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping product {product_url}: {str(e)}")
-        
-        self.logger.info(f"Completed scraping. Total products: {len(self.scraped_data)}")
-        return self.scraped_data
+        return self.crawl(self.category_urls, max_products=100)
 
 if __name__ == "__main__":
     with ChronoFinderScraper() as scraper:
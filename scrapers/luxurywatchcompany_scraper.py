@@ -9,7 +9,6 @@ Scrapes watch listings from theluxurywatchcompany.com
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
 import csv
 import json
 from datetime import datetime
@@ -109,6 +108,7 @@ class LuxuryWatchCompanyScraper(WatchScraper):
         """Scrape product URLs from category page"""
         urls = []
         try:
+            self.rate_limiter.acquire(category_url)
             response = self.session.get(category_url, headers=self.headers, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -138,7 +138,6 @@ class LuxuryWatchCompanyScraper(WatchScraper):
         for start_url in self.start_urls:
             urls = self.scrape_product_urls(start_url, max_products_per_page)
             all_urls.extend(urls)
-            time.sleep(2)  # Rate limiting
 
         # Remove duplicates
         all_urls = list(set(all_urls))
@@ -149,6 +148,7 @@ class LuxuryWatchCompanyScraper(WatchScraper):
             try:
                 self.logger.info(f"Scraping {i}/{len(all_urls)}: {url}")
                 
+                self.rate_limiter.acquire(url)
                 response = self.session.get(url, headers=self.headers, timeout=30)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -158,8 +158,6 @@ class LuxuryWatchCompanyScraper(WatchScraper):
                     watches.append(watch_data)
                     self.logger.info(f"✅ Extracted: {watch_data['title']} - £{watch_data['price']:,.0f}")
                 
-                time.sleep(1)  # Rate limiting
-                
             except Exception as e:
                 self.logger.error(f"❌ Error scraping {url}: {str(e)}")
                 continue
@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.base_scraper import BaseScraper
+from utils.url_canonical import CanonicalLinks
 import re
 
 class TrilogyJewellersScraper(BaseScraper):
@@ -28,11 +29,11 @@ class TrilogyJewellersScraper(BaseScraper):
         """Extract product links from Shopify collection page"""
         self.logger.info(f"Scraping product links from: {category_url}")
         
-        soup = self.get_page(category_url)
+        soup = self.get_page(category_url, profile='links')
         if not soup:
             return []
         
-        product_links = []
+        product_links = CanonicalLinks()
         
         # Shopify product link selectors
         link_selectors = [
@@ -49,8 +50,7 @@ class TrilogyJewellersScraper(BaseScraper):
                     href = link.get('href')
                     if href and '/products/' in href:
                         full_url = href if href.startswith('http') else f"{self.base_url}{href}"
-                        if full_url not in product_links:
-                            product_links.append(full_url)
+                        product_links.add(full_url)
                 break
         
         # Handle Shopify pagination
@@ -59,8 +59,7 @@ class TrilogyJewellersScraper(BaseScraper):
             # Try to load more products by scrolling or checking pagination
             for page in range(2, 6):  # Check up to 5 pages
                 page_url = f"{category_url}?page={page}"
-                self.random_delay()
-                page_soup = self.get_page(page_url)
+                page_soup = self.get_page(page_url, profile='links')
                 if not page_soup:
                     break
                 
@@ -78,16 +77,16 @@ class TrilogyJewellersScraper(BaseScraper):
                 if not page_links:
                     break
                 
-                product_links.extend(page_links)
+                product_links.update(page_links)
         
         self.logger.info(f"Found {len(product_links)} product links")
-        return product_links
+        return product_links.urls
     
     def scrape_product_details(self, product_url: str) -> dict:
         """Scrape Shopify product details"""
         self.logger.info(f"Scraping product: {product_url}")
         
-        soup = self.get_page(product_url)
+        soup = self.get_page(product_url, profile='product')
         if not soup:
             return {}
         
@@ -108,75 +107,82 @@ class TrilogyJewellersScraper(BaseScraper):
         }
         
         try:
-            # Extract title
-            title_selectors = [
-                '.product-single__title',
-                'h1.product__title',
-                '.product-title'
-            ]
+            # Structured data first; the selector cascades below only fill what it missed
+            structured_fields = self.apply_structured_data(soup, product_data)
             
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    product_data['title'] = self.clean_text(title_elem.get_text())
-                    break
+            # Extract title
+            if not product_data['title']:
+                title_selectors = [
+                    '.product-single__title',
+                    'h1.product__title',
+                    '.product-title'
+                ]
+                
+                for selector in title_selectors:
+                    title_elem = soup.select_one(selector)
+                    if title_elem:
+                        product_data['title'] = self.clean_text(title_elem.get_text())
+                        break
             
             # Extract price
-            price_selectors = [
-                '.product__price .money',
-                '.price .money',
-                '[data-product-price]'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.get_text()
-                    product_data['price'] = self.extract_price(price_text)
-                    if product_data['price']:
-                        break
+            if not product_data['price']:
+                price_selectors = [
+                    '.product__price .money',
+                    '.price .money',
+                    '[data-product-price]'
+                ]
+                
+                for selector in price_selectors:
+                    price_elem = soup.select_one(selector)
+                    if price_elem:
+                        price_text = price_elem.get_text()
+                        product_data['price'] = self.extract_price(price_text)
+                        if product_data['price']:
+                            break
             
             # Extract description
-            desc_selectors = [
-                '.product-single__description',
-                '.product__description',
-                '.rte'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    product_data['description'] = self.clean_text(desc_elem.get_text())
-                    break
+            if not product_data['description']:
+                desc_selectors = [
+                    '.product-single__description',
+                    '.product__description',
+                    '.rte'
+                ]
+                
+                for selector in desc_selectors:
+                    desc_elem = soup.select_one(selector)
+                    if desc_elem:
+                        product_data['description'] = self.clean_text(desc_elem.get_text())
+                        break
             
             # Extract images
-            img_selectors = [
-                '.product-single__photos img',
-                '.product__media img',
-                '.product-images img'
-            ]
-            
-            for selector in img_selectors:
-                images = soup.select(selector)
-                for img in images:
-                    src = img.get('src') or img.get('data-src')
-                    if src:
-                        # Handle Shopify image URLs
-                        if src.startswith('//'):
-                            src = f"https:{src}"
-                        elif not src.startswith('http'):
-                            src = f"{self.base_url}{src}"
-                        
-                        if src not in product_data['images']:
-                            product_data['images'].append(src)
-                break
+            if not product_data['images']:
+                img_selectors = [
+                    '.product-single__photos img',
+                    '.product__media img',
+                    '.product-images img'
+                ]
+                
+                for selector in img_selectors:
+                    images = soup.select(selector)
+                    for img in images:
+                        src = img.get('src') or img.get('data-src')
+                        if src:
+                            # Handle Shopify image URLs
+                            if src.startswith('//'):
+                                src = f"https:{src}"
+                            elif not src.startswith('http'):
+                                src = f"{self.base_url}{src}"
+                            
+                            if src not in product_data['images']:
+                                product_data['images'].append(src)
+                    break
             
             # Extract watch details
             watch_details = self.extract_watch_details(
                 product_data['title'], 
                 product_data['description']
             )
-            product_data.update(watch_details)
+            self.merge_details(product_data, watch_details)
             
             # Extract Shopify product metafields/variants
             script_tags = soup.find_all('script', type='application/json')
@@ -207,28 +213,32 @@ class TrilogyJewellersScraper(BaseScraper):
                     continue
             
             # Check availability
-            availability_selectors = [
-                '.product-form__availability',
-                '.product__availability',
-                '.stock-status'
-            ]
-            
-            for selector in availability_selectors:
-                avail_elem = soup.select_one(selector)
-                if avail_elem:
-                    product_data['availability'] = self.clean_text(avail_elem.get_text())
-                    break
-            
             if not product_data['availability']:
-                # Check if add to cart button exists
-                add_to_cart = soup.select_one('[data-add-to-cart], .btn-product-add')
-                if add_to_cart:
-                    if 'disabled' in add_to_cart.get('class', []):
-                        product_data['availability'] = 'Out of Stock'
+                availability_selectors = [
+                    '.product-form__availability',
+                    '.product__availability',
+                    '.stock-status'
+                ]
+                
+                for selector in availability_selectors:
+                    avail_elem = soup.select_one(selector)
+                    if avail_elem:
+                        product_data['availability'] = self.clean_text(avail_elem.get_text())
+                        break
+                
+                if not product_data['availability']:
+                    # Check if add to cart button exists
+                    add_to_cart = soup.select_one('[data-add-to-cart], .btn-product-add')
+                    if add_to_cart:
+                        if 'disabled' in add_to_cart.get('class', []):
+                            product_data['availability'] = 'Out of Stock'
+                        else:
+                            product_data['availability'] = 'In Stock'
                     else:
-                        product_data['availability'] = 'In Stock'
-                else:
-                    product_data['availability'] = 'Contact for Availability'
+                        product_data['availability'] = 'Contact for Availability'
+            
+            # Tally which parse path produced this product
+            self.record_parse_path(structured_fields)
             
         except Exception as e:
             self.logger.error(f"Error scraping product {product_url}: {str(e)}")
@@ -239,36 +249,7 @@ class TrilogyJewellersScraper(BaseScraper):
         """Main scraping method"""
         self.logger.info("Starting Trilogy Jewellers scraping...")
         
-        all_product_links = []
-        
-        for category_url in self.category_urls:
-            try:
-                links = self.scrape_product_links(category_url)
-                all_product_links.extend(links)
-                self.random_delay(2, 3)
-            except Exception as e:
-                self.logger.error(f"Error scraping category {category_url}: {str(e)}")
-        
-        # Remove duplicates
-        all_product_links = list(set(all_product_links))
-        self.logger.info(f"Found total {len(all_product_links)} unique products")
-        
-        # Scrape products
-        max_products = 100
-        for i, product_url in enumerate(all_product_links[:max_products]):
-            try:
-                product_data = self.scrape_product_details(product_url)
-                if product_data and product_data.get('title'):
-                    self.scraped_data.append(product_data)
-                    self.logger.info(f"Scraped product {i+1}/{min(len(all_product_links), max_products)}: {product_data['title']}")
-                
-                self.random_delay()
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping product {product_url}: {str(e)}")
-        
-        self.logger.info(f"Completed scraping. Total products: {len(self.scraped_data)}")
-        return self.scraped_data
+        return self.crawl(self.category_urls, max_products=100)
 
 if __name__ == "__main__":
     with TrilogyJewellersScraper() as scraper:
@@ -7,7 +7,6 @@ Scrapes watch listings from watchcollectors.co.uk
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
 import csv
 import json
 from datetime import datetime
@@ -18,6 +17,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.base_scraper import BaseScraper
+from utils.url_canonical import CanonicalLinks
 
 class WatchCollectorsScraper(BaseScraper):
     def __init__(self):
@@ -111,8 +111,9 @@ class WatchCollectorsScraper(BaseScraper):
 
     def scrape_product_urls(self, category_url, max_products=30):
         """Scrape product URLs from category page"""
-        urls = []
+        urls = CanonicalLinks()
         try:
+            self.rate_limiter.acquire(category_url)
             response = self.session.get(category_url, headers=self.headers, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -124,30 +125,27 @@ class WatchCollectorsScraper(BaseScraper):
                 if href and '/products/' in href:
                     if href.startswith('/'):
                         href = self.base_url + href
-                    if href not in urls:
-                        urls.append(href)
-                        if len(urls) >= max_products:
-                            break
+                    if urls.add(href) and len(urls) >= max_products:
+                        break
 
             self.logger.info(f"Found {len(urls)} product URLs from {category_url}")
 
         except Exception as e:
             self.logger.error(f"Error scraping category {category_url}: {str(e)}")
 
-        return urls
+        return urls.urls
 
     def scrape_site(self, max_products_per_page=25):
         """Scrape all watches from the site"""
         self.logger.info(f"🚀 Starting {self.site_name} scraper...")
         
-        all_urls = []
+        all_urls = CanonicalLinks()
         for start_url in self.start_urls:
             urls = self.scrape_product_urls(start_url, max_products_per_page)
-            all_urls.extend(urls)
-            time.sleep(2)  # Rate limiting
+            all_urls.update(urls)
 
         # Remove duplicates
-        all_urls = list(set(all_urls))
+        all_urls = all_urls.urls
         self.logger.info(f"📦 Found {len(all_urls)} unique product URLs")
 
         watches = []
@@ -155,6 +153,7 @@ class WatchCollectorsScraper(BaseScraper):
             try:
                 self.logger.info(f"Scraping {i}/{len(all_urls)}: {url}")
                 
+                self.rate_limiter.acquire(url)
                 response = self.session.get(url, headers=self.headers, timeout=30)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -164,8 +163,6 @@ class WatchCollectorsScraper(BaseScraper):
                     watches.append(watch_data)
                     self.logger.info(f"✅ Extracted: {watch_data['title']} - £{watch_data['price']:,.0f}")
                 
-                time.sleep(1)  # Rate limiting
-                
             except Exception as e:
                 self.logger.error(f"❌ Error scraping {url}: {str(e)}")
                 continue
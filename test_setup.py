@@ -128,6 +128,42 @@ def test_data_processing():
     except Exception as e:
         print(f"✗ Error in data processing test: {e}")
 
+def test_near_duplicates():
+    """Test near-duplicate lookup after listings are added to loaded data"""
+    print("\nTesting near-duplicate index...")
+    
+    try:
+        import pandas as pd
+        from utils.data_processor import WatchDataProcessor
+        
+        processor = WatchDataProcessor()
+        processor.df = pd.DataFrame([{
+            'title': 'Rolex Submariner Date 126610LN Black Dial Full Set 2021',
+            'description': 'Unworn, box and papers',
+            'url': 'https://a.com/products/sub-126610ln',
+            'site': 'a.com'
+        }])
+        processor.add_listings([{
+            'title': 'Omega Speedmaster Moonwatch 310.30.42.50.01.001',
+            'description': 'Hesalite crystal',
+            'url': 'https://b.com/products/speedmaster',
+            'site': 'b.com'
+        }])
+        
+        duplicates = processor.find_near_duplicates({
+            'title': 'Rolex Submariner Date 126610LN Black Dial Full Set 2021',
+            'description': 'Unworn, box and papers',
+            'url': 'https://c.com/products/rolex-submariner',
+            'site': 'c.com'
+        })
+        if len(processor.near_duplicates) == 2 and [d['watch_data']['site'] for d in duplicates] == ['a.com']:
+            print("✓ Loaded listings stay indexed after add_listings")
+        else:
+            print(f"✗ Expected the a.com listing as a duplicate, got {duplicates}")
+        
+    except Exception as e:
+        print(f"✗ Error in near-duplicate test: {e}")
+
 def test_configuration():
     """Test configuration settings"""
     print("\nTesting configuration...")
@@ -216,6 +252,7 @@ def main():
     test_configuration()
     test_basic_scraping()
     test_data_processing()
+    test_near_duplicates()
     test_sample_scraper()
     run_quick_test()
     
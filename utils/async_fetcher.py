@@ -0,0 +1,47 @@
+"""
+Asyncio fetch engine for batch page downloads
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable
+from urllib.parse import urlparse
+
+
+class AsyncFetcher:
+    """Fetch many URLs concurrently, keeping a bounded number in flight per host
+
+    Request pacing is left to fetch_fn, which is expected to go through the
+    shared per-host rate limiter.
+    """
+
+    def __init__(self, fetch_fn: Callable[[str], Any], max_in_flight_per_host: int = 4):
+        self.fetch_fn = fetch_fn
+        self.max_in_flight_per_host = max(1, max_in_flight_per_host)
+
+    def fetch_all(self, urls: Iterable[str]) -> Dict[str, Any]:
+        """Fetch all URLs and return a mapping of url -> fetch_fn result"""
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+        return asyncio.run(self._fetch_all(unique_urls))
+
+    async def _fetch_all(self, urls: list) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        hosts = {urlparse(url).netloc for url in urls}
+
+        semaphores = {host: asyncio.Semaphore(self.max_in_flight_per_host) for host in hosts}
+        executor = ThreadPoolExecutor(max_workers=len(hosts) * self.max_in_flight_per_host)
+
+        async def fetch_one(url: str):
+            host = urlparse(url).netloc
+            async with semaphores[host]:
+                result = await loop.run_in_executor(executor, self.fetch_fn, url)
+            return url, result
+
+        try:
+            results = await asyncio.gather(*(fetch_one(url) for url in urls))
+        finally:
+            executor.shutdown(wait=False)
+
+        return dict(results)
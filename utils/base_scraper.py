@@ -1,23 +1,32 @@
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
-import random
 from fake_useragent import UserAgent
-import json
-import csv
 import pandas as pd
-import re
 from urllib.parse import urljoin, urlparse
 import logging
+from concurrent.futures import Future
 from typing import List, Dict, Any, Optional
+from config.settings import Config
+from utils.async_fetcher import AsyncFetcher
+from utils.rate_limiter import get_rate_limiter
+from utils.concurrency import classify_status, get_concurrency_controller
+from utils.retry import get_circuit_breaker, get_retry_policy
+from utils.parse_pool import parse_product_page
+from utils.product_sink import open_site_sink
+from utils.text_normalization import (
+    extract_price, extract_watch_details, merge_normalization_counters, normalize_whitespace
+)
+from utils.url_canonical import canonical_url, listing_id
+from utils.http_cache import CachingAdapter, get_http_cache
+from utils.driver_pool import get_driver_pool, wait_until_ready
+from utils.shopify_adapter import ShopifyAdapter
+from utils.woocommerce_adapter import WooCommerceAdapter
+from utils.structured_data import extract_structured_product
+from utils.html_parser import parse_html
+from utils.crawl_frontier import CATEGORY, PRODUCT, get_crawl_frontier
+from utils.listing_snapshot import get_listing_snapshot, listing_card, listing_signature, product_signature
 
 class BaseScraper:
     """Base class for all watch website scrapers"""
@@ -29,7 +38,35 @@ class BaseScraper:
         self.session = requests.Session()
         self.ua = UserAgent()
         self.driver = None
+        # Pool the held driver came from, so it goes back there even after the pool is shut down
+        self._driver_pool = None
+        self.rate_limiter = get_rate_limiter()
+        self.concurrency = get_concurrency_controller()
+        self.retry_policy = get_retry_policy()
+        self.breaker = get_circuit_breaker()
         self.scraped_data = []
+        self.use_platform_api = Config.PLATFORM_APIS_ENABLED
+        self.platform = None
+        self._prefetched = {}
+        self._not_modified = set()
+        self.frontier = get_crawl_frontier()
+        self.resume = False
+        self.incremental = Config.INCREMENTAL_CRAWL['enabled']
+        self.incremental_stats = {}
+        self._listing_signatures = {}
+        self.parse_pool = None
+        self.sink = None
+        self.keep_in_memory = True
+        self.products_emitted = 0
+        self._emitted_listings = set()
+        self.parse_paths = {'structured_data': 0, 'mixed': 0, 'selectors': 0, 'platform_api': 0, 'cached': 0}
+        
+        # Revalidate pages from earlier runs instead of re-downloading them
+        self.http_cache = get_http_cache()
+        if self.http_cache:
+            adapter = CachingAdapter(self.http_cache)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -45,140 +82,231 @@ class BaseScraper:
         })
     
     def setup_driver(self):
-        """Setup Selenium WebDriver with stealth options"""
+        """Check out a headless driver from the shared pool and keep it until cleanup"""
         if self.driver:
             return self.driver
-            
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument(f'--user-agent={self.ua.random}')
         
-        # Uncomment for headless mode
-        # chrome_options.add_argument('--headless')
+        if self._driver_pool is None:
+            self._driver_pool = get_driver_pool()
+        self.driver = self._driver_pool.checkout()
+        return self.driver
+    
+    def fetch(self, url: str, log_errors: bool = True) -> Optional[requests.Response]:
+        """Fetch a URL with the shared session, retrying transient failures; None on failure"""
+        if not self.breaker.allow(url):
+            return None
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        start = time.monotonic()
+        error = None
         
-        return self.driver
+        for attempt in range(self.retry_policy.max_attempts):
+            response = None
+            try:
+                self.rate_limiter.acquire(url)
+                with self.concurrency.slot(url) as report:
+                    try:
+                        response = self.session.get(url, timeout=10)
+                    except requests.Timeout:
+                        report('timeout')
+                        raise
+                    report(classify_status(response.status_code))
+                
+                if not self.retry_policy.should_retry_status(response.status_code):
+                    # The host answered; a 404 or 403 is not a reason to stop crawling it
+                    self.breaker.record_success(url)
+                    response.raise_for_status()
+                    if getattr(response, 'from_cache', False):
+                        self._not_modified.add(url)
+                    return response
+                
+                error = f"{response.status_code} {response.reason}"
+            
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = str(e)
+            except Exception as e:
+                if log_errors:
+                    self.logger.error(f"Error fetching {url}: {str(e)}")
+                return None
+            
+            if attempt == self.retry_policy.max_attempts - 1:
+                break
+            
+            delay = self.retry_policy.delay_for(attempt, response)
+            if delay is None:
+                error = f"{error} (Retry-After too long)"
+                break
+            
+            self.breaker.record_retry(url, delay)
+            self.logger.warning(f"Retrying {url} in {delay:.1f}s after: {error}")
+            time.sleep(delay)
+        
+        if self.breaker.record_failure(url, time.monotonic() - start):
+            self.logger.error(f"Circuit breaker opened for {urlparse(url).netloc}, skipping it for the rest of the run")
+        if log_errors:
+            self.logger.error(f"Error fetching {url}: {error}")
+        return None
     
-    def get_page(self, url: str, use_selenium: bool = None) -> Optional[BeautifulSoup]:
-        """Get page content using requests or selenium"""
+    def get_page(self, url: str, use_selenium: bool = None, profile: str = None) -> Optional[BeautifulSoup]:
+        """Get page content using requests or selenium, parsing only what the profile needs"""
         if use_selenium is None:
             use_selenium = self.use_selenium
-            
+        
+        # Incremental crawls read list-level signatures, which need whole product cards
+        listing_page = self.incremental and profile == 'links'
+        if listing_page:
+            profile = None
+        
+        # Serve pages already downloaded by a prefetch batch
+        if not use_selenium and url in self._prefetched:
+            soup = parse_html(self._prefetched.pop(url), profile)
+        elif use_selenium:
+            soup = self._get_page_selenium(url, profile)
+        else:
+            response = self.fetch(url)
+            soup = parse_html(response.content, profile) if response is not None else None
+        
+        if listing_page and soup is not None:
+            self.record_listing_signatures(soup)
+        
+        return soup
+    
+    def record_listing_signatures(self, soup: BeautifulSoup):
+        """Remember a signature of each product card on a category page, keyed by product URL"""
+        for anchor in soup.find_all('a', href=True):
+            href = anchor['href']
+            full_url = canonical_url(href if href.startswith('http') else f"{self.base_url}{href}")
+            if full_url not in self._listing_signatures:
+                self._listing_signatures[full_url] = listing_signature(listing_card(anchor))
+    
+    def _get_page_selenium(self, url: str, profile: str = None) -> Optional[BeautifulSoup]:
+        """Render a page with a pooled driver, waiting on document readiness"""
+        if not self.breaker.allow(url):
+            return None
+        
+        # A scraper that called setup_driver keeps holding a driver, replaced as each one wears out
+        holding = self._driver_pool is not None
+        pool = self._driver_pool if holding else get_driver_pool()
+        
         try:
-            if use_selenium:
-                if not self.driver:
-                    self.setup_driver()
-                
-                self.driver.get(url)
-                time.sleep(random.uniform(2, 4))
-                
-                # Wait for page to load
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                html = self.driver.page_source
-                return BeautifulSoup(html, 'html.parser')
-            else:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-                
+            driver = self.setup_driver() if holding else pool.checkout()
         except Exception as e:
+            self.logger.error(f"Error starting driver for {url}: {str(e)}")
+            return None
+        
+        healthy = True
+        start = time.monotonic()
+        try:
+            self.rate_limiter.acquire(url)
+            with self.concurrency.slot(url) as report:
+                try:
+                    driver.get(url)
+                    pool.record_page(driver)
+                    wait_until_ready(driver, timeout=Config.SELENIUM_POOL['ready_timeout'])
+                except TimeoutException:
+                    report('timeout')
+                    raise
+                page_source = driver.page_source
+            self.breaker.record_success(url)
+            return parse_html(page_source, profile)
+        
+        except TimeoutException:
+            self.breaker.record_failure(url, time.monotonic() - start)
+            self.logger.error(f"Timed out waiting for {url} to load")
+            return None
+        except WebDriverException as e:
+            # A crashed or disconnected browser must not go back into the pool
+            healthy = False
+            self.breaker.record_failure(url, time.monotonic() - start)
             self.logger.error(f"Error fetching {url}: {str(e)}")
             return None
-    
-    def random_delay(self, min_delay: float = 1.0, max_delay: float = 3.0):
-        """Add random delay between requests"""
-        time.sleep(random.uniform(min_delay, max_delay))
-    
-    def extract_price(self, price_text: str) -> Optional[float]:
-        """Extract numerical price from text"""
-        if not price_text:
+        except Exception as e:
+            self.logger.error(f"Error fetching {url}: {str(e)}")
             return None
-            
-        # Remove currency symbols and clean text
-        price_clean = re.sub(r'[£$€,\s]', '', price_text.strip())
+        finally:
+            if driver is self.driver:
+                # checkin quits a broken or worn-out driver; setup_driver takes a fresh one next page
+                if not healthy or pool.worn_out(driver):
+                    pool.checkin(driver, healthy)
+                    self.driver = None
+            else:
+                pool.checkin(driver, healthy)
+    
+    def prefetch_pages(self, urls: List[str]) -> int:
+        """Download pages concurrently so later get_page calls are served from memory"""
+        if self.use_selenium:
+            return 0
         
-        # Extract numbers (including decimals)
-        price_match = re.search(r'(\d+(?:\.\d{2})?)', price_clean)
+        pending = [url for url in urls if url not in self._prefetched]
+        # The adaptive controller gates each request; the fetcher only needs room for its upper bound
+        fetcher = AsyncFetcher(
+            self.fetch,
+            max_in_flight_per_host=self.concurrency.max_for(self.base_url)
+        )
         
-        if price_match:
-            try:
-                return float(price_match.group(1))
-            except ValueError:
-                return None
+        fetched = 0
+        for url, response in fetcher.fetch_all(pending).items():
+            if response is not None:
+                self._prefetched[url] = response.content
+                fetched += 1
         
-        return None
+        return fetched
+    
+    def get_pages(self, urls: List[str], use_selenium: bool = None,
+                  profile: str = None) -> Dict[str, Optional[BeautifulSoup]]:
+        """Fetch a batch of pages concurrently and return url -> soup"""
+        if use_selenium is None:
+            use_selenium = self.use_selenium
+        
+        if not use_selenium:
+            self.prefetch_pages(urls)
+        
+        return {url: self.get_page(url, use_selenium=use_selenium, profile=profile) for url in dict.fromkeys(urls)}
+    
+    def extract_price(self, price_text: str) -> Optional[float]:
+        """Extract numerical price from text"""
+        return extract_price(price_text)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-        
-        return ' '.join(text.strip().split())
+        return normalize_whitespace(text)
     
     def extract_watch_details(self, title: str, description: str = "") -> Dict[str, str]:
         """Extract watch details from title and description"""
-        details = {
-            'brand': '',
-            'model': '',
-            'reference': '',
-            'year': '',
-            'condition': '',
-            'dial_color': '',
-            'bracelet_material': '',
-            'case_material': '',
-            'movement': ''
-        }
-        
-        text = f"{title} {description}".lower()
-        
-        # Common watch brands
-        brands = ['rolex', 'omega', 'patek philippe', 'audemars piguet', 'cartier', 
-                 'breitling', 'tag heuer', 'tudor', 'seiko', 'tissot', 'hamilton']
-        
-        for brand in brands:
-            if brand in text:
-                details['brand'] = brand.title()
-                break
-        
-        # Extract reference number (common patterns)
-        ref_patterns = [
-            r'ref[:\.\s]*(\w+)',
-            r'reference[:\.\s]*(\w+)',
-            r'\b(\d{4,6}[a-zA-Z]*)\b'
-        ]
-        
-        for pattern in ref_patterns:
-            match = re.search(pattern, text)
-            if match:
-                details['reference'] = match.group(1).upper()
-                break
-        
-        # Extract year
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
-        if year_match:
-            details['year'] = year_match.group(0)
+        return extract_watch_details(title, description)
+    
+    def apply_structured_data(self, soup: BeautifulSoup, product_data: Dict[str, Any]) -> set:
+        """Fill product_data from JSON-LD/microdata and return the fields it supplied"""
+        filled = set()
         
-        # Extract condition
-        conditions = ['new', 'unworn', 'excellent', 'very good', 'good', 'fair', 'poor']
-        for condition in conditions:
-            if condition in text:
-                details['condition'] = condition.title()
-                break
+        for field, value in extract_structured_product(soup).items():
+            if field == 'images':
+                value = [urljoin(self.base_url, src) for src in value]
+            
+            if field == 'currency':
+                product_data['currency'] = value
+            elif field in product_data and not product_data[field]:
+                product_data[field] = value
+                filled.add(field)
         
-        return details
+        return filled
+    
+    def merge_details(self, product_data: Dict[str, Any], details: Dict[str, str]):
+        """Add text-extracted watch details without overwriting fields already set"""
+        for field, value in details.items():
+            if not product_data.get(field):
+                product_data[field] = value
+    
+    def record_parse_path(self, structured_fields: set):
+        """Count whether a product came from structured data, selectors or both"""
+        if {'title', 'price'} <= structured_fields:
+            self.parse_paths['structured_data'] += 1
+        elif structured_fields:
+            self.parse_paths['mixed'] += 1
+        else:
+            self.parse_paths['selectors'] += 1
     
     def save_data(self, filename: str = None):
-        """Save scraped data to CSV and JSON"""
+        """Write scraped data to CSV and NDJSON through the streaming sinks"""
         if not self.scraped_data:
             self.logger.warning("No data to save")
             return
@@ -189,19 +317,262 @@ class BaseScraper:
         # Create data directory path (absolute)
         import os
         data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        os.makedirs(data_dir, exist_ok=True)
         
-        # Save as CSV
-        df = pd.DataFrame(self.scraped_data)
-        csv_path = os.path.join(data_dir, f"{filename}.csv")
-        df.to_csv(csv_path, index=False)
+        with open_site_sink(data_dir, filename, checkpoint_every=0, append=False) as sink:
+            for product in self.scraped_data:
+                sink.write(product)
+        
+        self.logger.info(f"Saved {len(self.scraped_data)} items to {' and '.join(sink.paths)}")
+    
+    def emit(self, product_data: Dict[str, Any]):
+        """Push a finished product to the sink, keeping it in scraped_data unless streaming only"""
+        self.products_emitted += 1
+        self._emitted_listings.add(listing_id(product_data.get('url') or ''))
+        if self.sink:
+            self.sink.write(product_data)
+        if self.keep_in_memory:
+            self.scraped_data.append(product_data)
+    
+    def scrape_product(self, product_url: str) -> Dict[str, Any]:
+        """Scrape a product page, reusing the last parsed result when the page is unchanged"""
+        if product_url in self._not_modified:
+            self._not_modified.discard(product_url)
+            cached_product = self.http_cache.get_product(product_url)
+            if cached_product:
+                self._prefetched.pop(product_url, None)
+                self.parse_paths['cached'] += 1
+                return cached_product
+        
+        product_data = self.scrape_product_details(product_url)
+        self.remember_product(product_url, product_data)
+        return product_data
+    
+    def remember_product(self, product_url: str, product_data: Dict[str, Any]):
+        """Keep the parsed product alongside the cached page so an unchanged page needs no parsing"""
+        if self.http_cache and product_data and product_data.get('title'):
+            self.http_cache.put_product(product_url, product_data)
+    
+    def parse_spec(self) -> tuple:
+        """How a parse worker process rebuilds this scraper: (class, constructor args)"""
+        return type(self), ()
+    
+    def submit_parse(self, product_url: str) -> Optional[Future]:
+        """Hand a prefetched product page to the parse pool, or None to parse it in-process"""
+        if self.parse_pool is None or product_url in self._not_modified or product_url not in self._prefetched:
+            return None
+        return self.parse_pool.submit(parse_product_page, self.parse_spec(), product_url, self._prefetched.pop(product_url))
+    
+    def collect_parse(self, product_url: str, job: Optional[Future]) -> Dict[str, Any]:
+        """Product for a URL, from its parse-pool job when it has one"""
+        if job is None:
+            return self.scrape_product(product_url)
+        
+        product_data, parse_path, counters = job.result()
+        merge_normalization_counters(counters)
+        if parse_path:
+            self.parse_paths[parse_path] += 1
+        self.remember_product(product_url, product_data)
+        return product_data
+    
+    def scrape_via_api(self, category_urls: List[str], max_products: int = 100) -> Optional[List[Dict[str, Any]]]:
+        """Use the store platform's product API when the site exposes one"""
+        if not self.use_platform_api:
+            return None
+        
+        for adapter_class in (ShopifyAdapter, WooCommerceAdapter):
+            adapter = adapter_class(self)
+            if not adapter.detect():
+                continue
+            
+            self.platform = adapter.platform
+            self.logger.info(f"Detected {self.platform} store, reading its product API for {self.site_name}")
+            
+            try:
+                return adapter.scrape(category_urls, max_products)
+            except Exception as e:
+                self.logger.error(f"{self.platform} API scrape failed, falling back to HTML: {str(e)}")
+                return None
+        
+        return None
+    
+    def crawl_complete(self, category_urls: List[str]) -> bool:
+        """Whether the frontier shows every category and product of the last run finished"""
+        known_categories = set(self.frontier.urls(self.site_name, CATEGORY))
+        return (
+            set(category_urls) <= known_categories
+            and not self.frontier.pending(self.site_name, CATEGORY)
+            and not self.frontier.pending(self.site_name, PRODUCT)
+        )
+    
+    def reuse_unchanged_listings(self, product_urls: List[str], all_product_links: List[str],
+                                 harvest_complete: bool) -> int:
+        """Carry over products whose category-page signature is unchanged since the last snapshot"""
+        snapshot = get_listing_snapshot()
+        previous = snapshot.listings(self.site_name)
+        stats = {'new': 0, 'changed': 0, 'unchanged': 0, 'removed': 0}
+        unchanged = []
+        
+        for url in product_urls:
+            signature = self._listing_signatures.get(url)
+            known = previous.get(url)
+            if not known or known['status'] != 'active':
+                stats['new'] += 1
+            elif signature and known['data'] and known['signature'] == signature:
+                stats['unchanged'] += 1
+                unchanged.append(url)
+                if not self.frontier.is_done(url):
+                    self.emit(known['data'])
+                    self.frontier.checkpoint_product(self.site_name, url, known['data'])
+            else:
+                stats['changed'] += 1
+        
+        snapshot.touch(unchanged)
+        
+        # A failed category page would make its listings look sold, so only diff complete harvests
+        if harvest_complete:
+            removed = snapshot.mark_removed(self.site_name, all_product_links)
+            stats['removed'] = len(removed)
+            for url in removed:
+                self.logger.info(f"Listing no longer on category pages, marked sold/removed: {url}")
+        
+        self.incremental_stats = stats
+        self.logger.info(
+            f"Incremental crawl of {self.site_name}: {stats['new']} new, {stats['changed']} changed, "
+            f"{stats['unchanged']} unchanged, {stats['removed']} removed"
+        )
+        return stats['unchanged']
+    
+    def update_snapshot_from_api(self, api_products: List[Dict[str, Any]], max_products: int):
+        """Record API products in the listing snapshot and flag ones that left the catalog"""
+        snapshot = get_listing_snapshot()
+        previous = snapshot.listings(self.site_name)
+        stats = {'new': 0, 'changed': 0, 'unchanged': 0, 'removed': 0}
+        
+        for product_data in api_products:
+            signature = product_signature(product_data)
+            known = previous.get(product_data['url'])
+            if not known or known['status'] != 'active':
+                stats['new'] += 1
+            elif known['signature'] == signature:
+                stats['unchanged'] += 1
+            else:
+                stats['changed'] += 1
+            snapshot.upsert(self.site_name, product_data['url'], signature, product_data)
+        
+        # A capped read says nothing about the listings past the cap
+        if len(api_products) < max_products:
+            stats['removed'] = len(snapshot.mark_removed(self.site_name, [p['url'] for p in api_products]))
+        
+        self.incremental_stats = stats
+    
+    def crawl(self, category_urls: List[str], max_products: int = 100) -> List[Dict[str, Any]]:
+        """Harvest product links from category pages, then scrape each product, checkpointing as it goes"""
+        if self.resume:
+            restored = self.frontier.products(self.site_name)
+            for product_data in restored:
+                self.emit(product_data)
+            if restored:
+                self.logger.info(f"Restored {len(restored)} checkpointed products for {self.site_name}")
+            
+            if restored and self.crawl_complete(category_urls):
+                self.logger.info(f"Previous crawl of {self.site_name} already finished, nothing to resume")
+                return self.finish_crawl()
+        else:
+            self.frontier.reset(self.site_name)
+        
+        self.frontier.add_urls(self.site_name, category_urls, CATEGORY)
         
-        # Save as JSON
-        json_path = os.path.join(data_dir, f"{filename}.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
+        api_products = self.scrape_via_api(category_urls, max_products)
+        if api_products:
+            self.parse_paths['platform_api'] += len(api_products)
+            for product_data in api_products:
+                if listing_id(product_data['url']) not in self._emitted_listings:
+                    self.emit(product_data)
+                    self.frontier.checkpoint_product(self.site_name, product_data['url'], product_data)
+            if self.incremental:
+                self.update_snapshot_from_api(api_products, max_products)
+            for category_url in category_urls:
+                self.frontier.mark_done(category_url)
+            self.logger.info(f"Completed scraping via {self.platform} API. Total products: {self.products_emitted}")
+            return self.finish_crawl()
         
-        self.logger.info(f"Saved {len(self.scraped_data)} items to {csv_path} and {json_path}")
+        pending_categories = self.frontier.pending(self.site_name, CATEGORY)
+        self.prefetch_pages(pending_categories)
+        
+        for category_url in pending_categories:
+            try:
+                links = self.scrape_product_links(category_url)
+                self.frontier.add_urls(self.site_name, links, PRODUCT)
+                if links:
+                    self.frontier.mark_done(category_url)
+                else:
+                    self.frontier.mark_failed(category_url)
+            except Exception as e:
+                self.frontier.mark_failed(category_url)
+                self.logger.error(f"Error scraping category {category_url}: {str(e)}")
+        
+        # The frontier keeps product URLs unique, in discovery order
+        all_product_links = self.frontier.urls(self.site_name, PRODUCT)
+        self.logger.info(f"Found total {len(all_product_links)} unique products")
+        
+        if self.incremental:
+            harvest_complete = not self.frontier.pending(self.site_name, CATEGORY)
+            self.reuse_unchanged_listings(all_product_links[:max_products], all_product_links, harvest_complete)
+        
+        pending_products = set(self.frontier.pending(self.site_name, PRODUCT))
+        product_urls = [url for url in all_product_links[:max_products] if url in pending_products]
+        if self.resume:
+            self.logger.info(f"Resuming {self.site_name}: {len(product_urls)} products left to scrape")
+        
+        batch_size = Config.FETCH_SETTINGS['batch_size']
+        batches = [product_urls[start:start + batch_size] for start in range(0, len(product_urls), batch_size)]
+        if batches:
+            self.prefetch_pages(batches[0])
+        
+        for index, batch in enumerate(batches):
+            start = index * batch_size
+            if self.breaker.is_open(self.base_url):
+                # Unscraped URLs stay pending in the frontier for a later --resume
+                self.logger.error(f"Circuit open for {self.site_name}, leaving {len(product_urls) - start} products unscraped")
+                break
+            
+            # Parse workers chew on this batch while the next one downloads
+            jobs = {product_url: self.submit_parse(product_url) for product_url in batch}
+            if index + 1 < len(batches):
+                self.prefetch_pages(batches[index + 1])
+            
+            for i, product_url in enumerate(batch, start=start):
+                try:
+                    product_data = self.collect_parse(product_url, jobs[product_url])
+                    if product_data and product_data.get('title'):
+                        self.emit(product_data)
+                        self.frontier.checkpoint_product(self.site_name, product_url, product_data)
+                        if self.incremental:
+                            get_listing_snapshot().upsert(
+                                self.site_name, product_url, self._listing_signatures.get(product_url), product_data
+                            )
+                        self.logger.info(f"Scraped product {i+1}/{len(product_urls)}: {product_data['title']}")
+                    else:
+                        self.frontier.mark_failed(product_url)
+                    
+                except Exception as e:
+                    self.frontier.mark_failed(product_url)
+                    self.logger.error(f"Error scraping product {product_url}: {str(e)}")
+            
+            for product_url in batch:
+                self._prefetched.pop(product_url, None)
+            
+            if self.sink:
+                self.sink.checkpoint()
+        
+        self.logger.info(f"Completed scraping. Total products: {self.products_emitted}")
+        return self.finish_crawl()
+    
+    def finish_crawl(self) -> List[Dict[str, Any]]:
+        """Flush the sink and return whatever products were kept in memory"""
+        if self.sink:
+            self.sink.checkpoint()
+        return self.scraped_data
     
     def scrape(self) -> List[Dict[str, Any]]:
         """Main scraping method - to be implemented by subclasses"""
@@ -210,7 +581,9 @@ class BaseScraper:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            self._driver_pool.checkin(self.driver)
+            self.driver = None
+        self._driver_pool = None
         
         if self.session:
             self.session.close()
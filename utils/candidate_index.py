@@ -0,0 +1,111 @@
+"""
+Blocking index that narrows watch matching to plausible candidate pairs
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Words that appear in most listings and would put everything into one block
+STOP_TOKENS = {
+    'watch', 'watches', 'mens', 'ladies', 'womens', 'automatic', 'steel', 'stainless', 'gold',
+    'dial', 'with', 'and', 'the', 'box', 'papers', 'full', 'set', 'unworn', 'new', 'pre', 'owned',
+    'ref', 'reference', 'date', 'black', 'blue', 'white', 'silver', 'green'
+}
+
+
+def normalize_brand(value) -> str:
+    return ''.join(TOKEN_RE.findall(str(value or '').lower()))
+
+
+def normalize_reference(value) -> str:
+    if value is None or value != value:  # None or NaN
+        return ''
+    return ''.join(TOKEN_RE.findall(str(value).lower()))
+
+
+def model_tokens(watch: Dict[str, Any]) -> Set[str]:
+    """Distinctive model words, falling back to the title when the model is missing"""
+    text = watch.get('model') or watch.get('title') or ''
+    brand_words = set(TOKEN_RE.findall(str(watch.get('brand') or '').lower()))
+    return {
+        token for token in TOKEN_RE.findall(str(text).lower())
+        if len(token) >= 3 and not token.isdigit() and token not in STOP_TOKENS and token not in brand_words
+    }
+
+
+class CandidateIndex:
+    """Targets bucketed by reference prefix and by brand + model token"""
+
+    def __init__(self, watches: Iterable[Dict[str, Any]] = (), reference_prefix: int = 4, max_block: int = 500):
+        self.reference_prefix = reference_prefix
+        self.max_block = max_block
+        self.blocks = defaultdict(list)
+        self.size = 0
+        # Targets with nothing to block on can still be matched, so they are always candidates
+        self.unblocked = []
+        for watch in watches:
+            self.add(watch)
+
+    def _reference_keys(self, watch: Dict[str, Any]) -> Set[tuple]:
+        reference = normalize_reference(watch.get('reference'))
+        if len(reference) >= self.reference_prefix:
+            return {('ref', reference[:self.reference_prefix])}
+        return set()
+
+    def keys(self, watch: Dict[str, Any]) -> Set[tuple]:
+        """Blocks a target is indexed under; model tokens go in a brand block and a brand-agnostic one"""
+        keys = self._reference_keys(watch)
+        brand = normalize_brand(watch.get('brand'))
+        for token in model_tokens(watch):
+            keys.add(('model', brand, token))
+            keys.add(('model', None, token))
+        return keys
+
+    def query_keys(self, watch: Dict[str, Any]) -> Set[tuple]:
+        """Blocks to look in: the watch's brand plus brandless targets, or any brand when it has none"""
+        keys = self._reference_keys(watch)
+        brand = normalize_brand(watch.get('brand'))
+        for token in model_tokens(watch):
+            if brand:
+                keys.add(('model', brand, token))
+                keys.add(('model', '', token))
+            else:
+                keys.add(('model', None, token))
+        return keys
+
+    def add(self, watch: Dict[str, Any]) -> int:
+        """Index a target and return its position"""
+        position = self.size
+        self.size += 1
+        keys = self.keys(watch)
+        if not keys:
+            self.unblocked.append(position)
+        for key in keys:
+            self.blocks[key].append(position)
+        return position
+
+    def candidates(self, watch: Dict[str, Any]) -> List[int]:
+        """Positions of targets sharing a block with the watch, in insertion order"""
+        keys = self.query_keys(watch)
+        if not keys:
+            return list(range(self.size))
+
+        found = set(self.unblocked)
+        for key in keys:
+            block = self.blocks.get(key, ())
+            # Oversized blocks say little about a match; a reference block is still worth scanning
+            if len(block) <= self.max_block or key[0] == 'ref':
+                found.update(block)
+        return sorted(found)
+
+    def stats(self) -> Dict[str, Any]:
+        sizes = [len(block) for key, block in self.blocks.items() if key[:2] != ('model', None)]
+        return {
+            'targets': self.size,
+            'blocks': len(sizes),
+            'largest_block': max(sizes) if sizes else 0,
+            'unblocked': len(self.unblocked)
+        }
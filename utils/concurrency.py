@@ -0,0 +1,208 @@
+"""
+AIMD adaptive per-host concurrency driven by latency and error responses
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from utils.rate_limiter import normalize_host
+
+# Response statuses that mean the host wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+
+class HostConcurrency:
+    """Concurrency limit for one host: +1 per clean round, multiplicative cut on congestion"""
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 4, initial: int = 2,
+                 target_p95: float = 3.0, window: int = 20, decrease_factor: float = 0.5):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.target_p95 = target_p95
+        self.decrease_factor = decrease_factor
+        self.latencies = deque(maxlen=window)
+
+        self.in_flight = 0
+        self.started = time.monotonic()
+        self.history = [(0.0, int(self.limit))]
+        self.counters = {'requests': 0, 'throttled': 0, 'timeouts': 0, 'errors': 0, 'increases': 0, 'decreases': 0}
+
+        # Congestion signals from requests already in flight when we cut count as the same event
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until the host is below its current limit"""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float, outcome: str = 'ok'):
+        """Record a finished request and adjust the limit"""
+        with self._cond:
+            # Only grow a limit the host was actually using
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            self.counters['requests'] += 1
+            self.latencies.append(latency)
+
+            if outcome == 'throttled':
+                self.counters['throttled'] += 1
+                self._decrease()
+            elif outcome == 'timeout':
+                self.counters['timeouts'] += 1
+                self._decrease()
+            elif outcome == 'error':
+                self.counters['errors'] += 1
+            elif len(self.latencies) >= min(5, self.latencies.maxlen) and self.p95() > self.target_p95:
+                self._decrease()
+            elif saturated:
+                self._increase()
+
+            self._cond.notify_all()
+
+    def p95(self) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def _increase(self):
+        # Additive increase: about +1 once every slot has completed a request cleanly
+        before = int(self.limit)
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        if int(self.limit) != before:
+            self.counters['increases'] += 1
+            self._record_change()
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown():
+            return
+        self._last_decrease = now
+
+        before = int(self.limit)
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        # Latency samples from before the cut no longer describe the new load
+        self.latencies.clear()
+        if int(self.limit) != before:
+            self.counters['decreases'] += 1
+            self._record_change()
+
+    def _cooldown(self) -> float:
+        return self.p95() or 1.0
+
+    def _record_change(self):
+        self.history.append((round(time.monotonic() - self.started, 2), int(self.limit)))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'limit': int(self.limit),
+                'min': self.min_limit,
+                'max': self.max_limit,
+                'p95_latency_seconds': round(self.p95(), 3),
+                **self.counters,
+                'history': [list(point) for point in self.history]
+            }
+
+
+class AdaptiveConcurrency:
+    """Per-host AIMD controllers, bounded per site"""
+
+    def __init__(self, host_bounds: Optional[Dict[str, Dict[str, int]]] = None,
+                 default_bounds: Optional[Dict[str, int]] = None, enabled: bool = True, **settings):
+        self.host_bounds = {normalize_host(host): bounds for host, bounds in (host_bounds or {}).items()}
+        self.default_bounds = default_bounds or {'min': 1, 'max': 4}
+        self.enabled = enabled
+        self.settings = settings
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> HostConcurrency:
+        host = normalize_host(urlparse(url).netloc or url)
+        with self._lock:
+            if host not in self.hosts:
+                bounds = self.host_bounds.get(host, self.default_bounds)
+                self.hosts[host] = HostConcurrency(
+                    min_limit=bounds.get('min', 1),
+                    max_limit=bounds.get('max', self.default_bounds['max']),
+                    **self.settings
+                )
+            return self.hosts[host]
+
+    def max_for(self, url: str) -> int:
+        """Upper bound on in-flight requests for the URL's host"""
+        return self.host(url).max_limit
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's concurrency slots; call report(outcome) before leaving"""
+        if not self.enabled:
+            yield lambda outcome='ok': None
+            return
+
+        controller = self.host(url)
+        outcome = {'value': 'ok'}
+
+        def report(value: str = 'ok'):
+            outcome['value'] = value
+
+        controller.acquire()
+        start = time.monotonic()
+        try:
+            yield report
+        except Exception:
+            if outcome['value'] == 'ok':
+                outcome['value'] = 'error'
+            raise
+        finally:
+            controller.release(time.monotonic() - start, outcome['value'])
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, p95 and limit history per host"""
+        with self._lock:
+            hosts = dict(self.hosts)
+        return {host: controller.stats() for host, controller in hosts.items()}
+
+
+def classify_status(status_code: int) -> str:
+    return 'throttled' if status_code in THROTTLE_STATUSES else 'ok'
+
+
+_concurrency = None
+_concurrency_lock = threading.Lock()
+
+
+def get_concurrency_controller() -> AdaptiveConcurrency:
+    """Process-wide controller built from Config.TARGET_SITES and Config.ADAPTIVE_CONCURRENCY"""
+    global _concurrency
+
+    with _concurrency_lock:
+        if _concurrency is None:
+            from config.settings import Config
+
+            settings = Config.ADAPTIVE_CONCURRENCY
+            host_bounds = {
+                urlparse(site['base_url']).netloc: site['concurrency']
+                for site in Config.TARGET_SITES.values()
+                if 'concurrency' in site
+            }
+            _concurrency = AdaptiveConcurrency(
+                host_bounds=host_bounds,
+                default_bounds={'min': 1, 'max': Config.FETCH_SETTINGS['max_in_flight_per_host']},
+                enabled=settings['enabled'],
+                initial=settings['initial'],
+                target_p95=settings['target_p95_seconds'],
+                window=settings['window'],
+                decrease_factor=settings['decrease_factor']
+            )
+
+    return _concurrency
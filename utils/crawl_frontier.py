@@ -0,0 +1,165 @@
+"""
+Persistent SQLite crawl frontier with per-product checkpoints
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List
+
+CATEGORY = 'category'
+PRODUCT = 'product'
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class CrawlFrontier:
+    """Discovered URLs with status, attempts and last fetch time, plus scraped products"""
+
+    def __init__(self, db_path: str, max_attempts: int = 3):
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                discovered_at REAL,
+                last_fetched REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_urls_site_kind ON urls (site, kind, status);
+            CREATE TABLE IF NOT EXISTS products (
+                url TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                data TEXT,
+                scraped_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_products_site ON products (site);
+        """)
+
+    def reset(self, site: str):
+        """Forget a site's frontier so the next crawl starts from scratch"""
+        with self._lock:
+            self._conn.execute("DELETE FROM urls WHERE site = ?", (site,))
+            self._conn.execute("DELETE FROM products WHERE site = ?", (site,))
+            self._conn.commit()
+
+    def add_urls(self, site: str, urls: List[str], kind: str = PRODUCT) -> int:
+        """Record newly discovered URLs, keeping the state of ones already known"""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, site, kind, discovered_at) VALUES (?, ?, ?, ?)",
+                [(url, site, kind, now) for url in urls]
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def urls(self, site: str, kind: str = PRODUCT) -> List[str]:
+        """All known URLs of a kind in discovery order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM urls WHERE site = ? AND kind = ? ORDER BY discovered_at, rowid",
+                (site, kind)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def pending(self, site: str, kind: str = PRODUCT) -> List[str]:
+        """URLs still to fetch: never finished and not out of attempts"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM urls WHERE site = ? AND kind = ? AND status != ? AND attempts < ? "
+                "ORDER BY discovered_at, rowid",
+                (site, kind, DONE, self.max_attempts)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def is_done(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM urls WHERE url = ?", (url,)).fetchone()
+        return bool(row) and row[0] == DONE
+
+    def _set_status(self, url: str, status: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE urls SET status = ?, attempts = attempts + 1, last_fetched = ? WHERE url = ?",
+                (status, time.time(), url)
+            )
+            self._conn.commit()
+
+    def mark_done(self, url: str):
+        self._set_status(url, DONE)
+
+    def mark_failed(self, url: str):
+        self._set_status(url, FAILED)
+
+    def checkpoint_product(self, site: str, url: str, product: Dict[str, Any]):
+        """Persist a scraped product and mark its URL done in one transaction"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO products (url, site, data, scraped_at) VALUES (?, ?, ?, ?)",
+                (url, site, json.dumps(product, ensure_ascii=False, default=str), now)
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO urls (url, site, kind, discovered_at) VALUES (?, ?, ?, ?)",
+                (url, site, PRODUCT, now)
+            )
+            self._conn.execute(
+                "UPDATE urls SET status = ?, attempts = attempts + 1, last_fetched = ? WHERE url = ?",
+                (DONE, now, url)
+            )
+            self._conn.commit()
+
+    def products(self, site: str) -> List[Dict[str, Any]]:
+        """Products checkpointed for a site, in scrape order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM products WHERE site = ? ORDER BY scraped_at, rowid", (site,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def stats(self, site: str = None) -> Dict[str, int]:
+        """URL counts by status, optionally for a single site"""
+        query = "SELECT status, COUNT(*) FROM urls"
+        params = ()
+        if site:
+            query += " WHERE site = ?"
+            params = (site,)
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY status", params).fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_crawl_frontier = None
+_crawl_frontier_lock = threading.Lock()
+
+
+def get_crawl_frontier() -> CrawlFrontier:
+    """Process-wide crawl frontier at Config.CRAWL_FRONTIER['path']"""
+    global _crawl_frontier
+
+    with _crawl_frontier_lock:
+        if _crawl_frontier is None:
+            from config.settings import Config
+
+            _crawl_frontier = CrawlFrontier(
+                Config.CRAWL_FRONTIER['path'],
+                max_attempts=Config.CRAWL_FRONTIER['max_attempts']
+            )
+
+    return _crawl_frontier
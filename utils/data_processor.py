@@ -2,31 +2,65 @@
 Data processing utilities for watch data analysis and matching
 """
 
+import os
 import pandas as pd
 import numpy as np
 import re
 from typing import List, Dict, Any, Tuple
-from difflib import SequenceMatcher
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
 import json
 
+from utils.candidate_index import CandidateIndex
+from utils.near_duplicates import NearDuplicateIndex
+from utils.reference_catalog import resolve_reference
+from utils.url_canonical import listing_id
+from utils.similarity import matching_weights, score_matrix, score_pairs, top_k
+from utils.vocabulary import MATCHER, VOCABULARY, find_brand
+
+# Reference patterns in priority order, matched case-insensitively
+REFERENCE_PATTERNS = [
+    # Bare 5-6 digit refs such as Rolex 116xxx/126xxx, with any letter suffix
+    re.compile(r'\b(\d{5,6}[a-z]*)\b', re.I),
+    # Labelled: "Ref: 5711/1A", "Reference A17376", "Reference 310.30.42.50.01.001"
+    re.compile(r'\bref(?:erence)?[:.\s]*(\w*\d(?:[\w/]|\.(?=\w))*)', re.I),
+    # Omega-style dotted groups
+    re.compile(r'\b(\d{3}\.\d{2}\.\d{2}(?:\.\d{2}\.\d{2}\.\d{3})?)\b', re.I)
+]
+
+# Brands the title fallback has always matched, in its order; a later one overrides an earlier one.
+# Other vocabulary brands are tried before these, so they only fill titles none of these match
+TITLE_BRANDS = ['Rolex', 'Omega', 'Patek Philippe', 'Audemars Piguet', 'Cartier', 'Breitling', 'TAG Heuer',
+                'Tudor', 'IWC', 'Jaeger-LeCoultre', 'Vacheron Constantin', 'Richard Mille']
+
 class WatchDataProcessor:
     """Process and analyze scraped watch data"""
     
     def __init__(self, data_file: str = None):
         self.df = None
+        self.near_duplicates = None
         if data_file:
             self.load_data(data_file)
     
-    def load_data(self, file_path: str):
-        """Load watch data from CSV or JSON file"""
-        if file_path.endswith('.csv'):
-            self.df = pd.read_csv(file_path)
-        elif file_path.endswith('.json'):
-            self.df = pd.read_json(file_path)
+    def load_data(self, file_path: str, columns: List[str] = None, run_id: str = 'latest'):
+        """Load watch data from a Parquet snapshot directory, CSV, JSON or NDJSON file"""
+        if os.path.isdir(file_path) or file_path.endswith('.parquet'):
+            from utils.snapshot_store import read_snapshot
+            
+            if os.path.isdir(file_path):
+                self.df = read_snapshot(file_path, columns=columns, run_id=run_id)
+            else:
+                self.df = pd.read_parquet(file_path, columns=columns)
+        elif file_path.endswith('.csv'):
+            self.df = pd.read_csv(file_path, usecols=columns)
+        elif file_path.endswith(('.json', '.ndjson')):
+            self.df = pd.read_json(file_path, lines=file_path.endswith('.ndjson'))
+            if columns:
+                self.df = self.df[columns]
         else:
-            raise ValueError("Unsupported file format. Use CSV or JSON.")
+            raise ValueError("Unsupported file format. Use a snapshot directory, Parquet, CSV, JSON or NDJSON.")
         
+        self.near_duplicates = None
         print(f"Loaded {len(self.df)} watches from {file_path}")
     
     def clean_data(self):
@@ -36,7 +70,7 @@ class WatchDataProcessor:
         
         # Remove duplicates
         initial_count = len(self.df)
-        self.df = self.df.drop_duplicates(subset=['url'], keep='first')
+        self.df = self.df[~self.df['url'].map(listing_id).duplicated()]
         print(f"Removed {initial_count - len(self.df)} duplicates")
         
         # Clean text fields
@@ -61,56 +95,43 @@ class WatchDataProcessor:
     
     def standardize_brands(self):
         """Standardize brand names"""
-        brand_mapping = {
-            'rolex': 'Rolex',
-            'omega': 'Omega',
-            'patek philippe': 'Patek Philippe',
-            'audemars piguet': 'Audemars Piguet',
-            'cartier': 'Cartier',
-            'breitling': 'Breitling',
-            'tag heuer': 'TAG Heuer',
-            'tudor': 'Tudor',
-            'iwc': 'IWC',
-            'jaeger-lecoultre': 'Jaeger-LeCoultre',
-            'vacheron constantin': 'Vacheron Constantin',
-            'richard mille': 'Richard Mille'
-        }
-        
         if 'brand' in self.df.columns:
-            # First try exact mapping
-            self.df['brand'] = self.df['brand'].str.lower().map(brand_mapping).fillna(self.df['brand'])
+            # First try exact mapping onto the shared vocabulary's canonical names
+            self.df['brand'] = self.df['brand'].map(
+                lambda brand: MATCHER.canonical('brand', brand) if isinstance(brand, str) else None
+            ).fillna(self.df['brand'])
             
-            # Extract brand from title if missing
+            # Extract brand from title if missing; a later brand overrides an earlier one
+            # ("Grand Seiko" over "Seiko"), with TITLE_BRANDS last so they keep their priority
             mask = self.df['brand'].isna()
             if mask.any():
-                for brand_key, brand_value in brand_mapping.items():
-                    title_mask = self.df['title'].str.lower().str.contains(brand_key, na=False)
-                    self.df.loc[mask & title_mask, 'brand'] = brand_value
+                titles = self.df.loc[mask, 'title'].str.lower()
+                order = [brand for brand in VOCABULARY['brand'] if brand not in TITLE_BRANDS] + TITLE_BRANDS
+                for brand in order:
+                    spellings = VOCABULARY['brand'][brand]
+                    found = titles.str.contains('|'.join(map(re.escape, spellings)), na=False)
+                    self.df.loc[found[found].index, 'brand'] = brand
     
     def extract_references(self):
         """Extract watch reference numbers from titles and descriptions"""
         if 'reference' not in self.df.columns:
             self.df['reference'] = ''
         
-        # Common reference patterns
-        patterns = [
-            r'\b(\d{5,6}[A-Z]*)\b',  # 5-6 digit refs
-            r'\bRef[:\.\s]*(\w+)',    # Ref: pattern
-            r'\bReference[:\.\s]*(\w+)',  # Reference: pattern
-            r'\b(116\d{3})\b',        # Rolex 6-digit
-            r'\b(126\d{3})\b',        # Rolex new 6-digit
-            r'\b(\d{3}\.\d{2}\.\d{2})\b'  # Omega style
-        ]
+        missing = self.df['reference'].isna() | (self.df['reference'] == '')
+        if not missing.any():
+            return
         
-        for idx, row in self.df.iterrows():
-            if pd.isna(row['reference']) or row['reference'] == '':
-                text = f"{row['title']} {row['description']}".lower()
-                
-                for pattern in patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        self.df.at[idx, 'reference'] = match.group(1).upper()
-                        break
+        text = self.df.loc[missing, 'title'].fillna('').astype(str)
+        if 'description' in self.df.columns:
+            text = text + ' ' + self.df.loc[missing, 'description'].fillna('').astype(str)
+        
+        # Each pass only scans rows the earlier passes left empty
+        for pattern in REFERENCE_PATTERNS:
+            found = text.str.extract(pattern, expand=False).dropna()
+            self.df.loc[found.index, 'reference'] = found.str.upper()
+            text = text.drop(found.index)
+            if text.empty:
+                break
     
     def generate_statistics(self) -> Dict[str, Any]:
         """Generate comprehensive statistics about the watch data"""
@@ -159,54 +180,109 @@ class WatchDataProcessor:
     
     def find_similar_watches(self, watch_data: Dict[str, Any], threshold: float = 0.8) -> List[Dict[str, Any]]:
         """Find similar watches based on brand, model, and reference"""
-        if self.df is None:
+        if self.df is None or self.df.empty:
             return []
         
-        similar_watches = []
-        
-        target_brand = watch_data.get('brand', '').lower()
-        target_model = watch_data.get('model', '').lower()
-        target_ref = watch_data.get('reference', '').lower()
-        target_title = watch_data.get('title', '').lower()
+        target_brand = str(watch_data.get('brand') or '').lower()
+        target_model = str(watch_data.get('model') or '').lower()
+        target_ref = str(watch_data.get('reference') or '').lower()
+        target_title = str(watch_data.get('title') or '').lower()
+        
+        def column(name):
+            if name not in self.df.columns:
+                return pd.Series('', index=self.df.index)
+            return self.df[name].astype(str).str.lower()
+        
+        scores = np.zeros(len(self.df))
+        factors = {}
+        
+        # Brand and reference matching
+        if target_brand:
+            factors['brand'] = (column('brand') == target_brand).to_numpy()
+            scores += factors['brand'] * 0.4
+        if target_ref:
+            factors['reference'] = (column('reference') == target_ref).to_numpy()
+            scores += factors['reference'] * 0.4
+        
+        # Model matching
+        if target_model:
+            factors['model'] = column('model').str.contains(target_model, regex=False).to_numpy()
+            scores += factors['model'] * 0.2
+        
+        # Title similarity, scored against every row in one native call
+        title_similarity = cdist([target_title], column('title').tolist(), scorer=fuzz.ratio, workers=-1)[0] / 100
+        factors['title'] = title_similarity > 0.7
+        scores += np.where(factors['title'], title_similarity * 0.3, 0)
         
-        for idx, row in self.df.iterrows():
-            similarity_score = 0
-            match_factors = []
-            
-            # Brand matching
-            if target_brand and str(row['brand']).lower() == target_brand:
-                similarity_score += 0.4
-                match_factors.append('brand')
-            
-            # Reference matching
-            if target_ref and str(row['reference']).lower() == target_ref:
-                similarity_score += 0.4
-                match_factors.append('reference')
-            
-            # Model matching
-            if target_model and target_model in str(row['model']).lower():
-                similarity_score += 0.2
-                match_factors.append('model')
-            
-            # Title similarity
-            title_similarity = fuzz.ratio(target_title, str(row['title']).lower()) / 100
-            if title_similarity > 0.7:
-                similarity_score += title_similarity * 0.3
-                match_factors.append('title')
-            
-            if similarity_score >= threshold:
-                similar_watches.append({
-                    'index': idx,
-                    'similarity_score': similarity_score,
-                    'match_factors': match_factors,
-                    'watch_data': row.to_dict()
-                })
+        similar_watches = []
+        for position in np.flatnonzero(scores >= threshold):
+            similar_watches.append({
+                'index': self.df.index[position],
+                'similarity_score': float(scores[position]),
+                'match_factors': [name for name, hits in factors.items() if hits[position]],
+                'watch_data': self.df.iloc[position].to_dict()
+            })
         
         # Sort by similarity score
         similar_watches.sort(key=lambda x: x['similarity_score'], reverse=True)
         
         return similar_watches
     
+    def index_near_duplicates(self, df: pd.DataFrame = None) -> NearDuplicateIndex:
+        """Add listings to the MinHash LSH index; rows already indexed are skipped"""
+        if self.near_duplicates is None:
+            from config.settings import Config
+            
+            self.near_duplicates = NearDuplicateIndex(**Config.NEAR_DUPLICATES)
+        
+        df = self.df if df is None else df
+        if df is not None:
+            for idx, title, description in zip(df.index, df['title'], df.get('description', [None] * len(df))):
+                if idx not in self.near_duplicates:
+                    self.near_duplicates.add(idx, {'title': title, 'description': description})
+        return self.near_duplicates
+    
+    def add_listings(self, listings: List[Dict[str, Any]]):
+        """Append newly scraped listings and index them without rebuilding the index"""
+        new_df = pd.DataFrame(listings)
+        if self.df is None:
+            self.df = new_df
+        else:
+            start = int(self.df.index.max()) + 1 if len(self.df) else 0
+            new_df.index = range(start, start + len(new_df))
+            self.df = pd.concat([self.df, new_df])
+        
+        # A first build must cover the rows loaded before these; later calls only add the new ones
+        if self.near_duplicates is None:
+            self.index_near_duplicates()
+        else:
+            self.index_near_duplicates(new_df)
+    
+    def find_near_duplicates(self, listing: Dict[str, Any], threshold: float = None,
+                             other_sites_only: bool = True) -> List[Dict[str, Any]]:
+        """Listings whose title and description are near-identical to this one, via MinHash LSH"""
+        if self.df is None or self.df.empty:
+            return []
+        
+        # Built on first use; add_listings keeps it current afterwards
+        index = self.near_duplicates if self.near_duplicates is not None else self.index_near_duplicates()
+        duplicates = []
+        for idx, similarity in index.query(listing, threshold):
+            # Rows dropped by clean_data stay in the index but are no longer results
+            if idx not in self.df.index:
+                continue
+            row = self.df.loc[idx]
+            if row.get('url') == listing.get('url'):
+                continue
+            if other_sites_only and listing.get('site') and row.get('site') == listing.get('site'):
+                continue
+            duplicates.append({
+                'index': idx,
+                'similarity': similarity,
+                'watch_data': row.to_dict()
+            })
+        return duplicates
+    
     def compare_prices(self, watch_data: Dict[str, Any]) -> Dict[str, Any]:
         """Compare prices for similar watches"""
         similar_watches = self.find_similar_watches(watch_data)
@@ -281,81 +357,119 @@ class WatchDataProcessor:
 class WatchMatcher:
     """Match watches with external sources (Chrono24, Google Shopping)"""
     
-    def __init__(self):
-        self.match_threshold = 0.8
+    def __init__(self, workers: int = -1):
+        from config.settings import Config
+        
+        self.match_threshold = Config.MATCHING['similarity_threshold']
+        self.exhaustive_max_pairs = Config.MATCHING['exhaustive_max_pairs']
+        self.weights = matching_weights()
+        self.workers = workers
     
     def calculate_similarity(self, watch1: Dict, watch2: Dict) -> float:
         """Calculate similarity between two watches"""
-        score = 0.0
-        
-        # Brand similarity (40% weight)
-        if watch1.get('brand') and watch2.get('brand'):
-            brand_sim = fuzz.ratio(
-                str(watch1['brand']).lower(),
-                str(watch2['brand']).lower()
-            ) / 100
-            score += brand_sim * 0.4
-        
-        # Reference similarity (30% weight)
-        if watch1.get('reference') and watch2.get('reference'):
-            ref_sim = fuzz.ratio(
-                str(watch1['reference']).lower(),
-                str(watch2['reference']).lower()
-            ) / 100
-            score += ref_sim * 0.3
-        
-        # Model similarity (20% weight)
-        if watch1.get('model') and watch2.get('model'):
-            model_sim = fuzz.ratio(
-                str(watch1['model']).lower(),
-                str(watch2['model']).lower()
-            ) / 100
-            score += model_sim * 0.2
-        
-        # Title similarity (10% weight)
-        if watch1.get('title') and watch2.get('title'):
-            title_sim = fuzz.ratio(
-                str(watch1['title']).lower(),
-                str(watch2['title']).lower()
-            ) / 100
-            score += title_sim * 0.1
-        
-        return score
+        pair = np.zeros(1, dtype=np.intp)
+        return float(score_pairs([watch1], [watch2], pair, pair, self.weights, workers=1)[0])
+    
+    def candidate_scores(self, source_watches: List[Dict], target_watches: List[Dict],
+                         blocking: bool = True) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """(target positions, scores) per source, scored in one batch; small problems skip blocking"""
+        if not blocking or len(source_watches) * len(target_watches) <= self.exhaustive_max_pairs:
+            matrix = score_matrix(source_watches, target_watches, self.weights, self.workers)
+            positions = np.arange(len(target_watches))
+            return [(positions, row) for row in matrix]
+        
+        index = CandidateIndex(target_watches)
+        candidates = [np.asarray(index.candidates(watch), dtype=np.intp) for watch in source_watches]
+        lengths = [len(cols) for cols in candidates]
+        rows = np.repeat(np.arange(len(source_watches)), lengths)
+        cols = np.concatenate(candidates) if candidates else np.zeros(0, dtype=np.intp)
+        scores = score_pairs(source_watches, target_watches, rows, cols, self.weights, self.workers)
+        
+        bounds = np.cumsum([0] + lengths)
+        return [(cols[start:end], scores[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+    
+    def reference_ids(self, watches: List[Dict]) -> List[str]:
+        """Catalog-resolved reference per watch, from its reference field or else its title; '' if unknown.
+        
+        Only references of the watch's own brand resolve, so a stray number cannot join two watches.
+        """
+        ids = []
+        for watch in watches:
+            title = str(watch.get('title') or '')
+            brand = MATCHER.canonical('brand', watch.get('brand') or '') or find_brand(title)
+            resolved = resolve_reference(str(watch.get('reference') or ''), brand) or \
+                resolve_reference(title, brand)
+            ids.append(resolved['reference'] if resolved else '')
+        return ids
     
-    def match_watches(self, source_watches: List[Dict], target_watches: List[Dict]) -> Dict[str, Any]:
-        """Match watches between two datasets"""
+    def match_watches(self, source_watches: List[Dict], target_watches: List[Dict],
+                      blocking: bool = True, by_reference: bool = True) -> Dict[str, Any]:
+        """Match watches between two datasets, scoring only blocked candidates unless blocking=False.
+        
+        With by_reference, watches whose references resolve to the same catalog entry are joined
+        directly and only the rest are fuzzy scored.
+        """
         matches = []
         unmatched_source = []
-        unmatched_target = list(target_watches)
-        
-        for source_watch in source_watches:
-            best_match = None
-            best_score = 0
+        matched_targets = np.zeros(len(target_watches), dtype=bool)
+        fuzzy_sources = list(range(len(source_watches)))
+        
+        if by_reference:
+            targets_by_reference = {}
+            for idx, reference in enumerate(self.reference_ids(target_watches)):
+                if reference:
+                    targets_by_reference.setdefault(reference, []).append(idx)
             
-            for i, target_watch in enumerate(unmatched_target):
-                similarity = self.calculate_similarity(source_watch, target_watch)
-                
-                if similarity > best_score and similarity >= self.match_threshold:
-                    best_score = similarity
-                    best_match = (i, target_watch, similarity)
+            fuzzy_sources = []
+            for position, reference in enumerate(self.reference_ids(source_watches)):
+                waiting = targets_by_reference.get(reference)
+                if waiting:
+                    idx = waiting.pop(0)
+                    matches.append({
+                        'source_watch': source_watches[position],
+                        'matched_watch': target_watches[idx],
+                        'similarity_score': 1.0,
+                        'match_type': 'reference'
+                    })
+                    matched_targets[idx] = True
+                else:
+                    fuzzy_sources.append(position)
+        
+        remaining = [source_watches[position] for position in fuzzy_sources]
+        for source_watch, (positions, scores) in zip(
+            remaining, self.candidate_scores(remaining, target_watches, blocking)
+        ):
+            # Best still-unmatched target; argmax keeps the earliest target on ties
+            eligible = np.where(~matched_targets[positions] & (scores >= self.match_threshold), scores, -1)
+            best = int(np.argmax(eligible)) if len(eligible) else -1
             
-            if best_match:
-                idx, matched_watch, score = best_match
+            if best >= 0 and eligible[best] > 0:
+                idx = int(positions[best])
                 matches.append({
                     'source_watch': source_watch,
-                    'matched_watch': matched_watch,
-                    'similarity_score': score
+                    'matched_watch': target_watches[idx],
+                    'similarity_score': float(scores[best]),
+                    'match_type': 'fuzzy'
                 })
-                unmatched_target.pop(idx)
+                matched_targets[idx] = True
             else:
                 unmatched_source.append(source_watch)
         
         return {
             'matches': matches,
             'unmatched_source': unmatched_source,
-            'unmatched_target': unmatched_target,
+            'unmatched_target': [watch for i, watch in enumerate(target_watches) if not matched_targets[i]],
             'match_rate': len(matches) / len(source_watches) if source_watches else 0
         }
+    
+    def top_matches(self, source_watches: List[Dict], target_watches: List[Dict],
+                    k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Up to k best targets per source above the match threshold, from the full score matrix"""
+        matrix = score_matrix(source_watches, target_watches, self.weights, self.workers)
+        return [
+            [{'matched_watch': target_watches[col], 'similarity_score': score} for col, score in row]
+            for row in top_k(matrix, k, self.match_threshold)
+        ]
 
 if __name__ == "__main__":
     # Example usage
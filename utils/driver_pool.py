@@ -0,0 +1,268 @@
+"""
+Process-wide pool of reusable headless Chrome drivers for Selenium scrapers
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from webdriver_manager.chrome import ChromeDriverManager
+from fake_useragent import UserAgent
+
+logger = logging.getLogger(__name__)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def get_driver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    global _driver_path
+
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+
+    return _driver_path
+
+
+# File extensions of each resource type
+RESOURCE_TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'mov', 'mp3', 'm3u8'],
+    'stylesheet': ['css']
+}
+
+# URL patterns for Network.setBlockedURLs, by resource type. Patterns match the whole URL, and
+# Shopify/WooCommerce CDNs version almost every asset (theme.woff2?v=123, watch.jpg?width=800),
+# so each extension needs a query-string variant as well
+RESOURCE_TYPE_PATTERNS = {
+    resource_type: [pattern for extension in extensions for pattern in (f'*.{extension}', f'*.{extension}?*')]
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()
+}
+
+# Content settings that stop Chrome fetching a resource type at all
+RESOURCE_TYPE_PREFS = {
+    'image': 'profile.managed_default_content_settings.images'
+}
+
+
+def build_block_list(settings: Dict[str, Any]) -> tuple:
+    """Translate Config.SELENIUM_BLOCKING into Chrome prefs and blocked URL patterns"""
+    if not settings.get('enabled', True):
+        return {}, []
+
+    prefs = {}
+    patterns = []
+
+    for resource_type in settings.get('resource_types', []):
+        if resource_type in RESOURCE_TYPE_PREFS:
+            prefs[RESOURCE_TYPE_PREFS[resource_type]] = 2
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+
+    for domain in settings.get('domains', []):
+        patterns.append(f"*{domain}*")
+
+    return prefs, patterns
+
+
+def wait_until_ready(driver, timeout: float = 10, ready_selector: str = None):
+    """Wait for the document to finish loading instead of sleeping a fixed time"""
+    wait = WebDriverWait(driver, timeout)
+    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+    if ready_selector:
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector)))
+    else:
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+
+class DriverPool:
+    """Check-out/check-in pool of headless drivers, recycled after a number of pages"""
+
+    def __init__(self, size: int = 2, max_pages_per_driver: int = 50,
+                 headless: bool = True, page_load_timeout: int = 30, checkout_timeout: float = 60,
+                 blocked_prefs: Optional[Dict[str, int]] = None,
+                 blocked_url_patterns: Optional[List[str]] = None):
+        self.size = max(1, size)
+        self.max_pages_per_driver = max_pages_per_driver
+        self.headless = headless
+        self.page_load_timeout = page_load_timeout
+        self.checkout_timeout = checkout_timeout
+        self.blocked_prefs = blocked_prefs or {}
+        self.blocked_url_patterns = blocked_url_patterns or []
+        self.ua = UserAgent()
+
+        self._idle = queue.Queue()
+        self._page_counts = {}
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _build_options(self) -> Options:
+        chrome_options = Options()
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument(f'--user-agent={self.ua.random}')
+
+        if self.headless:
+            chrome_options.add_argument('--headless=new')
+            chrome_options.add_argument('--window-size=1366,900')
+
+        if self.blocked_prefs:
+            chrome_options.add_experimental_option('prefs', self.blocked_prefs)
+
+        return chrome_options
+
+    def _create_driver(self):
+        service = Service(get_driver_path())
+        driver = webdriver.Chrome(service=service, options=self._build_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+        if self.blocked_url_patterns:
+            # Drop fonts, media, trackers and social widgets before they hit the wire
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_url_patterns})
+
+        return driver
+
+    def checkout(self, timeout: Optional[float] = None):
+        """Take an idle driver, starting a new one while the pool is below its size.
+
+        Waits at most timeout seconds (default checkout_timeout) for a driver to come back.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+
+        if can_create:
+            try:
+                driver = self._create_driver()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._page_counts[id(driver)] = 0
+            return driver
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No driver free after {timeout}s; all {self.size} are checked out") from None
+
+    def record_page(self, driver):
+        """Count a page load against the driver's recycle budget"""
+        with self._lock:
+            self._page_counts[id(driver)] = self._page_counts.get(id(driver), 0) + 1
+
+    def worn_out(self, driver) -> bool:
+        """Whether the driver has used up its page budget"""
+        with self._lock:
+            return self._page_counts.get(id(driver), 0) >= self.max_pages_per_driver
+
+    def checkin(self, driver, healthy: bool = True):
+        """Return a driver to the pool, quitting it if it is worn out or broken"""
+        with self._lock:
+            pages = self._page_counts.get(id(driver), 0)
+            recycle = not healthy or self._closed or pages >= self.max_pages_per_driver
+
+        if recycle:
+            self.discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def discard(self, driver):
+        """Quit a driver and free its slot"""
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+            self._created -= 1
+
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting driver: {str(e)}")
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of a with-block"""
+        driver = self.checkout()
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.checkin(driver, healthy)
+
+    def close(self):
+        """Quit all idle drivers and stop handing out new ones"""
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(driver)
+
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """Process-wide driver pool built from Config.SELENIUM_POOL"""
+    global _driver_pool
+
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            from config.settings import Config
+
+            settings = Config.SELENIUM_POOL
+            blocked_prefs, blocked_url_patterns = build_block_list(Config.SELENIUM_BLOCKING)
+            _driver_pool = DriverPool(
+                size=settings['size'],
+                max_pages_per_driver=settings['max_pages_per_driver'],
+                headless=settings['headless'],
+                page_load_timeout=settings['page_load_timeout'],
+                checkout_timeout=settings['checkout_timeout'],
+                blocked_prefs=blocked_prefs,
+                blocked_url_patterns=blocked_url_patterns
+            )
+            atexit.register(_driver_pool.close)
+
+    return _driver_pool
+
+
+def shutdown_driver_pool():
+    """Close the process-wide pool if one was started"""
+    global _driver_pool
+
+    with _driver_pool_lock:
+        if _driver_pool is not None:
+            _driver_pool.close()
+            _driver_pool = None
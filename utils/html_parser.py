@@ -0,0 +1,79 @@
+"""
+Single entry point for HTML parsing with lxml and SoupStrainer profiles
+"""
+
+import re
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# Class/id fragments that mark product containers across Shopify and WooCommerce themes
+PRODUCT_HINTS = re.compile(
+    r'product|price|money|summary|description|rte|gallery|stock|availability|'
+    r'specification|tab-|highlight|woocommerce',
+    re.I
+)
+
+PAGINATION_HINTS = re.compile(r'pagination|page-numbers|next', re.I)
+
+
+def _attr_text(attrs: dict, name: str) -> str:
+    value = attrs.get(name) or ''
+    return ' '.join(value) if isinstance(value, list) else str(value)
+
+
+def _links_only(name: str, attrs: dict) -> bool:
+    """Anchors plus the pagination containers link harvesting reads"""
+    if name in ('a', 'link'):
+        return True
+    if 'data-collection-pagination' in attrs:
+        return True
+    return bool(PAGINATION_HINTS.search(_attr_text(attrs, 'class')))
+
+
+def _product_only(name: str, attrs: dict) -> bool:
+    """Structured data scripts, headings and product containers, skipping nav/footer chrome"""
+    if name == 'script':
+        return _attr_text(attrs, 'type') in ('application/ld+json', 'application/json')
+    if name in ('main', 'h1', 'meta') or {'itemscope', 'data-price', 'data-add-to-cart'} & set(attrs):
+        return True
+    return bool(
+        PRODUCT_HINTS.search(_attr_text(attrs, 'class')) or PRODUCT_HINTS.search(_attr_text(attrs, 'id'))
+    )
+
+
+class ProfileStrainer(SoupStrainer):
+    """SoupStrainer deciding tag creation from (name, attrs) on both old and new bs4 APIs"""
+
+    def __init__(self, predicate):
+        super().__init__()
+        self.predicate = predicate
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # beautifulsoup4 >= 4.13
+        return self.predicate(name, attrs or {})
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # beautifulsoup4 < 4.13
+        return self.predicate(markup_name, dict(markup_attrs or {}))
+
+
+PROFILES = {
+    'links': ProfileStrainer(_links_only),
+    'product': ProfileStrainer(_product_only)
+}
+
+
+def parse_html(markup: Union[str, bytes], profile: Optional[str] = None,
+               parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse markup with the fastest available parser, building only the nodes a profile needs"""
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER, parse_only=PROFILES.get(profile))
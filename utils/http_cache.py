@@ -0,0 +1,194 @@
+"""
+Persistent conditional-GET HTTP cache for scraper sessions
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+
+class HTTPCache:
+    """On-disk cache of response bodies and validators with size-bounded LRU eviction"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 * 1024 * 1024):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'http_cache.db'), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB,
+                size INTEGER,
+                last_access REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+            CREATE TABLE IF NOT EXISTS products (
+                url TEXT PRIMARY KEY,
+                data TEXT
+            );
+        """)
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'bytes_saved': 0,
+            'products_reused': 0
+        }
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a URL and mark it recently used"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+        return {'etag': row[0], 'last_modified': row[1], 'body': row[2]}
+
+    def store(self, url: str, body: bytes, etag: str = None, last_modified: str = None):
+        """Store a response body with its validators, evicting old entries if over budget"""
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE url = ?", (url,)).fetchone()
+            if old:
+                self.total_bytes -= old[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (url, etag, last_modified, body, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, len(body), time.time())
+            )
+            self.total_bytes += len(body)
+            self.counters['stores'] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        while self.total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT url, size FROM entries ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if not row:
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (row[0],))
+            self._conn.execute("DELETE FROM products WHERE url = ?", (row[0],))
+            self.total_bytes -= row[1]
+            self.counters['evictions'] += 1
+
+    def get_product(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the product parsed from the cached copy of a page"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM products WHERE url = ?", (url,)).fetchone()
+            if not row:
+                return None
+            self.counters['products_reused'] += 1
+
+        return json.loads(row[0])
+
+    def put_product(self, url: str, product: Dict[str, Any]):
+        """Remember the product parsed from a page so an unchanged page needs no parsing"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO products (url, data) VALUES (?, ?)",
+                (url, json.dumps(product, ensure_ascii=False, default=str))
+            )
+            self._conn.commit()
+
+    def record(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['misses']
+            return {
+                **self.counters,
+                'hit_rate': round(self.counters['hits'] / lookups, 3) if lookups else 0.0,
+                'size_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that revalidates cached GETs with If-None-Match/If-Modified-Since"""
+
+    def __init__(self, cache: HTTPCache, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        if entry:
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().send(request, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and entry:
+            # Unchanged upstream - serve the stored body as a normal 200
+            response.status_code = 200
+            response.reason = 'OK (cached)'
+            response._content = entry['body']
+            response.from_cache = True
+            self.cache.record('hits')
+            self.cache.record('bytes_saved', len(entry['body']))
+            return response
+
+        self.cache.record('misses')
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code == 200 and (etag or last_modified):
+            self.cache.store(request.url, response.content, etag, last_modified)
+
+        return response
+
+
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Process-wide HTTP cache under Config.DATA_DIR, or None when disabled"""
+    global _http_cache
+
+    from config.settings import Config
+
+    if not Config.HTTP_CACHE['enabled']:
+        return None
+
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = HTTPCache(
+                Config.HTTP_CACHE['directory'],
+                max_bytes=Config.HTTP_CACHE['max_bytes']
+            )
+
+    return _http_cache
@@ -0,0 +1,135 @@
+"""
+Category-listing snapshots for incremental crawls
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+ACTIVE = 'active'
+REMOVED = 'removed'
+
+PRICE_CLASS = re.compile(r'price|money|amount', re.I)
+
+
+def listing_signature(card) -> str:
+    """Hash of a listing card's price, or of its whole text when no price element is found"""
+    price_elem = card.find(class_=PRICE_CLASS) if hasattr(card, 'find') else None
+    text = (price_elem or card).get_text(' ')
+    return hashlib.md5(' '.join(text.split()).encode('utf-8')).hexdigest()[:16]
+
+
+def listing_card(anchor):
+    """Largest ancestor of a product anchor that holds no link to a different URL"""
+    href = anchor.get('href')
+    card = anchor
+    for parent in anchor.parents:
+        if parent.name in ('body', 'html', '[document]'):
+            break
+        if parent.find('a', href=lambda other: other and other != href):
+            break
+        card = parent
+    return card
+
+
+def product_signature(product: Dict[str, Any]) -> str:
+    """List-level signature for products read from a platform API"""
+    key = f"{product.get('price')}|{product.get('availability')}|{product.get('title')}"
+    return hashlib.md5(key.encode('utf-8')).hexdigest()[:16]
+
+
+class ListingSnapshot:
+    """Last seen signature and scraped product for every listing URL, per site"""
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS listings (
+                url TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                signature TEXT,
+                status TEXT NOT NULL DEFAULT 'active',
+                data TEXT,
+                first_seen REAL,
+                last_seen REAL,
+                removed_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_listings_site ON listings (site, status);
+        """)
+
+    def listings(self, site: str) -> Dict[str, Dict[str, Any]]:
+        """url -> {'signature', 'status', 'data'} for every listing ever seen on a site"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, signature, status, data FROM listings WHERE site = ?", (site,)
+            ).fetchall()
+        return {
+            url: {'signature': signature, 'status': status, 'data': json.loads(data) if data else None}
+            for url, signature, status, data in rows
+        }
+
+    def upsert(self, site: str, url: str, signature: Optional[str], product: Dict[str, Any]):
+        """Store the latest signature and product for a listing and mark it active"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO listings (url, site, signature, status, data, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET signature = excluded.signature, status = excluded.status, "
+                "data = excluded.data, last_seen = excluded.last_seen, removed_at = NULL",
+                (url, site, signature, ACTIVE, json.dumps(product, ensure_ascii=False, default=str), now, now)
+            )
+            self._conn.commit()
+
+    def touch(self, urls: List[str]):
+        """Mark unchanged listings as seen in this run"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany("UPDATE listings SET last_seen = ? WHERE url = ?", [(now, url) for url in urls])
+            self._conn.commit()
+
+    def mark_removed(self, site: str, present_urls: List[str]) -> List[str]:
+        """Flag active listings missing from the current category pages as sold/removed"""
+        present = set(present_urls)
+        with self._lock:
+            active = [
+                row[0] for row in self._conn.execute(
+                    "SELECT url FROM listings WHERE site = ? AND status = ?", (site, ACTIVE)
+                )
+            ]
+            removed = [url for url in active if url not in present]
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE listings SET status = ?, removed_at = ? WHERE url = ?",
+                [(REMOVED, now, url) for url in removed]
+            )
+            self._conn.commit()
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_listing_snapshot = None
+_listing_snapshot_lock = threading.Lock()
+
+
+def get_listing_snapshot() -> ListingSnapshot:
+    """Process-wide snapshot store at Config.INCREMENTAL_CRAWL['snapshot_path']"""
+    global _listing_snapshot
+
+    with _listing_snapshot_lock:
+        if _listing_snapshot is None:
+            from config.settings import Config
+
+            _listing_snapshot = ListingSnapshot(Config.INCREMENTAL_CRAWL['snapshot_path'])
+
+    return _listing_snapshot
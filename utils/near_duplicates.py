@@ -0,0 +1,126 @@
+"""
+MinHash LSH index for finding near-duplicate listings across sites
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime for the universal hash family; 32-bit shingle hashes keep a*x+b inside uint64
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def listing_text(listing: Dict[str, Any], description_chars: int = 500) -> str:
+    """Title plus the start of the description; dealer boilerplate tends to sit at the end"""
+    title = listing.get('title') or ''
+    if title != title:  # NaN
+        title = ''
+    description = listing.get('description') or ''
+    if description != description:
+        description = ''
+    return f"{title} {str(description)[:description_chars]}".strip()
+
+
+def shingles(text: str, size: int = 4) -> Set[str]:
+    """Character shingles of the lower-cased text with punctuation collapsed to single spaces"""
+    text = NON_ALNUM.sub(' ', str(text).lower()).strip()
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHashLSH:
+    """MinHash signatures banded into hash buckets; inserts are incremental"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self.buckets = [defaultdict(list) for _ in range(bands)]
+        self.signatures = {}
+
+    def signature(self, shingle_set: Set[str]) -> np.ndarray:
+        if not shingle_set:
+            return np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingle_set),
+                             dtype=np.uint64, count=len(shingle_set))
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key: Hashable, signature: np.ndarray):
+        if key in self.signatures:
+            return
+        self.signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self.buckets[band][band_key].append(key)
+
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        """Keys sharing at least one band bucket with the signature"""
+        found = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self.buckets[band].get(band_key, ()))
+        return found
+
+    def __contains__(self, key) -> bool:
+        return key in self.signatures
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+
+class NearDuplicateIndex:
+    """Listings indexed by their shingled title and description"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 4, threshold: float = 0.6):
+        self.lsh = MinHashLSH(num_perm=num_perm, bands=bands)
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+    def signature(self, listing: Dict[str, Any]) -> Optional[np.ndarray]:
+        """MinHash of the listing's shingles, or None when it has no text to compare"""
+        shingle_set = shingles(listing_text(listing), self.shingle_size)
+        return self.lsh.signature(shingle_set) if shingle_set else None
+
+    def add(self, key: Hashable, listing: Dict[str, Any]):
+        # Empty listings would all share one signature and match each other at 1.0
+        signature = self.signature(listing)
+        if signature is not None:
+            self.lsh.insert(key, signature)
+
+    def query(self, listing: Dict[str, Any], threshold: float = None) -> List[Tuple[Hashable, float]]:
+        """(key, estimated Jaccard) of indexed listings at or above threshold, most similar first"""
+        threshold = self.threshold if threshold is None else threshold
+        signature = self.signature(listing)
+        if signature is None:
+            return []
+        candidates = list(self.lsh.query(signature))
+        if not candidates:
+            return []
+
+        # Estimated Jaccard for every candidate at once
+        stacked = np.stack([self.lsh.signatures[key] for key in candidates])
+        similarities = (stacked == signature).mean(axis=1)
+        return sorted(
+            [(key, float(similarity)) for key, similarity in zip(candidates, similarities) if similarity >= threshold],
+            key=lambda item: item[1], reverse=True
+        )
+
+    def __contains__(self, key) -> bool:
+        return key in self.lsh
+
+    def __len__(self) -> int:
+        return len(self.lsh)
@@ -0,0 +1,55 @@
+"""
+Process pool that runs site-specific product parsing on already-fetched HTML
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from utils.text_normalization import normalization_counters
+
+# Scrapers rebuilt inside each worker process, keyed by class and constructor args
+_worker_scrapers = {}
+
+
+def _worker_scraper(spec: Tuple[type, tuple]):
+    scraper_class, args = spec
+    key = (scraper_class.__module__, scraper_class.__qualname__, repr(args))
+    if key not in _worker_scrapers:
+        scraper = scraper_class(*args)
+        # Workers only parse bytes handed to them; they must never touch the network
+        scraper.use_selenium = False
+        scraper.incremental = False
+        _worker_scrapers[key] = scraper
+    return _worker_scrapers[key]
+
+
+def parse_product_page(spec: Tuple[type, tuple], url: str,
+                       content: bytes) -> Tuple[Dict[str, Any], Optional[str], Dict[str, tuple]]:
+    """Run a scraper's scrape_product_details on raw HTML; returns (product, parse path, memo counters)"""
+    scraper = _worker_scraper(spec)
+    scraper._prefetched[url] = content
+
+    before = dict(scraper.parse_paths)
+    counters_before = normalization_counters()
+    try:
+        product = scraper.scrape_product_details(url)
+    finally:
+        scraper._prefetched.pop(url, None)
+
+    path = next((name for name, count in scraper.parse_paths.items() if count != before.get(name)), None)
+    # The text-normalization memos live per process; send this page's share back for the parent's report
+    counters = {
+        name: tuple(after - start for after, start in zip(values, counters_before[name]))
+        for name, values in normalization_counters().items()
+    }
+    return product, path, counters
+
+
+def create_parse_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """Pool of parse workers; 0 keeps parsing in-process, a negative number uses every core"""
+    if workers == 0:
+        return None
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return ProcessPoolExecutor(max_workers=workers)
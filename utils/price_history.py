@@ -0,0 +1,168 @@
+"""
+Append-only SQLite price history keyed by canonical listing URL, written only when a price changes
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.url_canonical import listing_id
+
+
+def _reference(value) -> Optional[str]:
+    if value is None or value != value:  # None or NaN
+        return None
+    value = str(value).strip().upper()
+    return value or None
+
+
+def _text(value) -> Optional[str]:
+    if value is None or value != value:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+class PriceHistory:
+    """One row per (listing, scrape time) at which the listing's price differed from the last row"""
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS prices (
+                listing_id TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                site TEXT NOT NULL,
+                url TEXT NOT NULL,
+                reference TEXT,
+                brand TEXT,
+                title TEXT,
+                price REAL,
+                currency TEXT,
+                PRIMARY KEY (listing_id, scraped_at)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_prices_reference ON prices (reference, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_prices_brand ON prices (brand, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_prices_site ON prices (site, scraped_at);
+        """)
+
+    def _latest_prices(self, ids: List[str]) -> Dict[str, Optional[float]]:
+        latest = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT listing_id, price, MAX(scraped_at) FROM prices "
+                f"WHERE listing_id IN ({','.join('?' * len(batch))}) GROUP BY listing_id",
+                batch
+            ).fetchall()
+            latest.update({row[0]: row[1] for row in rows})
+        return latest
+
+    def record(self, products: Iterable[Dict[str, Any]], scraped_at: float = None) -> Dict[str, int]:
+        """Append rows for new listings and changed prices; unchanged listings write nothing"""
+        scraped_at = scraped_at or time.time()
+        rows = {}
+        for product in products:
+            price = product.get('price')
+            url = product.get('url')
+            if not url or price is None or price != price:
+                continue
+            rows[listing_id(url)] = (
+                scraped_at, _text(product.get('site')) or '', url,
+                _reference(product.get('reference')), _text(product.get('brand')),
+                _text(product.get('title')), float(price), _text(product.get('currency'))
+            )
+
+        with self._lock:
+            latest = self._latest_prices(list(rows))
+            changed = [
+                (key,) + row for key, row in rows.items()
+                if key not in latest or latest[key] != row[6]
+            ]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO prices "
+                "(listing_id, scraped_at, site, url, reference, brand, title, price, currency) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                changed
+            )
+            self._conn.commit()
+
+        new = sum(1 for row in changed if row[0] not in latest)
+        return {'new': new, 'changed': len(changed) - new, 'unchanged': len(rows) - len(changed)}
+
+    def changes(self, reference: str = None, brand: str = None, site: str = None,
+                days: float = None) -> List[Dict[str, Any]]:
+        """Price rows with the listing's previous price, newest first, filtered on the indexed columns"""
+        clauses, params = [], []
+        if reference:
+            clauses.append("reference = ?")
+            params.append(_reference(reference))
+        if brand:
+            clauses.append("brand = ?")
+            params.append(brand)
+        if site:
+            clauses.append("site = ?")
+            params.append(site)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        # The window runs over each matching listing's full history so the first row in range
+        # still gets its previous price from before the cut-off
+        query = f"""
+            SELECT * FROM (
+                SELECT listing_id, scraped_at, site, url, reference, brand, title, price, currency,
+                       LAG(price) OVER (PARTITION BY listing_id ORDER BY scraped_at) AS previous_price
+                FROM prices {where}
+            )
+        """
+        if days is not None:
+            query += " WHERE scraped_at >= ?"
+            params.append(time.time() - days * 86400)
+        query += " ORDER BY scraped_at DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def history(self, url: str) -> List[Dict[str, Any]]:
+        """Every recorded price for one listing, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scraped_at, price, currency FROM prices WHERE listing_id = ? ORDER BY scraped_at",
+                (listing_id(url),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows, listings = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT listing_id) FROM prices"
+            ).fetchone()
+        return {'rows': rows, 'listings': listings}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_price_history = None
+_price_history_lock = threading.Lock()
+
+
+def get_price_history() -> PriceHistory:
+    """Process-wide price history at Config.PRICE_HISTORY['path']"""
+    global _price_history
+
+    with _price_history_lock:
+        if _price_history is None:
+            from config.settings import Config
+
+            _price_history = PriceHistory(Config.PRICE_HISTORY['path'])
+
+    return _price_history
@@ -0,0 +1,133 @@
+"""
+Streaming product sinks: append products to NDJSON/CSV as they are scraped
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, List
+
+# Column order for CSV streams; nested values are written as JSON
+PRODUCT_FIELDS = [
+    'url', 'site', 'title', 'price', 'currency', 'brand', 'model', 'reference', 'year',
+    'condition', 'availability', 'dial_color', 'case_material', 'bracelet_material',
+    'movement', 'description', 'images', 'specifications'
+]
+
+
+class ProductSink:
+    """Interface for anything products can be pushed to one at a time"""
+
+    def write(self, product: Dict[str, Any]):
+        raise NotImplementedError
+
+    def checkpoint(self):
+        """Make everything written so far durable"""
+
+    def close(self):
+        self.checkpoint()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _FileSink(ProductSink):
+    """Buffered append-only file with fsync at checkpoints and every `checkpoint_every` writes"""
+
+    def __init__(self, path: str, checkpoint_every: int = 100, buffer_bytes: int = 64 * 1024, append: bool = True):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.count = 0
+        self._is_new = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='', buffering=buffer_bytes)
+
+    def _wrote(self):
+        self.count += 1
+        if self.checkpoint_every and self.count % self.checkpoint_every == 0:
+            self.checkpoint()
+
+    def checkpoint(self):
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.checkpoint()
+            self._file.close()
+
+
+class NDJSONSink(_FileSink):
+    """One JSON object per line"""
+
+    def write(self, product: Dict[str, Any]):
+        self._file.write(json.dumps(product, ensure_ascii=False, default=str) + '\n')
+        self._wrote()
+
+
+class CSVSink(_FileSink):
+    """Fixed-column CSV; lists and dicts are stored as JSON, not Python reprs"""
+
+    def __init__(self, path: str, fieldnames: List[str] = None, **kwargs):
+        super().__init__(path, **kwargs)
+        self.fieldnames = fieldnames or PRODUCT_FIELDS
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        if self._is_new:
+            self._writer.writeheader()
+
+    def write(self, product: Dict[str, Any]):
+        row = {
+            field: json.dumps(value, ensure_ascii=False, default=str) if isinstance(value, (list, dict)) else value
+            for field, value in product.items()
+        }
+        self._writer.writerow(row)
+        self._wrote()
+
+
+class MultiSink(ProductSink):
+    """Fan products out to several sinks"""
+
+    def __init__(self, sinks: List[ProductSink]):
+        self.sinks = sinks
+
+    @property
+    def paths(self) -> List[str]:
+        return [sink.path for sink in self.sinks if hasattr(sink, 'path')]
+
+    def write(self, product: Dict[str, Any]):
+        for sink in self.sinks:
+            sink.write(product)
+
+    def checkpoint(self):
+        for sink in self.sinks:
+            sink.checkpoint()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def open_site_sink(stream_dir: str, name: str, checkpoint_every: int = 100, append: bool = True) -> MultiSink:
+    """NDJSON + CSV streams named `name` under stream_dir"""
+    return MultiSink([
+        NDJSONSink(os.path.join(stream_dir, f"{name}.ndjson"), checkpoint_every=checkpoint_every, append=append),
+        CSVSink(os.path.join(stream_dir, f"{name}.csv"), checkpoint_every=checkpoint_every, append=append)
+    ])
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """Products from an NDJSON stream, skipping a torn last line from an interrupted run"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,127 @@
+"""
+Per-host token-bucket rate limiting shared by all scrapers in the process
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket refilling at `rate` tokens per second up to `burst` tokens"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """Per-host token buckets, so different sites can be crawled at the same time"""
+
+    def __init__(self, default_rate: float = 0.5, default_burst: int = 1,
+                 host_limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = {normalize_host(host): limits for host, limits in (host_limits or {}).items()}
+        self.buckets = {}
+        self.worker_stats = {}
+        self.host_stats = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self.buckets:
+            limits = self.host_limits.get(host, {})
+            self.buckets[host] = TokenBucket(
+                limits.get('requests_per_second', self.default_rate),
+                int(limits.get('burst', self.default_burst))
+            )
+        return self.buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Block until the URL's host has budget for one request, returning seconds waited"""
+        host = normalize_host(urlparse(url).netloc or url)
+        worker = threading.current_thread().name
+
+        with self._lock:
+            wait = self._bucket(host).reserve()
+            self._record(self.worker_stats, worker, wait)
+            self._record(self.host_stats, host, wait)
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def _record(self, stats: Dict[str, Dict[str, Any]], key: str, wait: float):
+        entry = stats.setdefault(key, {
+            'requests': 0,
+            'waits': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0
+        })
+        entry['requests'] += 1
+        if wait > 0:
+            entry['waits'] += 1
+            entry['total_wait_seconds'] += wait
+            entry['max_wait_seconds'] = max(entry['max_wait_seconds'], wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """Wait statistics per worker thread and per host"""
+        def rounded(stats):
+            return {
+                key: {name: round(value, 2) if isinstance(value, float) else value
+                      for name, value in entry.items()}
+                for key, entry in stats.items()
+            }
+
+        with self._lock:
+            return {
+                'workers': rounded(self.worker_stats),
+                'hosts': rounded(self.host_stats)
+            }
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase a host and drop the www. prefix"""
+    host = host.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Process-wide rate limiter built from Config.TARGET_SITES"""
+    global _rate_limiter
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            from config.settings import Config
+
+            host_limits = {
+                urlparse(site['base_url']).netloc: site['rate_limit']
+                for site in Config.TARGET_SITES.values()
+                if 'rate_limit' in site
+            }
+            _rate_limiter = HostRateLimiter(
+                default_rate=Config.DEFAULT_RATE_LIMIT['requests_per_second'],
+                default_burst=Config.DEFAULT_RATE_LIMIT['burst'],
+                host_limits=host_limits
+            )
+
+    return _rate_limiter
@@ -0,0 +1,172 @@
+"""
+Catalog of known reference families with a trie for resolving references in one pass
+"""
+
+import re
+from typing import Dict, Optional
+
+# Reference prefix -> (brand, model family, case material when the reference itself does not encode it)
+REFERENCE_FAMILIES = {
+    # Rolex: six digits, the last one encodes the case metal
+    '114060': ('Rolex', 'Submariner', None),
+    '124060': ('Rolex', 'Submariner', None),
+    '116610': ('Rolex', 'Submariner Date', None),
+    '126610': ('Rolex', 'Submariner Date', None),
+    '126613': ('Rolex', 'Submariner Date', None),
+    '126618': ('Rolex', 'Submariner Date', None),
+    '126619': ('Rolex', 'Submariner Date', None),
+    '116500': ('Rolex', 'Daytona', None),
+    '126500': ('Rolex', 'Daytona', None),
+    '116520': ('Rolex', 'Daytona', None),
+    '116505': ('Rolex', 'Daytona', None),
+    '126505': ('Rolex', 'Daytona', None),
+    '116710': ('Rolex', 'GMT-Master II', None),
+    '126710': ('Rolex', 'GMT-Master II', None),
+    '126711': ('Rolex', 'GMT-Master II', None),
+    '126720': ('Rolex', 'GMT-Master II', None),
+    '126300': ('Rolex', 'Datejust 41', None),
+    '126331': ('Rolex', 'Datejust 41', None),
+    '126333': ('Rolex', 'Datejust 41', None),
+    '126334': ('Rolex', 'Datejust 41', None),
+    '126200': ('Rolex', 'Datejust 36', None),
+    '126234': ('Rolex', 'Datejust 36', None),
+    '124270': ('Rolex', 'Explorer', None),
+    '224270': ('Rolex', 'Explorer 40', None),
+    '226570': ('Rolex', 'Explorer II', None),
+    '126600': ('Rolex', 'Sea-Dweller', None),
+    '136660': ('Rolex', 'Deepsea', None),
+    '126622': ('Rolex', 'Yacht-Master 40', None),
+    '226659': ('Rolex', 'Yacht-Master 42', None),
+    '228235': ('Rolex', 'Day-Date 40', None),
+    '228238': ('Rolex', 'Day-Date 40', None),
+    '228239': ('Rolex', 'Day-Date 40', None),
+    '124300': ('Rolex', 'Oyster Perpetual 41', None),
+    '116400': ('Rolex', 'Milgauss', None),
+    '326934': ('Rolex', 'Sky-Dweller', None),
+    # Omega: dotted groups, the first four identify the family
+    '310.30.42.50': ('Omega', 'Speedmaster Moonwatch', 'Stainless Steel'),
+    '310.32.42.50': ('Omega', 'Speedmaster Moonwatch', 'Stainless Steel'),
+    '311.30.42.30': ('Omega', 'Speedmaster Moonwatch', 'Stainless Steel'),
+    '210.30.42.20': ('Omega', 'Seamaster Diver 300M', 'Stainless Steel'),
+    '210.32.42.20': ('Omega', 'Seamaster Diver 300M', 'Stainless Steel'),
+    '215.30.44.21': ('Omega', 'Seamaster Planet Ocean', 'Stainless Steel'),
+    '220.10.41.21': ('Omega', 'Seamaster Aqua Terra', 'Stainless Steel'),
+    '131.10.39.20': ('Omega', 'Constellation', 'Stainless Steel'),
+    # Audemars Piguet: five digits then a material code
+    '15500': ('Audemars Piguet', 'Royal Oak', None),
+    '15510': ('Audemars Piguet', 'Royal Oak', None),
+    '15400': ('Audemars Piguet', 'Royal Oak', None),
+    '15202': ('Audemars Piguet', 'Royal Oak Jumbo', None),
+    '16202': ('Audemars Piguet', 'Royal Oak Jumbo', None),
+    '26240': ('Audemars Piguet', 'Royal Oak Chronograph', None),
+    '26331': ('Audemars Piguet', 'Royal Oak Chronograph', None),
+    '26470': ('Audemars Piguet', 'Royal Oak Offshore', None),
+    '26420': ('Audemars Piguet', 'Royal Oak Offshore', None),
+    # Patek Philippe: four digits then a material letter
+    '5711': ('Patek Philippe', 'Nautilus', None),
+    '5811': ('Patek Philippe', 'Nautilus', None),
+    '5712': ('Patek Philippe', 'Nautilus', None),
+    '5726': ('Patek Philippe', 'Nautilus', None),
+    '5980': ('Patek Philippe', 'Nautilus', None),
+    '5167': ('Patek Philippe', 'Aquanaut', None),
+    '5164': ('Patek Philippe', 'Aquanaut', None),
+    '5968': ('Patek Philippe', 'Aquanaut', None),
+    '5227': ('Patek Philippe', 'Calatrava', None),
+    '5196': ('Patek Philippe', 'Calatrava', None),
+}
+
+# Case metal encoded in the reference, keyed by brand; names match the vocabulary's case_material values
+ROLEX_METALS = {
+    '0': 'Stainless Steel', '1': 'Two-Tone', '3': 'Two-Tone', '4': 'Two-Tone',
+    '5': 'Rose Gold', '6': 'Platinum', '8': 'Yellow Gold', '9': 'White Gold'
+}
+AP_METALS = {
+    'ST': 'Stainless Steel', 'OR': 'Rose Gold', 'BA': 'Yellow Gold', 'BC': 'White Gold',
+    'PT': 'Platinum', 'TI': 'Titanium', 'IO': 'Titanium', 'CE': 'Ceramic'
+}
+PATEK_METALS = {
+    'A': 'Stainless Steel', 'R': 'Rose Gold', 'G': 'White Gold', 'J': 'Yellow Gold',
+    'P': 'Platinum', 'T': 'Titanium'
+}
+
+# Candidate reference tokens: letters, digits and the separators references use
+TOKEN = re.compile(r'[a-z0-9][a-z0-9./-]*', re.I)
+SUFFIX = re.compile(r'[A-Z]+')
+
+
+def _case_material(brand: str, prefix: str, rest: str, default: Optional[str]) -> Optional[str]:
+    if brand == 'Rolex':
+        return ROLEX_METALS.get(prefix[-1], default)
+    if brand == 'Audemars Piguet':
+        return AP_METALS.get(rest[:2], default)
+    if brand == 'Patek Philippe':
+        letters = SUFFIX.search(rest)
+        return PATEK_METALS.get(letters.group(0)[-1], default) if letters else default
+    return default
+
+
+class ReferenceCatalog:
+    """Character trie over reference prefixes; lookup walks each token once"""
+
+    def __init__(self, families: Dict[str, tuple] = None):
+        self._root = {}
+        for prefix, entry in (families or REFERENCE_FAMILIES).items():
+            node = self._root
+            for char in prefix.upper():
+                node = node.setdefault(char, {})
+            node['$'] = (prefix.upper(), entry)
+
+    def lookup(self, token: str) -> Optional[Dict[str, str]]:
+        """Longest catalog prefix of the token, ignoring matches that run into more digits"""
+        token = token.upper().strip('.-/')
+        node = self._root
+        best = None
+        for position, char in enumerate(token):
+            node = node.get(char)
+            if node is None:
+                break
+            if '$' in node:
+                following = token[position + 1:position + 2]
+                if not following.isdigit():
+                    best = (position + 1, node['$'])
+        if best is None:
+            return None
+
+        length, (prefix, (brand, model, default_material)) = best
+        rest = token[length:]
+        # Keep the letter suffix that distinguishes variants (126610LN vs 126610LV), drop dealer noise
+        suffix = SUFFIX.match(rest.lstrip('/-'))
+        if brand == 'Omega':
+            reference_id = token
+        elif brand == 'Patek Philippe':
+            reference_id = prefix + re.sub(r'-\d+$', '', rest)
+        else:
+            reference_id = prefix + (suffix.group(0) if suffix else '')
+        return {
+            'reference': reference_id,
+            'family': prefix,
+            # A suffix, separators or a full Rolex-length number; a bare 4-5 digit prefix could be a price
+            'distinctive': bool(rest) or not prefix.isdigit() or len(prefix) >= 6,
+            'brand': brand,
+            'model': model,
+            'case_material': _case_material(brand, prefix, rest, default_material)
+        }
+
+    def resolve(self, text: str, brand: str = None) -> Optional[Dict[str, str]]:
+        """First known reference in free text that belongs to brand; without a brand only distinctive ones count"""
+        if not text:
+            return None
+        for match in TOKEN.finditer(text):
+            resolved = self.lookup(match.group(0))
+            if resolved and (resolved['brand'] == brand if brand else resolved['distinctive']):
+                return resolved
+        return None
+
+
+# Built once at import
+CATALOG = ReferenceCatalog()
+
+
+def resolve_reference(text: str, brand: str = None) -> Optional[Dict[str, str]]:
+    """Reference, brand, model family and case material for the first known reference in the text"""
+    return CATALOG.resolve(text, brand)
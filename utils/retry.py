@@ -0,0 +1,163 @@
+"""
+Jittered retry policy and per-host circuit breaker for page fetches
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from utils.rate_limiter import normalize_host
+
+
+def _host(url: str) -> str:
+    return normalize_host(urlparse(url).netloc or url)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring Retry-After when the server sends one"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 max_retry_after: float = 60.0, retry_statuses: Iterable[int] = (429, 500, 502, 503, 504)):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = set(retry_statuses)
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retry_after(self, response) -> Optional[float]:
+        """Seconds requested by a Retry-After header, as delta-seconds or an HTTP date"""
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def delay_for(self, attempt: int, response=None) -> Optional[float]:
+        """Wait before the next attempt, or None when Retry-After asks for longer than we will wait"""
+        retry_after = self.retry_after(response)
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+class CircuitBreaker:
+    """Opens a host after consecutive failures and keeps it open for the rest of the run"""
+
+    def __init__(self, failure_threshold: int = 5):
+        self.failure_threshold = max(1, failure_threshold)
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, host: str) -> Dict[str, Any]:
+        return self.hosts.setdefault(host, {
+            'open': False,
+            'consecutive_failures': 0,
+            'failures': 0,
+            'failure_seconds': 0.0,
+            'retries': 0,
+            'retry_wait_seconds': 0.0,
+            'trips': 0,
+            'short_circuited': 0
+        })
+
+    def allow(self, url: str) -> bool:
+        """False when the host's breaker is open; the skipped request is counted"""
+        with self._lock:
+            entry = self._entry(_host(url))
+            if entry['open']:
+                entry['short_circuited'] += 1
+                return False
+            return True
+
+    def is_open(self, url: str) -> bool:
+        with self._lock:
+            return self._entry(_host(url))['open']
+
+    def record_success(self, url: str):
+        with self._lock:
+            self._entry(_host(url))['consecutive_failures'] = 0
+
+    def record_failure(self, url: str, elapsed: float) -> bool:
+        """Count a request that failed after all retries; returns True if this trips the breaker"""
+        with self._lock:
+            entry = self._entry(_host(url))
+            entry['failures'] += 1
+            entry['failure_seconds'] += elapsed
+            entry['consecutive_failures'] += 1
+            if not entry['open'] and entry['consecutive_failures'] >= self.failure_threshold:
+                entry['open'] = True
+                entry['trips'] += 1
+                return True
+            return False
+
+    def record_retry(self, url: str, delay: float):
+        with self._lock:
+            entry = self._entry(_host(url))
+            entry['retries'] += 1
+            entry['retry_wait_seconds'] += delay
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Retries, trips and the time not spent on requests skipped by open breakers"""
+        with self._lock:
+            report = {}
+            for host, entry in self.hosts.items():
+                average_failure = entry['failure_seconds'] / entry['failures'] if entry['failures'] else 0.0
+                report[host] = {
+                    'state': 'open' if entry['open'] else 'closed',
+                    'retries': entry['retries'],
+                    'retry_wait_seconds': round(entry['retry_wait_seconds'], 2),
+                    'failures': entry['failures'],
+                    'trips': entry['trips'],
+                    'short_circuited': entry['short_circuited'],
+                    'time_saved_seconds': round(entry['short_circuited'] * average_failure, 2)
+                }
+            return report
+
+
+_retry_policy = None
+_circuit_breaker = None
+_retry_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Process-wide retry policy from Config.RETRY_POLICY"""
+    global _retry_policy
+
+    with _retry_lock:
+        if _retry_policy is None:
+            from config.settings import Config
+
+            _retry_policy = RetryPolicy(**Config.RETRY_POLICY)
+
+    return _retry_policy
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Process-wide circuit breaker from Config.CIRCUIT_BREAKER"""
+    global _circuit_breaker
+
+    with _retry_lock:
+        if _circuit_breaker is None:
+            from config.settings import Config
+
+            _circuit_breaker = CircuitBreaker(Config.CIRCUIT_BREAKER['failure_threshold'])
+
+    return _circuit_breaker
@@ -0,0 +1,124 @@
+"""
+Fast path for Shopify storefronts via the public products.json endpoint
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from utils.html_parser import parse_html
+
+
+class ShopifyAdapter:
+    """Map a Shopify store's collection JSON straight into the scraper product schema"""
+
+    platform = 'shopify'
+    PAGE_SIZE = 250
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.base_url = scraper.base_url.rstrip('/')
+
+    def detect(self) -> bool:
+        """Check whether the site answers like a Shopify storefront"""
+        data = self._get_json(f"{self.base_url}/products.json?limit=1")
+        return isinstance(data, dict) and isinstance(data.get('products'), list)
+
+    def _get_json(self, url: str) -> Optional[Any]:
+        response = self.scraper.fetch(url, log_errors=False)
+        if response is None:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def collection_handles(self, category_urls: List[str]) -> List[str]:
+        """Collection handles from /collections/<handle> category URLs"""
+        handles = []
+        for url in category_urls:
+            match = re.search(r'/collections/([^/?#]+)', urlparse(url).path)
+            if match and match.group(1) not in handles:
+                handles.append(match.group(1))
+        return handles or ['all']
+
+    def fetch_collection(self, handle: str, max_products: int) -> List[Dict[str, Any]]:
+        """Page through a collection's products.json"""
+        products = []
+        page = 1
+
+        while len(products) < max_products:
+            data = self._get_json(
+                f"{self.base_url}/collections/{handle}/products.json?limit={self.PAGE_SIZE}&page={page}"
+            )
+            batch = data.get('products', []) if isinstance(data, dict) else []
+            products.extend(batch)
+
+            if len(batch) < self.PAGE_SIZE:
+                break
+            page += 1
+
+        return products
+
+    def to_product_data(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert one products.json entry into the scraper's product_data dict"""
+        variants = raw.get('variants') or [{}]
+        variant = next((v for v in variants if v.get('available')), variants[0])
+
+        description = ''
+        if raw.get('body_html'):
+            description = self.scraper.clean_text(
+                parse_html(raw['body_html']).get_text(' ')
+            )
+
+        title = self.scraper.clean_text(raw.get('title', ''))
+        available = any(v.get('available') for v in variants)
+
+        product_data = {
+            'url': f"{self.base_url}/products/{raw.get('handle', '')}",
+            'site': self.scraper.site_name,
+            'title': title,
+            'price': self.scraper.extract_price(str(variant.get('price') or '')),
+            'currency': 'GBP',
+            'brand': '',
+            'model': '',
+            'reference': '',
+            'condition': '',
+            'description': description,
+            'images': [img['src'] for img in raw.get('images', []) if img.get('src')],
+            'availability': 'In Stock' if available else 'Out of Stock',
+            'specifications': {
+                'tags': raw.get('tags', []),
+                'product_type': raw.get('product_type', ''),
+                'options': {opt.get('name'): opt.get('values', []) for opt in raw.get('options', [])}
+            }
+        }
+
+        product_data.update(self.scraper.extract_watch_details(title, description))
+
+        # Vendor and SKU only fill gaps left by text extraction
+        if not product_data['brand'] and raw.get('vendor'):
+            product_data['brand'] = raw['vendor']
+        if not product_data['reference'] and variant.get('sku'):
+            product_data['reference'] = str(variant['sku']).upper()
+
+        return product_data
+
+    def scrape(self, category_urls: List[str], max_products: int = 100) -> List[Dict[str, Any]]:
+        """Scrape every collection behind the category URLs, deduplicated by handle"""
+        seen = set()
+        results = []
+
+        for handle in self.collection_handles(category_urls):
+            for raw in self.fetch_collection(handle, max_products):
+                if raw.get('handle') in seen:
+                    continue
+                seen.add(raw.get('handle'))
+                product_data = self.to_product_data(raw)
+                if product_data['title']:
+                    results.append(product_data)
+
+            if len(results) >= max_products:
+                break
+
+        return results[:max_products]
@@ -0,0 +1,87 @@
+"""
+Batched weighted watch similarity scored in native code with rapidfuzz
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist, cpdist
+
+FIELDS = ('brand', 'reference', 'model', 'title')
+
+DEFAULT_WEIGHTS = {'brand': 0.4, 'reference': 0.3, 'model': 0.2, 'title': 0.1}
+
+
+def matching_weights() -> Dict[str, float]:
+    """Per-field weights from Config.MATCHING"""
+    from config.settings import Config
+
+    return {field: Config.MATCHING.get(f'{field}_weight', DEFAULT_WEIGHTS[field]) for field in FIELDS}
+
+
+def _text(value) -> str:
+    if value is None or value != value:  # None or NaN
+        return ''
+    return str(value).lower()
+
+
+def field_values(watches: Sequence[Dict[str, Any]], field: str) -> Tuple[List[str], np.ndarray]:
+    """Lower-cased values of one field and a mask of which watches have it"""
+    values = [_text(watch.get(field)) for watch in watches]
+    return values, np.fromiter((bool(value) for value in values), dtype=bool, count=len(values))
+
+
+def score_matrix(sources: Sequence[Dict[str, Any]], targets: Sequence[Dict[str, Any]],
+                 weights: Dict[str, float] = None, workers: int = -1) -> np.ndarray:
+    """Weighted similarity for every source/target pair; a field counts only when both sides have it"""
+    weights = weights or DEFAULT_WEIGHTS
+    scores = np.zeros((len(sources), len(targets)), dtype=np.float32)
+    if not len(sources) or not len(targets):
+        return scores
+
+    for field in FIELDS:
+        source_values, source_present = field_values(sources, field)
+        target_values, target_present = field_values(targets, field)
+        if not source_present.any() or not target_present.any():
+            continue
+        ratios = cdist(source_values, target_values, scorer=fuzz.ratio, dtype=np.float32, workers=workers)
+        ratios *= np.outer(source_present, target_present)
+        scores += ratios * (weights[field] / 100)
+    return scores
+
+
+def score_pairs(sources: Sequence[Dict[str, Any]], targets: Sequence[Dict[str, Any]],
+                rows: np.ndarray, cols: np.ndarray, weights: Dict[str, float] = None,
+                workers: int = -1) -> np.ndarray:
+    """Weighted similarity for the given (rows[i], cols[i]) pairs only"""
+    weights = weights or DEFAULT_WEIGHTS
+    scores = np.zeros(len(rows), dtype=np.float32)
+    if not len(rows):
+        return scores
+
+    for field in FIELDS:
+        source_values, source_present = field_values(sources, field)
+        target_values, target_present = field_values(targets, field)
+        present = source_present[rows] & target_present[cols]
+        if not present.any():
+            continue
+        pair_sources = np.asarray(source_values, dtype=object)[rows]
+        pair_targets = np.asarray(target_values, dtype=object)[cols]
+        ratios = cpdist(pair_sources, pair_targets, scorer=fuzz.ratio, dtype=np.float32, workers=workers)
+        scores += np.where(present, ratios, 0) * (weights[field] / 100)
+    return scores
+
+
+def top_k(scores: np.ndarray, k: int = 5, threshold: float = 0.0) -> List[List[Tuple[int, float]]]:
+    """Best k (column, score) pairs per row at or above threshold, highest first"""
+    if not scores.size:
+        return [[] for _ in range(scores.shape[0])]
+
+    k = min(k, scores.shape[1])
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    results = []
+    for row, columns in enumerate(best):
+        ranked = sorted(columns, key=lambda col: (-scores[row, col], col))
+        results.append([(int(col), float(scores[row, col])) for col in ranked if scores[row, col] >= threshold])
+    return results
@@ -0,0 +1,184 @@
+"""
+Parquet snapshots of consolidated products, partitioned by scrape date and site
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Fixed snapshot schema; images and specifications keep their nesting instead of being stringified
+SNAPSHOT_SCHEMA = pa.schema([
+    ('run_id', pa.string()),
+    ('url', pa.string()),
+    ('title', pa.string()),
+    ('price', pa.float64()),
+    ('currency', pa.string()),
+    ('price_category', pa.string()),
+    ('brand', pa.string()),
+    ('model', pa.string()),
+    ('reference', pa.string()),
+    ('year', pa.int32()),
+    ('condition', pa.string()),
+    ('availability', pa.string()),
+    ('dial_color', pa.string()),
+    ('case_material', pa.string()),
+    ('bracelet_material', pa.string()),
+    ('movement', pa.string()),
+    ('description', pa.string()),
+    ('images', pa.list_(pa.string())),
+    ('specifications', pa.map_(pa.string(), pa.string())),
+    ('scraped_at', pa.timestamp('s')),
+    # Partition columns: stored in the directory layout, not in the files
+    ('scrape_date', pa.string()),
+    ('site', pa.string())
+])
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('scrape_date', pa.string()), ('site', pa.string())]),
+    flavor='hive'
+)
+
+NESTED_COLUMNS = {'images', 'specifications'}
+
+
+def _text(value) -> Optional[str]:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    value = str(value).strip()
+    return value if value and value not in ('nan', 'None') else None
+
+
+def _images(value) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(image) for image in value if image]
+    return []
+
+
+def _specifications(value) -> List[tuple]:
+    if isinstance(value, dict):
+        return [(str(key), str(item)) for key, item in value.items() if item is not None]
+    return []
+
+
+def to_table(df: pd.DataFrame, run_id: str, scraped_at: datetime) -> pa.Table:
+    """Coerce a consolidated chunk to the snapshot schema"""
+    rows = len(df)
+
+    def column(name):
+        return df[name] if name in df.columns else pd.Series([None] * rows, index=df.index)
+
+    arrays = {
+        'run_id': pa.array([run_id] * rows, pa.string()),
+        'price': pa.array(pd.to_numeric(column('price'), errors='coerce'), pa.float64(), from_pandas=True),
+        'year': pa.array(pd.to_numeric(column('year'), errors='coerce').astype('Int32'), pa.int32(), from_pandas=True),
+        'images': pa.array([_images(value) for value in column('images')], pa.list_(pa.string())),
+        'specifications': pa.array([_specifications(value) for value in column('specifications')],
+                                   pa.map_(pa.string(), pa.string())),
+        'scraped_at': pa.array([scraped_at] * rows, pa.timestamp('s')),
+        'scrape_date': pa.array([scraped_at.strftime('%Y-%m-%d')] * rows, pa.string())
+    }
+    for field in SNAPSHOT_SCHEMA:
+        if field.name not in arrays:
+            arrays[field.name] = pa.array([_text(value) for value in column(field.name)], pa.string())
+
+    return pa.Table.from_arrays([arrays[field.name] for field in SNAPSHOT_SCHEMA], schema=SNAPSHOT_SCHEMA)
+
+
+class SnapshotWriter:
+    """Appends consolidated chunks of one run to the partitioned snapshot dataset"""
+
+    def __init__(self, root: str, run_id: str = None, scraped_at: datetime = None):
+        self.root = root
+        self.scraped_at = (scraped_at or datetime.now()).replace(microsecond=0)
+        self.run_id = run_id or self.scraped_at.strftime('%Y%m%d_%H%M%S')
+        self.rows = 0
+        self._chunks = 0
+
+    def write(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        ds.write_dataset(
+            to_table(df, self.run_id, self.scraped_at),
+            self.root,
+            format='parquet',
+            partitioning=PARTITIONING,
+            basename_template=f"{self.run_id}-{self._chunks}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        self._chunks += 1
+        self.rows += len(df)
+
+
+def _dataset(root: str) -> ds.Dataset:
+    return ds.dataset(root, schema=SNAPSHOT_SCHEMA, format='parquet', partitioning=PARTITIONING)
+
+
+def latest_run(root: str) -> Optional[str]:
+    """Most recent run_id in the dataset, reading only that column"""
+    if not os.path.isdir(root):
+        return None
+    runs = _dataset(root).to_table(columns=['run_id']).column('run_id').unique().to_pylist()
+    return max(runs) if runs else None
+
+
+def read_snapshot(root: str, columns: List[str] = None, run_id: str = 'latest',
+                  sites: List[str] = None, since: str = None) -> pd.DataFrame:
+    """Load only the requested columns; partition filters skip whole site/date directories"""
+    if not os.path.isdir(root):
+        return pd.DataFrame(columns=columns or SNAPSHOT_SCHEMA.names)
+
+    if run_id == 'latest':
+        run_id = latest_run(root)
+
+    condition = None
+    for clause in (
+        ds.field('run_id') == run_id if run_id else None,
+        ds.field('site').isin(sites) if sites else None,
+        ds.field('scrape_date') >= since if since else None
+    ):
+        if clause is not None:
+            condition = clause if condition is None else condition & clause
+
+    table = _dataset(root).to_table(columns=columns, filter=condition)
+    df = table.to_pandas()
+    if 'specifications' in df.columns:
+        # Arrow maps come back as lists of (key, value) pairs
+        df['specifications'] = [dict(pairs) if pairs is not None else {} for pairs in df['specifications']]
+    if 'images' in df.columns:
+        df['images'] = [list(images) if images is not None else [] for images in df['images']]
+    return df
+
+
+def export_snapshot(df: pd.DataFrame, path: str) -> str:
+    """Write a snapshot frame as CSV, JSON or an Excel workbook with per-brand and per-site sheets"""
+    if path.endswith('.csv'):
+        flat = df.copy()
+        for column in NESTED_COLUMNS & set(flat.columns):
+            flat[column] = flat[column].apply(lambda value: json.dumps(value, ensure_ascii=False) if value else '')
+        flat.to_csv(path, index=False)
+    elif path.endswith('.json'):
+        df.to_json(path, orient='records', indent=2, date_format='iso')
+    elif path.endswith('.xlsx'):
+        flat = df.drop(columns=list(NESTED_COLUMNS & set(df.columns)))
+        with pd.ExcelWriter(path) as writer:
+            flat.to_excel(writer, sheet_name='All_Watches', index=False)
+
+            # Create separate sheets by brand
+            if 'brand' in flat.columns:
+                for brand in flat['brand'].dropna().unique():
+                    sheet_name = brand.replace(' ', '_')[:31]  # Excel sheet name limit
+                    flat[flat['brand'] == brand].to_excel(writer, sheet_name=sheet_name, index=False)
+
+            # Create separate sheets by site
+            if 'site' in flat.columns:
+                for site in flat['site'].dropna().unique():
+                    flat[flat['site'] == site].to_excel(writer, sheet_name=site[:31], index=False)
+    else:
+        raise ValueError("Unsupported export format. Use .csv, .json or .xlsx.")
+    return path
+
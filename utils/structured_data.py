@@ -0,0 +1,196 @@
+"""
+Schema.org Product extraction from JSON-LD and microdata
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from utils.html_parser import parse_html
+
+PRODUCT_TYPES = {'Product', 'ProductGroup', 'IndividualProduct', 'ProductModel'}
+
+AVAILABILITY_MAP = {
+    'instock': 'In Stock',
+    'instoreonly': 'In Stock',
+    'onlineonly': 'In Stock',
+    'limitedavailability': 'In Stock',
+    'preorder': 'Pre-order',
+    'presale': 'Pre-order',
+    'backorder': 'Back Order',
+    'outofstock': 'Out of Stock',
+    'soldout': 'Out of Stock',
+    'discontinued': 'Out of Stock'
+}
+
+
+def _types(node: Dict[str, Any]) -> set:
+    node_type = node.get('@type', [])
+    if isinstance(node_type, str):
+        node_type = [node_type]
+    return {str(t).split('/')[-1] for t in node_type}
+
+
+def _walk(data: Any):
+    """Yield every dict in a JSON-LD document, descending into @graph and lists"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk(item)
+    elif isinstance(data, dict):
+        yield data
+        if '@graph' in data:
+            yield from _walk(data['@graph'])
+
+
+def _first(value: Any) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _text(value: Any) -> str:
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('@value') or ''
+    if value is None:
+        return ''
+    return re.sub(r'\s+', ' ', parse_html(str(value)).get_text(' ')).strip()
+
+
+def _price(value: Any) -> Optional[float]:
+    if value in (None, ''):
+        return None
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        match = re.search(r'[\d,]+(?:\.\d+)?', str(value))
+        return float(match.group().replace(',', '')) if match else None
+
+
+def _availability(value: Any) -> str:
+    key = str(_first(value) or '').rstrip('/').split('/')[-1].lower()
+    return AVAILABILITY_MAP.get(key, '')
+
+
+def _images(value: Any) -> List[str]:
+    if not value:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+
+    images = []
+    for image in value:
+        if isinstance(image, dict):
+            image = image.get('url') or image.get('contentUrl')
+        if image and image not in images:
+            images.append(str(image))
+    return images
+
+
+def _offer(offers: Any) -> Dict[str, Any]:
+    """Pick the offer carrying a price, unwrapping AggregateOffer"""
+    offers = offers if isinstance(offers, list) else [offers]
+    for offer in offers:
+        if not isinstance(offer, dict):
+            continue
+        if 'AggregateOffer' in _types(offer):
+            price = offer.get('lowPrice') or offer.get('price')
+            if price is None and offer.get('offers'):
+                return _offer(offer['offers'])
+            return {**offer, 'price': price}
+        if offer.get('price') is not None or offer.get('priceSpecification'):
+            if offer.get('price') is None:
+                spec = _first(offer['priceSpecification']) or {}
+                return {**offer, 'price': spec.get('price'), 'priceCurrency': spec.get('priceCurrency')}
+            return offer
+    return offers[0] if offers and isinstance(offers[0], dict) else {}
+
+
+def _from_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    offer = _offer(node.get('offers') or {})
+    if not offer and node.get('hasVariant'):
+        variants = node['hasVariant'] if isinstance(node['hasVariant'], list) else [node['hasVariant']]
+        offer = _offer([v.get('offers') for v in variants if isinstance(v, dict) and v.get('offers')])
+
+    return {
+        'title': _text(node.get('name')),
+        'price': _price(offer.get('price')),
+        'currency': _text(offer.get('priceCurrency')),
+        'availability': _availability(offer.get('availability')),
+        'brand': _text(node.get('brand') or node.get('manufacturer')),
+        'reference': _text(node.get('mpn') or node.get('sku') or node.get('model')),
+        'description': _text(node.get('description')),
+        'images': _images(node.get('image'))
+    }
+
+
+def extract_json_ld(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Product fields from the first schema.org Product in JSON-LD blocks"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        raw = script.string or script.get_text()
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+
+        for node in _walk(data):
+            if _types(node) & PRODUCT_TYPES:
+                return _from_node(node)
+
+    return {}
+
+
+def _itemprop(scope, name: str):
+    for elem in scope.select(f'[itemprop~="{name}"]'):
+        # Skip properties that belong to a nested itemscope
+        if elem.find_parent(attrs={'itemscope': True}) is scope:
+            return elem
+    return None
+
+
+def _itemprop_value(elem) -> str:
+    if elem is None:
+        return ''
+    for attr in ('content', 'href', 'src'):
+        if elem.get(attr):
+            return str(elem[attr]).strip()
+    return re.sub(r'\s+', ' ', elem.get_text(' ')).strip()
+
+
+def extract_microdata(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Product fields from schema.org Product microdata"""
+    scope = soup.find(attrs={'itemtype': re.compile(r'schema\.org/(Product|ProductGroup|IndividualProduct)$')})
+    if scope is None:
+        return {}
+
+    offer_scope = scope.find(attrs={'itemprop': 'offers'}) or scope
+    brand_elem = _itemprop(scope, 'brand')
+    if brand_elem is not None and brand_elem.has_attr('itemscope'):
+        brand_elem = brand_elem.find(attrs={'itemprop': 'name'}) or brand_elem
+
+    return {
+        'title': _itemprop_value(_itemprop(scope, 'name')),
+        'price': _price(_itemprop_value(offer_scope.find(attrs={'itemprop': re.compile(r'^(price|lowPrice)$')}))),
+        'currency': _itemprop_value(offer_scope.find(attrs={'itemprop': 'priceCurrency'})),
+        'availability': _availability(_itemprop_value(offer_scope.find(attrs={'itemprop': 'availability'}))),
+        'brand': _itemprop_value(brand_elem),
+        'reference': _itemprop_value(_itemprop(scope, 'mpn') or _itemprop(scope, 'sku')),
+        'description': _itemprop_value(_itemprop(scope, 'description')),
+        'images': _images([_itemprop_value(img) for img in scope.find_all(attrs={'itemprop': 'image'})])
+    }
+
+
+def extract_structured_product(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Merge JSON-LD and microdata Product fields, JSON-LD taking precedence"""
+    product = extract_json_ld(soup)
+
+    if not product or not all(product.get(field) for field in ('title', 'price')):
+        for field, value in extract_microdata(soup).items():
+            if value and not product.get(field):
+                product[field] = value
+
+    return {field: value for field, value in product.items() if value}
@@ -0,0 +1,180 @@
+"""
+Precompiled, memoized price and watch-detail extraction shared by every scraper
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from utils.reference_catalog import resolve_reference
+from utils.vocabulary import match_vocabulary
+
+PRICE_NOISE = re.compile(r'[£$€,\s]')
+PRICE_NUMBER = re.compile(r'(\d+(?:\.\d{2})?)')
+YEAR = re.compile(r'\b(19|20)\d{2}\b')
+
+# Fallbacks for references the catalog does not know, tried in order; the first that matches wins.
+# The label must be a whole word so "reference" is never read as "ref" followed by "erence".
+REFERENCE_PATTERNS = [
+    re.compile(r'\bref(?:erence)?\b[:\.\s#]*(\w*\d\w*)'),
+    re.compile(r'\b(\d{4,6}[a-zA-Z]*)\b')
+]
+
+DETAIL_FIELDS = [
+    'brand', 'model', 'reference', 'year', 'condition',
+    'dial_color', 'bracelet_material', 'case_material', 'movement'
+]
+
+
+class MemoizedExtractor:
+    """Bounded LRU memo around an extraction function, with hit and latency counters"""
+
+    def __init__(self, function: Callable, maxsize: int = 4096):
+        self.function = function
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def __call__(self, *key):
+        start = time.perf_counter()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                value = self._cache[key]
+                self.hits += 1
+                self.hit_seconds += time.perf_counter() - start
+                return value
+
+        value = self.function(*key)
+        with self._lock:
+            self._cache[key] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            self.misses += 1
+            self.miss_seconds += time.perf_counter() - start
+        return value
+
+    def counters(self) -> Tuple[int, int, float, float]:
+        """Raw (hits, misses, hit seconds, miss seconds), for diffing around work done in another process"""
+        with self._lock:
+            return self.hits, self.misses, self.hit_seconds, self.miss_seconds
+
+    def merge_counters(self, counters: Tuple[int, int, float, float]):
+        """Add counters collected by the same memo in a worker process"""
+        hits, misses, hit_seconds, miss_seconds = counters
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.hit_seconds += hit_seconds
+            self.miss_seconds += miss_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = self.hits + self.misses
+            return {
+                'calls': calls,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / calls, 3) if calls else 0.0,
+                'entries': len(self._cache),
+                'avg_hit_us': round(self.hit_seconds / self.hits * 1e6, 1) if self.hits else 0.0,
+                'avg_miss_us': round(self.miss_seconds / self.misses * 1e6, 1) if self.misses else 0.0
+            }
+
+
+def normalize_whitespace(text: str) -> str:
+    if not text:
+        return ""
+    return ' '.join(text.split())
+
+
+def _parse_price(price_text: str) -> Optional[float]:
+    # Remove currency symbols and clean text
+    price_match = PRICE_NUMBER.search(PRICE_NOISE.sub('', price_text.strip()))
+    if price_match:
+        try:
+            return float(price_match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_details(title: str, description: str) -> Tuple[Tuple[str, str], ...]:
+    details = dict.fromkeys(DETAIL_FIELDS, '')
+    text = f"{title} {description}".lower()
+
+    # Brand, model, condition, dial colour, materials and movement in one pass over the text
+    details.update(match_vocabulary(text))
+
+    # A known reference of the brand named in the text (or a distinctive one when none is named)
+    # settles model family and case material in one trie walk
+    resolved = resolve_reference(text, details['brand'] or None)
+    if resolved:
+        details['reference'] = resolved['reference']
+        details['brand'] = resolved['brand']
+        details['model'] = resolved['model']
+        if resolved['case_material'] and not details['case_material']:
+            details['case_material'] = resolved['case_material']
+    else:
+        for pattern in REFERENCE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                details['reference'] = match.group(1).upper()
+                break
+
+    year_match = YEAR.search(text)
+    if year_match:
+        details['year'] = year_match.group(0)
+
+    # Cached as an immutable tuple so callers can never edit a shared entry
+    return tuple(details.items())
+
+
+_price_memo = MemoizedExtractor(_parse_price, maxsize=8192)
+_details_memo = MemoizedExtractor(_parse_details, maxsize=4096)
+
+
+def extract_price(price_text: str) -> Optional[float]:
+    """Numerical price from text such as '£12,450.00'"""
+    if not price_text:
+        return None
+    return _price_memo(price_text)
+
+
+def extract_watch_details(title: str, description: str = "") -> Dict[str, str]:
+    """Brand, model, reference, year, condition, dial colour, materials and movement"""
+    return dict(_details_memo(title or '', description or ''))
+
+
+def extract_many(texts: Iterable[Union[str, Tuple[str, str]]]) -> List[Dict[str, str]]:
+    """Details for many titles or (title, description) pairs; repeated inputs are parsed once"""
+    results = []
+    for text in texts:
+        title, description = (text, '') if isinstance(text, str) else text
+        results.append(extract_watch_details(title, description))
+    return results
+
+
+def normalization_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit rate and per-call latency of the price and detail memos, including merged parse-worker calls"""
+    return {'price': _price_memo.stats(), 'details': _details_memo.stats()}
+
+
+def normalization_counters() -> Dict[str, Tuple[int, int, float, float]]:
+    """Raw counters of both memos in this process"""
+    return {'price': _price_memo.counters(), 'details': _details_memo.counters()}
+
+
+def merge_normalization_counters(counters: Dict[str, Tuple[int, int, float, float]]):
+    """Fold counters reported by a parse worker into this process's memo stats"""
+    _price_memo.merge_counters(counters['price'])
+    _details_memo.merge_counters(counters['details'])
@@ -0,0 +1,70 @@
+"""
+Canonical product URLs and the stable listing IDs derived from them
+"""
+
+import hashlib
+import re
+from typing import Iterable, Iterator, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Shopify serves the same product under every collection it belongs to
+COLLECTION_PREFIX = re.compile(r'^/collections/[^/]+(?=/products/)')
+REPEATED_SLASHES = re.compile(r'/{2,}')
+
+# Tracking and search-position parameters that never change the page
+NOISE_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'srsltid',
+                '_pos', '_sid', '_ss', '_psq', '_fid', '_v'}
+
+
+def _is_noise(param: str) -> bool:
+    return param.lower().startswith('utm_') or param.lower() in NOISE_PARAMS
+
+
+def canonical_url(url: str) -> str:
+    """URL with lower-case scheme and host, no collection prefix, tracking params, fragment or trailing slash"""
+    parts = urlsplit(str(url).strip())
+    path = COLLECTION_PREFIX.sub('', REPEATED_SLASHES.sub('/', parts.path)).rstrip('/')
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if not _is_noise(key)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def listing_id(url: str) -> str:
+    """Stable ID for the canonical URL, ignoring only the scheme and www; real query parameters still count"""
+    parts = urlsplit(canonical_url(url))
+    host = parts.netloc
+    if host.startswith('www.'):
+        host = host[4:]
+    key = f"{host}{parts.path}?{parts.query}" if parts.query else f"{host}{parts.path}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+class CanonicalLinks:
+    """Canonical URLs in discovery order, deduplicated on listing ID with a set"""
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self.urls: List[str] = []
+        self._ids = set()
+        self.update(urls)
+
+    def add(self, url: str) -> bool:
+        """Keep the URL unless an equivalent one was already seen; True if it was new"""
+        key = listing_id(url)
+        if key in self._ids:
+            return False
+        self._ids.add(key)
+        self.urls.append(canonical_url(url))
+        return True
+
+    def update(self, urls: Iterable[str]):
+        for url in urls:
+            self.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        return listing_id(url) in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.urls)
+
+    def __len__(self) -> int:
+        return len(self.urls)
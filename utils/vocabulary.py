@@ -0,0 +1,216 @@
+"""
+Shared watch vocabulary matched in one pass per text with an Aho-Corasick automaton
+"""
+
+from collections import deque, namedtuple
+from typing import Dict, List, Optional
+
+VocabularyHit = namedtuple('VocabularyHit', ['start', 'end', 'category', 'value'])
+
+# category -> canonical value -> lower-case spellings found in listings
+VOCABULARY = {
+    'brand': {
+        'Rolex': ['rolex'],
+        'Omega': ['omega'],
+        'Patek Philippe': ['patek philippe', 'patek'],
+        'Audemars Piguet': ['audemars piguet', 'audemars'],
+        'Cartier': ['cartier'],
+        'Breitling': ['breitling'],
+        'TAG Heuer': ['tag heuer', 'tag-heuer', 'heuer'],
+        'Tudor': ['tudor'],
+        'Seiko': ['seiko'],
+        'Grand Seiko': ['grand seiko'],
+        'Tissot': ['tissot'],
+        'Hamilton': ['hamilton'],
+        'Hublot': ['hublot'],
+        'Panerai': ['panerai', 'officine panerai'],
+        'IWC': ['iwc', 'iwc schaffhausen'],
+        'Jaeger-LeCoultre': ['jaeger-lecoultre', 'jaeger lecoultre', 'jaeger le coultre', 'jlc'],
+        'Vacheron Constantin': ['vacheron constantin', 'vacheron'],
+        'A. Lange & Söhne': ['a. lange & söhne', 'a. lange & sohne', 'a. lange', 'a lange', 'lange & söhne',
+                             'lange & sohne', 'lange'],
+        'Richard Mille': ['richard mille'],
+        'Chopard': ['chopard'],
+        'Longines': ['longines'],
+        'Zenith': ['zenith'],
+        'Breguet': ['breguet'],
+        'Blancpain': ['blancpain'],
+        'Bell & Ross': ['bell & ross', 'bell and ross']
+    },
+    'model': {
+        'Submariner': ['submariner'],
+        'Daytona': ['daytona', 'cosmograph daytona'],
+        'GMT-Master II': ['gmt-master ii', 'gmt master ii', 'gmt-master', 'gmt master'],
+        'Datejust': ['datejust'],
+        'Day-Date': ['day-date', 'day date'],
+        'Explorer': ['explorer'],
+        'Sea-Dweller': ['sea-dweller', 'sea dweller'],
+        'Sky-Dweller': ['sky-dweller', 'sky dweller'],
+        'Yacht-Master': ['yacht-master', 'yacht master'],
+        'Oyster Perpetual': ['oyster perpetual'],
+        'Milgauss': ['milgauss'],
+        'Speedmaster': ['speedmaster', 'moonwatch'],
+        'Seamaster': ['seamaster'],
+        'Constellation': ['constellation'],
+        'Nautilus': ['nautilus'],
+        'Aquanaut': ['aquanaut'],
+        'Calatrava': ['calatrava'],
+        'Royal Oak': ['royal oak'],
+        'Royal Oak Offshore': ['royal oak offshore'],
+        'Santos': ['santos'],
+        'Tank': ['tank'],
+        'Ballon Bleu': ['ballon bleu'],
+        'Navitimer': ['navitimer'],
+        'Superocean': ['superocean'],
+        'Chronomat': ['chronomat'],
+        'Carrera': ['carrera'],
+        'Monaco': ['monaco'],
+        'Aquaracer': ['aquaracer'],
+        'Black Bay': ['black bay'],
+        'Pelagos': ['pelagos'],
+        'Luminor': ['luminor'],
+        'Radiomir': ['radiomir'],
+        'Big Bang': ['big bang'],
+        'Reverso': ['reverso']
+    },
+    # Grades only count in condition phrasing; bare "new" or "good" turns up in "new strap", "New York"
+    'condition': {
+        'New': ['brand new', 'condition: new', 'condition new', 'new condition'],
+        'Unworn': ['unworn'],
+        **{grade.title(): [f'condition: {grade}', f'condition {grade}', f'{grade} condition'] for grade in [
+            'excellent', 'very good', 'good', 'fair', 'poor'
+        ]}
+    },
+    'dial_color': {
+        color.title(): [f'{color} dial'] for color in [
+            'black', 'blue', 'white', 'silver', 'green', 'grey', 'champagne', 'brown', 'red', 'pink',
+            'yellow', 'salmon', 'slate', 'ice blue', 'turquoise', 'purple', 'orange', 'meteorite', 'panda'
+        ]
+    },
+    'case_material': {
+        'Stainless Steel': ['stainless steel', 'steel', 'oystersteel'],
+        'Yellow Gold': ['yellow gold', '18k yellow gold'],
+        'White Gold': ['white gold', '18k white gold'],
+        'Rose Gold': ['rose gold', 'everose', 'everose gold', 'pink gold', 'red gold'],
+        'Two-Tone': ['two-tone', 'two tone', 'bi-colour', 'bicolour', 'rolesor'],
+        'Titanium': ['titanium'],
+        'Platinum': ['platinum'],
+        'Ceramic': ['ceramic'],
+        'Bronze': ['bronze'],
+        'Carbon': ['carbon', 'forged carbon']
+    },
+    'bracelet_material': {
+        'Oyster Bracelet': ['oyster bracelet'],
+        'Jubilee Bracelet': ['jubilee bracelet', 'jubilee'],
+        'President Bracelet': ['president bracelet'],
+        'Steel Bracelet': ['steel bracelet', 'stainless steel bracelet'],
+        'Gold Bracelet': ['gold bracelet'],
+        'Titanium Bracelet': ['titanium bracelet'],
+        'Leather Strap': ['leather strap', 'alligator strap', 'crocodile strap'],
+        'Rubber Strap': ['rubber strap', 'oysterflex'],
+        'NATO Strap': ['nato strap'],
+        'Fabric Strap': ['fabric strap', 'textile strap', 'canvas strap']
+    },
+    'movement': {
+        'Automatic': ['automatic', 'self-winding', 'self winding'],
+        'Manual': ['manual wind', 'manual winding', 'manual-wind', 'hand-wound', 'hand wound'],
+        'Quartz': ['quartz'],
+        'Spring Drive': ['spring drive'],
+        'Solar': ['solar'],
+        'Kinetic': ['kinetic']
+    }
+}
+
+
+class VocabularyMatcher:
+    """Aho-Corasick automaton over every spelling; finds all hits in one linear scan"""
+
+    def __init__(self, vocabulary: Dict[str, Dict[str, List[str]]]):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self.aliases = {}
+
+        for category, values in vocabulary.items():
+            for value, spellings in values.items():
+                for spelling in spellings:
+                    self._add(spelling.lower(), category, value)
+                    self.aliases.setdefault(category, {})[spelling.lower()] = value
+        self._build_failure_links()
+
+    def _add(self, spelling: str, category: str, value: str):
+        node = 0
+        for char in spelling:
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node].append((len(spelling), category, value))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> List[VocabularyHit]:
+        """Whole-word hits, keeping the longest where spellings overlap, in text order"""
+        text = text.lower()
+        hits = []
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, category, value in self._output[node]:
+                start = position + 1 - length
+                before = text[start - 1] if start > 0 else ' '
+                after = text[position + 1] if position + 1 < len(text) else ' '
+                if not before.isalnum() and not after.isalnum():
+                    hits.append(VocabularyHit(start, position + 1, category, value))
+
+        # Leftmost-longest within each category: "grand seiko" beats "seiko", "royal oak offshore" beats
+        # "royal oak", but "stainless steel bracelet" still yields both a bracelet and a case material
+        hits.sort(key=lambda hit: (hit.start, -(hit.end - hit.start)))
+        kept = []
+        covered = {}
+        for hit in hits:
+            if hit.start >= covered.get(hit.category, 0):
+                kept.append(hit)
+                covered[hit.category] = hit.end
+        return kept
+
+    def extract(self, text: str) -> Dict[str, str]:
+        """First hit per category"""
+        found = {}
+        for hit in self.find_all(text):
+            found.setdefault(hit.category, hit.value)
+        return found
+
+    def canonical(self, category: str, value) -> Optional[str]:
+        """Canonical value for an exact spelling, e.g. 'tag heuer' -> 'TAG Heuer'"""
+        return self.aliases.get(category, {}).get(str(value).strip().lower())
+
+
+# Built once at import and shared by every scraper and processor
+MATCHER = VocabularyMatcher(VOCABULARY)
+
+
+def match_vocabulary(text: str) -> Dict[str, str]:
+    """Brand, model, condition, dial colour, materials and movement found in the text"""
+    return MATCHER.extract(text or '')
+
+
+def find_brand(text: str) -> Optional[str]:
+    for hit in MATCHER.find_all(text or ''):
+        if hit.category == 'brand':
+            return hit.value
+    return None
@@ -0,0 +1,186 @@
+"""
+Fast path for WooCommerce stores via the public Store API
+"""
+
+import html
+import math
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from utils.async_fetcher import AsyncFetcher
+from utils.html_parser import parse_html
+
+
+class WooCommerceAdapter:
+    """Bulk-read /wp-json/wc/store/v1/products and map it into the scraper product schema"""
+
+    platform = 'woocommerce'
+    PAGE_SIZE = 100
+
+    # Fields worth a product page visit when the API leaves them empty
+    PAGE_FALLBACK_FIELDS = ['price', 'description', 'images']
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.base_url = scraper.base_url.rstrip('/')
+
+    def _api_url(self, page: int, per_page: int = None, category: str = None) -> str:
+        url = f"{self.base_url}/wp-json/wc/store/v1/products?per_page={per_page or self.PAGE_SIZE}&page={page}"
+        if category:
+            url += f"&category={category}"
+        return url
+
+    def _json(self, response) -> Optional[Any]:
+        if response is None:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def detect(self) -> bool:
+        """Check whether the site exposes the WooCommerce Store API"""
+        data = self._json(self.scraper.fetch(self._api_url(1, per_page=1), log_errors=False))
+        return isinstance(data, list)
+
+    def category_slugs(self, category_urls: List[str]) -> List[Optional[str]]:
+        """Category slugs from /product-category/.../<slug>/ URLs, or [None] for the whole catalog"""
+        slugs = []
+        for url in category_urls:
+            parts = [part for part in urlparse(url).path.split('/') if part]
+            if 'product-category' in parts and parts[-1] != 'product-category':
+                if parts[-1] not in slugs:
+                    slugs.append(parts[-1])
+        return slugs or [None]
+
+    def fetch_products(self, category: Optional[str], max_products: int) -> List[Dict[str, Any]]:
+        """Read the first page, then fetch the remaining pages concurrently"""
+        first = self.scraper.fetch(self._api_url(1, category=category), log_errors=False)
+        products = self._json(first)
+        if not isinstance(products, list):
+            return []
+
+        total_pages = int(first.headers.get('X-WP-TotalPages', 1) or 1)
+        needed_pages = min(total_pages, math.ceil(max_products / self.PAGE_SIZE))
+
+        if needed_pages > 1:
+            page_urls = [self._api_url(page, category=category) for page in range(2, needed_pages + 1)]
+            fetcher = AsyncFetcher(
+                self.scraper.fetch,
+                max_in_flight_per_host=self.scraper.concurrency.max_for(self.base_url)
+            )
+            responses = fetcher.fetch_all(page_urls)
+            for url in page_urls:
+                page_products = self._json(responses.get(url))
+                if isinstance(page_products, list):
+                    products.extend(page_products)
+
+        return products
+
+    def _text(self, markup: str) -> str:
+        if not markup:
+            return ''
+        return self.scraper.clean_text(parse_html(markup).get_text(' '))
+
+    def to_product_data(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert one Store API product into the scraper's product_data dict"""
+        prices = raw.get('prices') or {}
+        price = None
+        if prices.get('price'):
+            price = int(prices['price']) / (10 ** int(prices.get('currency_minor_unit', 2)))
+
+        title = self.scraper.clean_text(html.unescape(raw.get('name', '')))
+        description = ' '.join(
+            part for part in (self._text(raw.get('short_description')), self._text(raw.get('description'))) if part
+        )
+
+        specifications = {}
+        for attribute in raw.get('attributes', []):
+            terms = ', '.join(term.get('name', '') for term in attribute.get('terms', []))
+            specifications[attribute.get('name', '').lower()] = terms
+
+        product_data = {
+            'url': raw.get('permalink', ''),
+            'site': self.scraper.site_name,
+            'title': title,
+            'price': price or None,
+            'currency': prices.get('currency_code') or 'GBP',
+            'brand': '',
+            'model': '',
+            'reference': '',
+            'condition': '',
+            'description': description,
+            'images': [img['src'] for img in raw.get('images', []) if img.get('src')],
+            'availability': 'In Stock' if raw.get('is_in_stock') else 'Out of Stock',
+            'specifications': specifications
+        }
+
+        product_data.update(self.scraper.extract_watch_details(title, description))
+
+        # Attribute rows map to standard fields the same way the HTML scrapers do
+        for label, value in specifications.items():
+            if 'reference' in label or 'model' in label:
+                product_data['reference'] = value
+            elif 'condition' in label:
+                product_data['condition'] = value
+
+        if not product_data['reference'] and raw.get('sku'):
+            product_data['reference'] = str(raw['sku']).upper()
+
+        if price is None:
+            product_data['availability'] = 'Contact for Price'
+
+        return product_data
+
+    def fill_missing_from_pages(self, products: List[Dict[str, Any]]):
+        """Fetch product pages only for products the API left incomplete"""
+        incomplete = [
+            product for product in products
+            if product['url'] and any(not product.get(field) for field in self.PAGE_FALLBACK_FIELDS)
+        ]
+        if not incomplete:
+            return
+
+        urls = [product['url'] for product in incomplete]
+        added = [url for url in urls if url not in self.scraper._prefetched]
+        self.scraper.prefetch_pages(urls)
+
+        for product in incomplete:
+            # A page that fails to parse keeps the API data rather than sinking the whole API result
+            try:
+                page_data = self.scraper.scrape_product(product['url']) or {}
+            except Exception as e:
+                self.scraper.logger.warning(f"Could not fill {product['url']} from its page: {str(e)}")
+                continue
+
+            for field in self.PAGE_FALLBACK_FIELDS:
+                if not product.get(field) and page_data.get(field):
+                    product[field] = page_data[field]
+
+            if product['price'] and product['availability'] == 'Contact for Price':
+                product['availability'] = page_data.get('availability') or 'In Stock'
+
+        # Release only the pages prefetched here; other callers' prefetches stay buffered
+        for url in added:
+            self.scraper._prefetched.pop(url, None)
+
+    def scrape(self, category_urls: List[str], max_products: int = 100) -> List[Dict[str, Any]]:
+        """Scrape every category behind the category URLs, deduplicated by product id"""
+        seen = set()
+        results = []
+
+        for category in self.category_slugs(category_urls):
+            for raw in self.fetch_products(category, max_products - len(results)):
+                if raw.get('id') in seen:
+                    continue
+                seen.add(raw.get('id'))
+                product_data = self.to_product_data(raw)
+                if product_data['title']:
+                    results.append(product_data)
+
+            if len(results) >= max_products:
+                break
+
+        results = results[:max_products]
+        self.fill_missing_from_pages(results)
+        return results
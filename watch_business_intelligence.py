@@ -7,19 +7,21 @@ Complete Watch Business Intelligence Platform
 """
 
 import requests
-from bs4 import BeautifulSoup
 import csv
 import json
-import time
-import random
 from urllib.parse import urljoin, urlparse, quote_plus
 import os
 from datetime import datetime
 import re
 
+from utils.html_parser import parse_html
+from utils.rate_limiter import get_rate_limiter
+from utils.vocabulary import find_brand
+
 class WatchBusinessIntelligence:
     def __init__(self):
         self.session = requests.Session()
+        self.rate_limiter = get_rate_limiter()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -193,10 +195,11 @@ class WatchBusinessIntelligence:
             search_query = f"{product['brand']} {product['model']}".strip()
             search_url = f"https://www.chrono24.com/search/index.htm?query={quote_plus(search_query)}"
             
+            self.rate_limiter.acquire(search_url)
             response = self.session.get(search_url, timeout=30)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response.content, 'product')
                 
                 # Find price elements (Chrono24 specific selectors)
                 price_elements = soup.find_all(['span', 'div'], class_=re.compile(r'.*price.*', re.I))
@@ -221,8 +224,6 @@ class WatchBusinessIntelligence:
                         'search_url': search_url
                     }
             
-            time.sleep(random.uniform(2, 4))  # Rate limiting
-            
         except Exception as e:
             print(f"❌ Chrono24 error for {product['name']}: {e}")
         
@@ -234,10 +235,11 @@ class WatchBusinessIntelligence:
             search_query = f"{product['brand']} {product['model']} watch"
             search_url = f"https://www.google.com/search?tbm=shop&q={quote_plus(search_query)}"
             
+            self.rate_limiter.acquire(search_url)
             response = self.session.get(search_url, timeout=30)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = parse_html(response.content)
                 
                 # Google Shopping price selectors
                 price_elements = soup.find_all(['span', 'div'], text=re.compile(r'[£$€]\d+'))
@@ -262,8 +264,6 @@ class WatchBusinessIntelligence:
                         'search_url': search_url
                     }
             
-            time.sleep(random.uniform(2, 4))  # Rate limiting
-            
         except Exception as e:
             print(f"❌ Google Shopping error for {product['name']}: {e}")
         
@@ -316,7 +316,6 @@ class WatchBusinessIntelligence:
         for scraper in scrapers:
             try:
                 scraper()
-                time.sleep(random.uniform(3, 6))
             except Exception as e:
                 print(f"❌ Scraper failed: {e}")
                 continue
@@ -455,17 +454,16 @@ class WatchBusinessIntelligence:
         
         for url in urls:
             try:
+                self.rate_limiter.acquire(url)
                 response = self.session.get(url, timeout=30)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = parse_html(response.content, 'product')
                     products = soup.find_all('div', class_='product-card')
                     
                     for product in products[:20]:
                         product_data = self.extract_product_data(product, 'ChronoFinder', url)
                         if product_data:
                             self.competitor_products.append(product_data)
-                            
-                time.sleep(random.uniform(2, 4))
             except Exception as e:
                 print(f"❌ ChronoFinder error: {e}")
     
@@ -526,14 +524,7 @@ class WatchBusinessIntelligence:
     
     def extract_brand(self, title):
         """Extract brand name from title"""
-        brands = ['Rolex', 'Omega', 'Patek Philippe', 'Audemars Piguet', 'Cartier', 
-                 'Breitling', 'TAG Heuer', 'Hublot', 'Panerai', 'IWC', 'Jaeger-LeCoultre']
-        
-        title_upper = title.upper()
-        for brand in brands:
-            if brand.upper() in title_upper:
-                return brand
-        return 'Unknown'
+        return find_brand(title) or 'Unknown'
     
     def extract_model(self, title):
         """Extract model name from title"""